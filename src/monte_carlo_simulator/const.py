@@ -59,4 +59,85 @@ MARKET_INDEXES = {
     'DAX' : '^GDAXI',
     'IBEX' : 'IBEX',
     'EGX 30' : '^CASE 30'
-    } 
\ No newline at end of file
+    } 
+
+# Methods of calculating the expected returns of an asset (see calc_exp_returns)
+EXP_RETURN_METHODS = (
+    'Capital Asset Pricing Model',
+    'Dividend Discount Model',
+    'Simple Average Returns',
+    'Exponential Weighted Average Returns'
+    )
+
+# Percentiles drawn as confidence bands around the mean of simulated prices;
+# approximately 2 and 1 standard deviations below and above the mean
+BAND_PERCENTILES = (2.275, 15.8665, 84.134, 97.725)
+
+# The number of price paths generated at once by the streaming simulation
+# engine. Peak memory use is bounded by chunk size * number of time steps
+DEFAULT_CHUNK_SIZE = 1000
+
+# The number of price paths drawn from each independent random stream. Fixed so
+# that results for a given seed do not depend on chunk sizes or worker counts
+RNG_BLOCK_SIZE = 1000
+
+# The most threads used by the threaded simulation engine when the GIL is enabled,
+# where threads only run NumPy's array loops in parallel. Free-threaded builds of
+# Python use one thread per CPU
+GIL_THREAD_LIMIT = 4
+
+# Adaptive simulation defaults: the target relative standard error of the mean and
+# band percentiles, and the most price paths simulated before stopping
+DEFAULT_TOLERANCE = 0.005
+MAX_SIMULATIONS = 100000
+
+# Floating point types simulated paths can be stored in. float32 halves memory use;
+# statistics are accumulated in float64, and a float32 run's mean, band percentiles
+# and terminal statistics stay within FLOAT32_RTOL (relative) of a float64 run with
+# the same seed
+SIM_DTYPES = ('float32', 'float64')
+FLOAT32_RTOL = 1e-4
+
+# The default memory budget of a simulation, in bytes. Simulations whose paths do not
+# fit are streamed in chunks, or written to disk when every path is needed
+MEMORY_BUDGET = 2**30
+
+# Simulation outputs the memory planner can plan for: confidence bands, every price
+# path (e.g., to plot), and terminal prices only
+SIM_OUTPUTS = ('bands', 'paths', 'terminal')
+
+# The number of equal-width bins of probability integral transform histograms
+PIT_BINS = 10
+
+# Walk-forward scores a window search can minimize: the mean CRPS, the mean pinball
+# loss at the band percentiles, and the mean distance of band coverage from nominal
+WINDOW_SEARCH_METRICS = ('crps', 'pinball', 'coverage')
+
+# The most simulated paths charted by the backtest visualization; paths stored on
+# disk are sampled down to this number
+BACKTEST_PLOT_PATHS = 1000
+
+# The relative error bound of the streaming quantile sketch that estimates confidence
+# bands from chunks of price paths
+SKETCH_RELATIVE_ACCURACY = 1e-3
+
+# The number of standardized Brownian Motion matrices kept by a Simulator for reruns
+# with the same seed and dimensions; least recently used matrices are dropped first
+BROWNIAN_CACHE_SIZE = 4
+
+# Simulation time step sizes, in trading days per step. Geometric Brownian Motion
+# increments are sampled exactly over any step, so coarser steps lower the resolution
+# of the paths without changing the distribution of prices at each step. An integer
+# number of trading days per step may also be used
+STEP_GRANULARITIES = {
+    'daily': 1,
+    'weekly': 5,
+    'monthly': 21
+    }
+
+# Time axis labels of the simulation chart for each step size
+STEP_AXIS_LABELS = {
+    'daily': 'Trading Days',
+    'weekly': 'Trading Weeks',
+    'monthly': 'Trading Months'
+    }
@@ -2,6 +2,7 @@
 from tkinter import ttk
 
 from monte_carlo_simulator.gui.inter.observer_inter import Observer
+from monte_carlo_simulator.service.engine import ConvergenceReport, ForecastScores, SimulationResult
 
 
 class AssumptionsFrame(ttk.Labelframe, Observer):
@@ -61,6 +62,24 @@ class AssumptionsFrame(ttk.Labelframe, Observer):
             text=''
             )
 
+        # Create label to show the simulations used by an adaptive run
+        self.convergence_label = ttk.Label(
+            self,
+            text=''
+            )
+
+        # Create label to show the simulated terminal price distribution
+        self.terminal_stats_label = ttk.Label(
+            self,
+            text=''
+            )
+
+        # Create label to show how well the latest backtest's forecasts scored
+        self.forecast_scores_label = ttk.Label(
+            self,
+            text=''
+            )
+
         # Position contents on the assumptions_frame grid
         self.beta_label.grid(
             row=0, column=0, padx=15, pady=5, sticky='e')
@@ -74,12 +93,46 @@ class AssumptionsFrame(ttk.Labelframe, Observer):
             row=2, column=0, padx=15, pady=5, sticky='e')
         self.div_growth_label.grid(
             row=2, column=1, padx=15, pady=5, sticky='e')
+        self.convergence_label.grid(
+            row=3, column=0, columnspan=2, padx=15, pady=5, sticky='e')
+        self.terminal_stats_label.grid(
+            row=4, column=0, columnspan=2, padx=15, pady=5, sticky='e')
+        self.forecast_scores_label.grid(
+            row=5, column=0, columnspan=2, padx=15, pady=5, sticky='e')
     
     def update(self, subject):
         """
         Configures assumption frame's output labels; 
         displays key model assumptions to user.
         """
+        # Show how many simulations an adaptive run needed and the error achieved
+        if isinstance(subject.convergence_report, ConvergenceReport):
+            self.convergence_label.config(
+                text=f'Simulations used: {subject.convergence_report.n_paths} '
+                    f'(standard error: {subject.convergence_report.max_error * 100: .3f}%)')
+        else:
+            self.convergence_label.config(text='')
+
+        # Show terminal statistics of runs that kept every path, shared with the result's 
+        # other consumers
+        if isinstance(subject.simulation_result, SimulationResult) and subject.simulation_result.has_paths:
+            terminal_stats = subject.simulation_result.terminal_stats
+            self.terminal_stats_label.config(
+                text=f'Expected terminal price: {terminal_stats["expected_price"]: .2f} '
+                    f'(probability of loss: {terminal_stats["prob_loss"] * 100: .2f}%)')
+        else:
+            self.terminal_stats_label.config(text='')
+
+        # Show the share of actual prices within each band of the latest backtest
+        if isinstance(subject.forecast_scores, ForecastScores):
+            coverage = ', '.join(
+                f'{band:.2f}% band: {rate * 100:.1f}%' for band, rate in subject.forecast_scores.coverage_rates.items())
+            crps = subject.forecast_scores.mean_crps
+            self.forecast_scores_label.config(
+                text=f'Backtest coverage: {coverage}' + (f' (CRPS: {crps:.3f})' if crps is not None else ''))
+        else:
+            self.forecast_scores_label.config(text='')
+
         # Check that expected returns have been calculated
         if subject.financial_asset.his_vol != None and subject.financial_asset.expected_returns != None:
 
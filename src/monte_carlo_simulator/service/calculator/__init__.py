@@ -1,8 +1,12 @@
 
 from .asset_calculator import capm_returns, ddm_returns, calc_beta, \
-    average_returns, exponential_weighted_average, calc_div_growth_rate, calc_exp_returns
+    average_returns, exponential_weighted_average, calc_div_growth_rate, calc_exp_returns, \
+    calc_rolling_exp_returns
 from .market_calculator import calc_market_returns, calc_daily_market_returns, \
-    calc_rfr, calc_daily_rfr, calc_volatility
+    calc_rfr, calc_daily_rfr, calc_volatility, calc_volatilities, calc_rolling_volatility
+from .risk_calculator import calc_terminal_stats, calc_prob_loss
+from .score_calculator import calc_band_coverage, calc_pit, calc_pit_histogram, calc_pinball_loss, calc_crps, \
+    calc_lognormal_crps
 
 __all__ = [
     "capm_returns",
@@ -15,6 +19,17 @@ __all__ = [
     "calc_rfr",
     "calc_daily_rfr",
     "calc_volatility", 
+    "calc_volatilities",
+    "calc_rolling_volatility",
     "calc_div_growth_rate",
-    "calc_exp_returns"
+    "calc_exp_returns",
+    "calc_rolling_exp_returns",
+    "calc_terminal_stats",
+    "calc_prob_loss",
+    "calc_band_coverage",
+    "calc_pit",
+    "calc_pit_histogram",
+    "calc_pinball_loss",
+    "calc_crps",
+    "calc_lognormal_crps"
     ]
\ No newline at end of file
@@ -53,17 +53,21 @@ def calc_exp_returns(
             # selected from historic dividends
             end_date = financial_asset.asset_data.index[end_index]
             
+            # Dividends paid up to the ending date
+            his_div = financial_asset.his_div.loc[:end_date]
+
             # Fetch dividend growth rate for calculations
-            financial_asset.div_growth_rate = calc_div_growth_rate(
-                his_div=financial_asset.his_div.loc[:end_date])
+            financial_asset.div_growth_rate = calc_div_growth_rate(his_div=his_div)
             
             close_col = price_col_checker(financial_asset.asset_data) # Get correct close column label
             
-            recent_price = financial_asset.asset_data[close_col].iloc[-1, -1] # Get most recent asset price
+            # Get the most recent asset price up to the ending date
+            recent_price = financial_asset.asset_data[close_col].loc[:end_date].iloc[-1, -1]
 
             # Calculate expected returns, dividend growth rate
             annual_expected_returns = ddm_returns(
                 recent_price=recent_price,
+                his_div=his_div,
                 div_growth_rate=financial_asset.div_growth_rate)
             
         case 'Capital Asset Pricing Model': # beta calculation relies on having market data fetched       
@@ -100,6 +104,39 @@ def calc_exp_returns(
 
     return annual_expected_returns
 
+def calc_rolling_exp_returns(asset_data: pd.DataFrame, exp_ret_flag: str, returns_window: int = 150) -> pd.Series:
+    """
+    Calculates expected returns at every date of the asset data, in one vectorized
+    pass: the value at each date is the expected returns calc_exp_returns calculates
+    from the data up to and including that date. Only the methods that use asset
+    prices alone are supported.
+
+    Parameters: 
+        asset_data - a pandas.DataFrame containing historic asset data
+        exp_ret_flag - 'Simple Average Returns' or 'Exponential Weighted Average Returns'
+        returns_window - An integer representing the days used to calculate average or 
+            weighted average returns
+
+    Returns: A pandas.Series of expected returns indexed like asset_data; NaN for dates
+        with fewer than returns_window prices up to them, for simple average returns
+    """
+    # Handle possible KeyErrors for market_data with only a 'Close' column
+    close_column = price_col_checker(asset_data)
+
+    pct_returns = asset_data[close_column].iloc[:, 0].pct_change()
+
+    match exp_ret_flag:
+
+        case 'Simple Average Returns':
+            # The average of the returns between the last returns_window prices
+            return pct_returns.rolling(window=returns_window - 1).mean()
+
+        case 'Exponential Weighted Average Returns':
+            # The recursive average at each date depends only on earlier returns
+            return pct_returns.ewm(span=returns_window, adjust=False).mean()
+
+    raise ValueError(f'Rolling expected returns cannot be calculated with "{exp_ret_flag}"')
+
 def capm_returns(beta: float, market_returns: float, risk_free_rate: float) -> float:
     """
     Estimates expected return by using that capital asset pricing model (capm).
@@ -141,3 +141,84 @@ def calc_volatility(asset_data: pd.DataFrame, standev_window: int = 30) -> np.fl
 
     return his_vol
 
+def calc_volatilities(asset_data: pd.DataFrame, standev_windows: list) -> np.ndarray:
+    """
+    Determines historical asset volatility for several rolling windows at once, as
+    calc_volatility does for each window, in one pass over the asset's log returns.
+    asset_data is not modified.
+
+    Parameters: 
+        asset_data - a pd.DataFrame containing historic asset data
+        standev_windows - a list of positive integers, the windows to calculate 
+            historic volatility over
+
+    Returns: A 1-dimensional np.ndarray with the historic volatility of the most recent 
+        time period for each window, in the order of standev_windows
+    """
+    # Verify asset_data is a DataFrame
+    if not isinstance(asset_data, pd.DataFrame):
+        raise TypeError(f'Volatility calculation error: "asset_data" parameter must be a DataFrame, not {type(asset_data)}')
+
+    # Verify that every window is a positive integer
+    for standev_window in standev_windows:
+        if not isinstance(standev_window, (int, np.integer)) or isinstance(standev_window, bool):
+            raise TypeError(f'Volatility calculation error: "standev_windows" must hold positive integers, not {type(standev_window)}')
+        if standev_window <= 0:
+            raise ValueError(f'"standev_windows" must hold positive integers, not {standev_window}')
+
+    # Identify if 'Adj Close' is an available column or just 'Close'
+    close_column = price_col_checker(asset_data)
+
+    # Calculate logarithmic returns, most recent first and centred on their mean so
+    # that the running sums of squares below stay accurate
+    log_returns = np.log(asset_data[close_column].iloc[:, 0].pct_change().to_numpy() + 1)[::-1]
+    log_returns = log_returns - np.nanmean(log_returns)
+
+    # Windows longer than the data are shortened to the length of the data
+    windows = np.minimum(np.asarray(standev_windows, dtype=np.int64), len(asset_data))
+
+    # Sums and sums of squares of the most recent returns, for every window length
+    sums = np.concatenate(([0], np.cumsum(log_returns)))
+    sums_of_squares = np.concatenate(([0], np.cumsum(log_returns**2)))
+
+    # Standard deviation of each window's returns, using denominator degrees of freedom
+    # of 1; undefined for a window of one return, and for windows reaching the first
+    # price, which has no return
+    with np.errstate(divide='ignore', invalid='ignore'):
+        variances = (sums_of_squares[windows] - sums[windows]**2 / windows) / (windows - 1)
+    variances = np.where(windows > 1, np.maximum(variances, 0), np.nan)
+
+    return np.sqrt(variances) * np.sqrt(windows)
+
+def calc_rolling_volatility(asset_data: pd.DataFrame, standev_window: int = 30) -> pd.Series:
+    """
+    Determines historical asset volatility at every date of the asset data, in one
+    vectorized pass: the value at each date is the volatility calc_volatility returns
+    for the data up to and including that date. asset_data is not modified.
+
+    Parameters: 
+        asset_data - a pd.DataFrame containing historic asset data
+        standev_window - an integer representing the rolling window to calculate 
+            historic volatility 
+
+    Returns: A pd.Series of historic volatilities indexed like asset_data; NaN for dates
+        with fewer than standev_window returns before them
+    """
+    # Verify asset_data is a DataFrame
+    if not isinstance(asset_data, pd.DataFrame):
+        raise TypeError(f'Volatility calculation error: "asset_data" parameter must be a DataFrame, not {type(asset_data)}')
+
+    # Verify that window is a positive integer
+    if not isinstance(standev_window, (int, np.integer)) or isinstance(standev_window, bool):
+        raise TypeError(f'Volatility calculation error: "standev_window" parameter must be a positive integer, not {type(standev_window)}')
+    if standev_window <= 0:
+        raise ValueError(f'"standev_window" parameter must be a positive integer, not {standev_window}')
+
+    # Identify if 'Adj Close' is an available column or just 'Close'
+    close_column = price_col_checker(asset_data)
+
+    # Calculate logarithmic returns
+    log_returns = np.log(asset_data[close_column].iloc[:, 0].pct_change() + 1)
+
+    # Rolling standard deviation ending at each date, using denominator degrees of freedom of 1
+    return log_returns.rolling(window=standev_window).std(ddof=1) * np.sqrt(standev_window)
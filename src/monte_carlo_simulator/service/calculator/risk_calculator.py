@@ -0,0 +1,56 @@
+import numpy as np
+from numbers import Number
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+
+
+def calc_terminal_stats(
+        sim_data: np.ndarray,
+        initial_price: float,
+        percentiles: tuple = BAND_PERCENTILES
+        ) -> dict:
+    """
+    Calculates risk statistics of simulated prices at the end of the time horizon.
+
+    Parameters:
+        sim_data - a 1-dimensional ndarray of terminal prices, as returned by
+            Simulator.monte_carlo_sim with terminal_only=True, or an ndarray of full
+            simulation output with one row per time step (the last row is used)
+        initial_price - the starting price of the asset
+        percentiles - the percentiles of terminal prices to calculate
+
+    Returns: A dictionary with the expected terminal price ('expected_price'), a
+        dictionary of terminal price percentiles ('percentiles'), and the probability
+        that the terminal price is below the initial price ('prob_loss')
+    """
+    # Verify sim_data is a numpy array
+    if not isinstance(sim_data, np.ndarray):
+        raise TypeError(f'Terminal statistics calculation error: "sim_data" must be a numpy.ndarray, not {type(sim_data)}')
+
+    # Use the final time step of full simulation output
+    terminal_prices = sim_data[-1] if sim_data.ndim == 2 else sim_data
+
+    # The mean is accumulated in float64 for single-precision simulations
+    return {
+        'expected_price': float(terminal_prices.mean(dtype=np.float64)),
+        'percentiles': dict(zip(percentiles, np.percentile(terminal_prices, percentiles).tolist())),
+        'prob_loss': calc_prob_loss(terminal_prices, initial_price)
+        }
+
+def calc_prob_loss(terminal_prices: np.ndarray, initial_price: float) -> float:
+    """
+    Calculates the probability of a loss: the proportion of simulations ending below
+    the initial price.
+
+    Parameters:
+        terminal_prices - a 1-dimensional ndarray of simulated prices at the end of the
+            time horizon
+        initial_price - the starting price of the asset
+
+    Returns: A float between 0 and 1
+    """
+    # Verify initial_price is a number
+    if not isinstance(initial_price, Number):
+        raise TypeError(f'Probability of loss calculation error: "initial_price" must be a number, not {type(initial_price)}')
+
+    return float(np.mean(terminal_prices < initial_price))
@@ -0,0 +1,136 @@
+import numpy as np
+from scipy.stats import norm
+
+from monte_carlo_simulator.const import PIT_BINS
+
+
+def calc_band_coverage(lower: np.ndarray, upper: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """
+    Checks whether observed prices fall within forecast confidence bands.
+
+    Parameters:
+        lower - an ndarray of the lower edge of the band (e.g., the 2.275th percentile)
+        upper - an ndarray of the upper edge of the band, shaped like lower
+        observed - an ndarray of observed prices, shaped like lower
+
+    Returns: A boolean ndarray, True where the observed price is within the band
+    """
+    return (observed >= lower) & (observed <= upper)
+
+def calc_pit(samples: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """
+    Calculates the probability integral transform (PIT) of observed prices: the
+    forecast probability of a price at or below each one. PIT values of a calibrated
+    forecast are uniformly distributed between 0 and 1.
+
+    Parameters:
+        samples - an ndarray of simulated prices, with the simulations of each forecast
+            along the last axis
+        observed - an ndarray of observed prices, one per forecast
+
+    Returns: An ndarray of PIT values, one per forecast
+    """
+    # Verify samples is a numpy array
+    if not isinstance(samples, np.ndarray):
+        raise TypeError(f'PIT calculation error: "samples" must be a numpy.ndarray, not {type(samples)}')
+
+    return (samples <= np.asarray(observed)[..., np.newaxis]).mean(axis=-1)
+
+def calc_pit_histogram(pit: np.ndarray, n_bins: int = PIT_BINS) -> np.ndarray:
+    """
+    Bins PIT values into a histogram of equal-width bins between 0 and 1. A calibrated
+    forecast has a flat histogram; a U shape shows bands that are too narrow, and a
+    hump shows bands that are too wide.
+
+    Parameters:
+        pit - an ndarray of PIT values, as calculated by calc_pit; NaN values are ignored
+        n_bins - the number of bins
+
+    Returns: A 1-dimensional ndarray with the proportion of PIT values in each bin
+    """
+    pit = np.asarray(pit, dtype=np.float64).ravel()
+    pit = pit[~np.isnan(pit)]
+
+    counts, _ = np.histogram(pit, bins=n_bins, range=(0, 1))
+
+    return counts / max(pit.size, 1)
+
+def calc_pinball_loss(quantile: np.ndarray, observed: np.ndarray, percentile: float) -> np.ndarray:
+    """
+    Calculates the pinball (quantile) loss of a forecast percentile: observed prices
+    above the forecast are penalized by the percentile's probability, and those below
+    it by the rest. Its expectation is lowest for the true percentile.
+
+    Parameters:
+        quantile - an ndarray of forecast prices at the percentile
+        observed - an ndarray of observed prices, shaped like quantile
+        percentile - the percentile forecast, between 0 and 100
+
+    Returns: An ndarray of losses, shaped like quantile
+    """
+    tau = percentile / 100
+    error = np.asarray(observed, dtype=np.float64) - quantile
+
+    return np.maximum(tau * error, (tau - 1) * error)
+
+def calc_crps(samples: np.ndarray, observed: np.ndarray, is_sorted: bool = False) -> np.ndarray:
+    """
+    Calculates the continuous ranked probability score (CRPS) of simulated forecasts:
+    the distance between the forecast distribution and an observed price, in units of
+    price, where lower is better. The score of n simulations is
+
+    CRPS = mean(|X - y|) - 0.5 * mean(|X - X'|)
+
+    with the pairwise term calculated from the sorted simulations in O(n log n), as
+    sum((2i - n - 1) * X(i)) / n**2, instead of over all n**2 pairs.
+
+    Parameters:
+        samples - an ndarray of simulated prices, with the simulations of each forecast
+            along the last axis
+        observed - an ndarray of observed prices, one per forecast
+        is_sorted - if True, samples are already sorted along the last axis
+
+    Returns: An ndarray of scores, one per forecast
+    """
+    # Verify samples is a numpy array
+    if not isinstance(samples, np.ndarray):
+        raise TypeError(f'CRPS calculation error: "samples" must be a numpy.ndarray, not {type(samples)}')
+
+    if not is_sorted:
+        samples = np.sort(samples, axis=-1)
+
+    n = samples.shape[-1]
+
+    # The mean distance of the simulations from the observed price, in float64
+    observed_error = np.abs(samples - np.asarray(observed)[..., np.newaxis]).mean(axis=-1, dtype=np.float64)
+
+    # Half the mean distance between pairs of simulations, from their ranks
+    weights = 2 * np.arange(1, n + 1) - n - 1
+    spread = (samples @ weights.astype(np.float64)) / n**2
+
+    return observed_error - spread
+
+def calc_lognormal_crps(log_mean: np.ndarray, log_std: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """
+    Calculates the CRPS of log-normal forecasts in closed form, as for the exact
+    terminal distribution of Geometric Brownian Motion:
+
+    CRPS = y * (2*N(z) - 1) - 2 * e^(m + s**2/2) * (N(z - s) + N(s/sqrt(2)) - 1)
+        Where:
+            y is the observed price
+            m and s are the mean and standard deviation of the log-price
+            z = (ln(y) - m) / s
+            N is the standard normal cumulative distribution function
+
+    Parameters:
+        log_mean - an ndarray of the mean log-price of each forecast
+        log_std - an ndarray of the standard deviation of log-prices of each forecast
+        observed - an ndarray of observed prices, one per forecast
+
+    Returns: An ndarray of scores, one per forecast
+    """
+    observed = np.asarray(observed, dtype=np.float64)
+    z = (np.log(observed) - log_mean) / log_std
+
+    return observed * (2 * norm.cdf(z) - 1) \
+        - 2 * np.exp(log_mean + 0.5 * log_std**2) * (norm.cdf(z - log_std) + norm.cdf(log_std / np.sqrt(2)) - 1)
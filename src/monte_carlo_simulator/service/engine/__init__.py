@@ -0,0 +1,93 @@
+from .path_kernel import calc_days_per_step, calc_num_steps, calc_drift, calc_horizon_time, calc_time_grid, calc_log_paths, calc_price_paths, \
+    calc_terminal_prices, calc_brownian_paths, calc_log_paths_from_brownian
+from .rng import SimulationRNG, BIT_GENERATORS
+from .qmc import SobolRNG, calc_bridge_increments
+from .quantile_sketch import QuantileSketch
+from .band_summary import BandSummary, RunningBandSummary
+from .variance_reduction import VarianceReductionReport, VARIANCE_REDUCTION_METHODS, moment_match, \
+    control_variate_adjust, simulate_reduced_variance
+from .analytic_bands import calc_analytic_bands, compare_bands
+from .chunked_engine import run_chunked_simulation, run_out_of_core_simulation
+from .checkpoint_engine import calc_plot_steps, run_checkpoint_simulation
+from .parallel_engine import run_parallel_simulation
+from .thread_engine import is_gil_enabled, default_thread_count, run_threaded_simulation
+from .adaptive_engine import ConvergenceReport, run_adaptive_simulation
+from .sweep_engine import draw_terminal_brownian, calc_sweep_terminal_stats, run_parameter_sweep
+from .walk_forward_engine import calc_walk_forward_origins, run_walk_forward
+from .backends import KernelBackend, KERNEL_BACKENDS, available_backends, get_backend, benchmark_backends
+from .workspace import SimulationWorkspace
+from .path_store import PathStore
+from .brownian_cache import BrownianCache
+from .memory_planner import SimulationPlan, estimate_path_bytes, plan_simulation
+from .simulation_result import SimulationResult, calc_data_fingerprint
+from .forecast_scores import ForecastScores, calc_band_pairs, score_forecast, score_walk_forward
+from .comparison_engine import run_method_comparison
+from .window_search import RollingMoments, WindowSearchResult, calc_window_candidates, calc_search_score, \
+    run_window_search, save_best_windows, load_best_windows
+
+__all__ = [
+    "calc_days_per_step",
+    "calc_num_steps",
+    "calc_drift",
+    "calc_horizon_time",
+    "calc_time_grid",
+    "calc_log_paths",
+    "calc_price_paths",
+    "calc_terminal_prices",
+    "calc_brownian_paths",
+    "calc_log_paths_from_brownian",
+    "SimulationRNG",
+    "BIT_GENERATORS",
+    "SobolRNG",
+    "calc_bridge_increments",
+    "QuantileSketch",
+    "BandSummary",
+    "RunningBandSummary",
+    "VarianceReductionReport",
+    "VARIANCE_REDUCTION_METHODS",
+    "moment_match",
+    "control_variate_adjust",
+    "simulate_reduced_variance",
+    "calc_analytic_bands",
+    "compare_bands",
+    "run_chunked_simulation",
+    "run_out_of_core_simulation",
+    "calc_plot_steps",
+    "run_checkpoint_simulation",
+    "run_parallel_simulation",
+    "is_gil_enabled",
+    "default_thread_count",
+    "run_threaded_simulation",
+    "ConvergenceReport",
+    "run_adaptive_simulation",
+    "draw_terminal_brownian",
+    "calc_sweep_terminal_stats",
+    "run_parameter_sweep",
+    "calc_walk_forward_origins",
+    "run_walk_forward",
+    "KernelBackend",
+    "KERNEL_BACKENDS",
+    "available_backends",
+    "get_backend",
+    "benchmark_backends",
+    "SimulationWorkspace",
+    "PathStore",
+    "BrownianCache",
+    "SimulationPlan",
+    "estimate_path_bytes",
+    "plan_simulation",
+    "SimulationResult",
+    "calc_data_fingerprint",
+    "ForecastScores",
+    "calc_band_pairs",
+    "score_forecast",
+    "score_walk_forward",
+    "run_method_comparison",
+    "RollingMoments",
+    "WindowSearchResult",
+    "calc_window_candidates",
+    "calc_search_score",
+    "run_window_search",
+    "save_best_windows",
+    "load_best_windows"
+    ]
@@ -0,0 +1,131 @@
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, DEFAULT_CHUNK_SIZE, DEFAULT_TOLERANCE, MAX_SIMULATIONS
+from monte_carlo_simulator.service.engine.band_summary import BandSummary, RunningBandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+from monte_carlo_simulator.service.engine.qmc import SobolRNG
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+class ConvergenceReport:
+    """
+    Describes how far an adaptive simulation run converged.
+
+    __init__ Parameters:
+        n_paths - the number of price paths simulated
+        standard_errors - a dictionary mapping 'mean' and each band percentile to the
+            largest relative standard error over all time steps
+        tolerance - the target relative standard error
+        converged - True if every standard error met the tolerance before the path cap
+    """
+    def __init__(self, n_paths: int, standard_errors: dict, tolerance: float, converged: bool):
+        self._n_paths: int = n_paths
+        self._standard_errors: dict = standard_errors
+        self._tolerance: float = tolerance
+        self._converged: bool = converged
+
+    @property
+    def n_paths(self) -> int:
+        return self._n_paths
+
+    @property
+    def standard_errors(self) -> dict:
+        return self._standard_errors
+
+    @property
+    def max_error(self) -> float:
+        """The largest relative standard error of the mean and band percentiles"""
+        return max(self._standard_errors.values(), default=float('inf'))
+
+    @property
+    def tolerance(self) -> float:
+        return self._tolerance
+
+    @property
+    def converged(self) -> bool:
+        return self._converged
+
+
+def run_adaptive_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        tolerance: float = DEFAULT_TOLERANCE,
+        max_simulations: int = MAX_SIMULATIONS,
+        batch_size: int = DEFAULT_CHUNK_SIZE,
+        rng: SimulationRNG = None,
+        antithetic: bool = False,
+        percentiles: tuple = BAND_PERCENTILES,
+        dtype: type = np.float64
+        ) -> tuple[BandSummary, ConvergenceReport]:
+    """
+    Simulates Geometric Brownian Motion price paths in batches until the Monte Carlo
+    standard errors of the mean and of every band percentile, relative to their values,
+    are within tolerance at every time step, or max_simulations paths have been run.
+    Batches are folded into running summaries, so memory use is bounded by batch_size.
+    The standard errors assume independent paths, so antithetic pairs and Sobol' draws,
+    whose paths are correlated by design, are rejected.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        tolerance - the target relative standard error (e.g., 0.005 for 0.5%)
+        max_simulations - the most price paths to simulate
+        batch_size - the number of price paths simulated between convergence checks
+        rng - the SimulationRNG to draw from, which must not be a SobolRNG; a freshly
+            seeded one is used if None
+        antithetic - must be False; antithetic pairs (Z, -Z) are not independent paths
+        percentiles - the band percentiles to calculate and check for convergence
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+
+    Returns: A tuple of a BandSummary of the simulated prices and a ConvergenceReport
+    """
+    # Standard errors of correlated paths would overstate how far the run converged
+    if antithetic or isinstance(rng, SobolRNG):
+        raise ValueError('Adaptive simulation estimates standard errors from independent paths, so cannot use antithetic pairs or Sobol\' draws')
+
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    running_summary = RunningBandSummary(initial_price, time_grid.size)
+    standard_errors = None
+    converged = False
+
+    # Simulate batches until the statistics converge or the path cap is reached
+    while running_summary.count < max_simulations:
+        batch_start = running_summary.count
+        n_paths = min(batch_size, max_simulations - batch_start)
+
+        random_normal = rng.standard_normal(
+            batch_start, batch_start + n_paths, time_grid.size - 1, antithetic=antithetic, dtype=dtype)
+        log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal)
+        running_summary.update(log_paths, calc_price_paths(initial_price, log_paths))
+
+        # Errors cannot be estimated from a single path
+        if running_summary.count < 2:
+            continue
+
+        # The largest relative error of each statistic over the time steps
+        standard_errors = {
+            stat: float(np.max(errors))
+            for stat, errors in running_summary.standard_errors(percentiles).items()
+            }
+
+        if max(standard_errors.values()) <= tolerance:
+            converged = True
+            break
+
+    report = ConvergenceReport(
+        n_paths=running_summary.count,
+        standard_errors=standard_errors if standard_errors is not None else {},
+        tolerance=tolerance,
+        converged=converged
+        )
+
+    return running_summary.finalize(percentiles), report
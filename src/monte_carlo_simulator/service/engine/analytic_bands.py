@@ -0,0 +1,68 @@
+import numpy as np
+from scipy.stats import norm
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift
+
+
+def calc_analytic_bands(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        percentiles: tuple = BAND_PERCENTILES
+        ) -> BandSummary:
+    """
+    Calculates the mean and band percentiles of Geometric Brownian Motion prices in
+    closed form, with no random draws. At time t prices are log-normally distributed:
+
+    Mean(t) = Price(0) * e^(Return*t)
+    Percentile(t) = Price(0) * e^((Return - 0.5*Volatility**2)*t + Volatility*sqrt(t)*z)
+        Where z is the standard normal quantile of the percentile
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        percentiles - the percentiles to calculate at each time step
+
+    Returns: A BandSummary of the exact price distribution; n_paths is None because
+        no paths are simulated
+    """
+    drift = calc_drift(expected_returns, his_vol)
+
+    # Standard deviation of log-prices at each time step
+    log_std = his_vol * np.sqrt(time_grid)
+
+    return BandSummary(
+        mean=initial_price * np.exp(expected_returns * time_grid),
+        percentiles={
+            q: initial_price * np.exp(drift * time_grid + norm.ppf(q / 100) * log_std)
+            for q in percentiles
+            },
+        n_paths=None
+        )
+
+def compare_bands(band_summary: BandSummary, reference: BandSummary) -> dict:
+    """
+    Measures how far simulated bands are from reference bands, such as the exact
+    bands calculated by calc_analytic_bands.
+
+    Parameters:
+        band_summary - a BandSummary of simulated prices
+        reference - a BandSummary with the same time steps and percentiles
+
+    Returns: A dictionary mapping 'mean' and each band percentile to the largest
+        relative difference from the reference over all time steps
+    """
+    if band_summary.num_steps != reference.num_steps:
+        raise ValueError(f'Band summaries must have the same number of time steps: {band_summary.num_steps} != {reference.num_steps}')
+
+    errors = {'mean': float(np.max(np.abs(band_summary.mean / reference.mean - 1)))}
+    for q, band in reference.percentiles.items():
+        errors[q] = float(np.max(np.abs(band_summary.percentiles[q] / band - 1)))
+
+    return errors
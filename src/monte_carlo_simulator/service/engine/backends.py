@@ -0,0 +1,293 @@
+import time
+
+import numpy as np
+
+from monte_carlo_simulator.const import ANNUAL_TRADING_DAYS, BAND_PERCENTILES
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_time_grid, calc_log_paths, calc_price_paths
+
+# Optional accelerators; the NumPy backend is always available
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+
+class KernelBackend:
+    """
+    Computes the hot loops of a simulation: building Geometric Brownian Motion price
+    paths from normal draws and reducing simulated prices to band percentiles. This
+    backend uses plain NumPy; subclasses replace the loops with faster evaluators.
+    """
+    name = 'numpy'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        """Returns True if the packages this backend needs are installed"""
+        return True
+
+    def price_paths(
+            self,
+            initial_price: float,
+            drift: float,
+            his_vol: float,
+            time_grid: np.ndarray,
+            random_normal: np.ndarray,
+            out: np.ndarray = None
+            ) -> np.ndarray:
+        """
+        Builds price paths, Price(0) * e^(Drift*t + Volatility*Brownian Motion), from
+        standard normal draws.
+
+        Parameters:
+            initial_price - the starting price of the asset
+            drift - the stochastic drift, expected returns - 0.5 * volatility**2
+            his_vol - a floating point number representing the asset's volatility
+            time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+            random_normal - an ndarray of standard normal draws with one row per path and
+                one column per time increment (len(time_grid) - 1 columns)
+            out - an optional ndarray of shape (paths, len(time_grid)) to build the prices
+                in; random_normal may be the view out[:, 1:], so that the paths are built
+                in place without allocating
+
+        Returns: An ndarray of prices with shape (paths, len(time_grid))
+        """
+        log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal, out=out)
+
+        return calc_price_paths(initial_price, log_paths, out=log_paths)
+
+    def percentiles(self, sim_data: np.ndarray, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        """
+        Calculates percentiles of simulated prices at each time step, using linear
+        interpolation between the closest ranks (as np.percentile).
+
+        Parameters:
+            sim_data - an ndarray of simulated prices with one row per time step and one
+                column per simulation, as returned by Simulator.monte_carlo_sim
+            percentiles - the percentiles to calculate
+
+        Returns: A dictionary mapping each percentile to a 1-dimensional ndarray of
+            prices, one per time step
+        """
+        return dict(zip(percentiles, np.percentile(sim_data, percentiles, axis=1)))
+
+    def band_summary(self, sim_data: np.ndarray, percentiles: tuple = BAND_PERCENTILES) -> BandSummary:
+        """
+        Summarizes simulated prices for visualization, as BandSummary.from_paths.
+
+        Parameters:
+            sim_data - an ndarray of simulated prices with one row per time step and one
+                column per simulation
+            percentiles - the percentiles to calculate at each time step
+
+        Returns: A BandSummary of the simulated prices
+        """
+        return BandSummary(
+            mean=sim_data.mean(axis=1, dtype=np.float64),
+            percentiles=self.percentiles(sim_data, percentiles),
+            n_paths=sim_data.shape[1]
+            )
+
+
+class NumexprBackend(KernelBackend):
+    """
+    Evaluates the drift, volatility and exponential of every path step in one fused,
+    multithreaded numexpr expression, in place, instead of through several full-size
+    NumPy temporaries.
+    """
+    name = 'numexpr'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return numexpr is not None
+
+    def price_paths(
+            self,
+            initial_price: float,
+            drift: float,
+            his_vol: float,
+            time_grid: np.ndarray,
+            random_normal: np.ndarray,
+            out: np.ndarray = None
+            ) -> np.ndarray:
+        # Keep every intermediate in the precision of the draws
+        dtype = random_normal.dtype
+        time_grid = time_grid.astype(dtype, copy=False)
+
+        prices = out
+        if prices is None:
+            prices = np.empty((random_normal.shape[0], time_grid.size), dtype=dtype)
+
+        # Brownian Motion, accumulated in place in the output array
+        np.multiply(random_normal, np.sqrt(np.diff(time_grid)), out=prices[:, 1:])
+        np.cumsum(prices[:, 1:], axis=1, out=prices[:, 1:])
+        prices[:, 0] = 0
+
+        # Apply drift and volatility and exponentiate in a single pass
+        numexpr.evaluate(
+            'initial_price * exp(drift * time_grid + his_vol * prices)',
+            local_dict={
+                'initial_price': dtype.type(initial_price),
+                'drift': dtype.type(drift),
+                'his_vol': dtype.type(his_vol),
+                'time_grid': time_grid,
+                'prices': prices
+                },
+            out=prices
+            )
+
+        return prices
+
+
+class NumbaBackend(KernelBackend):
+    """
+    Runs just-in-time compiled Numba kernels that build each price path in a single
+    pass and partition each time step for its percentiles, in parallel across threads.
+    The kernels are compiled on first use.
+    """
+    name = 'numba'
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return numba is not None
+
+    def price_paths(
+            self,
+            initial_price: float,
+            drift: float,
+            his_vol: float,
+            time_grid: np.ndarray,
+            random_normal: np.ndarray,
+            out: np.ndarray = None
+            ) -> np.ndarray:
+        if out is None:
+            out = np.empty((random_normal.shape[0], time_grid.size), dtype=random_normal.dtype)
+
+        # Each draw is read before the price that may share its memory is written
+        _numba_price_paths(
+            float(initial_price), float(drift), float(his_vol),
+            np.ascontiguousarray(time_grid, dtype=random_normal.dtype), random_normal, out
+            )
+
+        return out
+
+    def percentiles(self, sim_data: np.ndarray, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        values = _numba_percentiles(np.ascontiguousarray(sim_data), np.asarray(percentiles, dtype=np.float64))
+
+        return dict(zip(percentiles, values))
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _numba_price_paths(initial_price, drift, his_vol, time_grid, random_normal, prices):
+        n_paths, n_increments = random_normal.shape
+        sqrt_dt = np.sqrt(np.diff(time_grid))
+
+        # Each path accumulates its Brownian Motion and prices in one pass
+        for path in numba.prange(n_paths):
+            brownian_motion = 0.0
+            prices[path, 0] = initial_price * np.exp(drift * time_grid[0])
+
+            for step in range(n_increments):
+                brownian_motion += random_normal[path, step] * sqrt_dt[step]
+                prices[path, step + 1] = initial_price * np.exp(drift * time_grid[step + 1] + his_vol * brownian_motion)
+
+    @numba.njit(parallel=True, cache=True)
+    def _numba_percentiles(sim_data, percentiles):
+        n_steps, n_paths = sim_data.shape
+        values = np.empty((percentiles.size, n_steps))
+
+        # Partition each time step around the closest ranks and interpolate between them
+        for step in numba.prange(n_steps):
+            for k in range(percentiles.size):
+                rank = percentiles[k] / 100 * (n_paths - 1)
+                lower = int(np.floor(rank))
+                partitioned = np.partition(sim_data[step], lower)
+
+                # The next rank up is the smallest value above the partition
+                upper_value = partitioned[lower]
+                if lower + 1 < n_paths:
+                    upper_value = partitioned[lower + 1:].min()
+
+                values[k, step] = partitioned[lower] + (upper_value - partitioned[lower]) * (rank - lower)
+
+        return values
+
+
+# Kernel backends by name, fastest first when chosen automatically
+KERNEL_BACKENDS = {
+    'numba': NumbaBackend,
+    'numexpr': NumexprBackend,
+    'numpy': KernelBackend
+    }
+
+
+def available_backends() -> list:
+    """Returns the names of the kernel backends whose packages are installed"""
+    return [name for name, backend in KERNEL_BACKENDS.items() if backend.is_available()]
+
+def get_backend(name: str = 'numpy') -> KernelBackend:
+    """
+    Creates a kernel backend by name.
+
+    Parameters: name - a key of KERNEL_BACKENDS, or 'auto' for the fastest installed
+        backend (falling back to NumPy)
+
+    Returns: A KernelBackend instance
+    """
+    if name == 'auto':
+        name = available_backends()[0]
+
+    if name not in KERNEL_BACKENDS:
+        raise ValueError(f'Kernel backend must be \'auto\' or one of {list(KERNEL_BACKENDS.keys())}, not {name}')
+    if not KERNEL_BACKENDS[name].is_available():
+        raise ImportError(f'The {name} kernel backend requires the {name} package to be installed')
+
+    return KERNEL_BACKENDS[name]()
+
+def benchmark_backends(
+        n_simulations: int = 10000,
+        num_steps: int = ANNUAL_TRADING_DAYS,
+        repeats: int = 3,
+        backends: list = None
+        ) -> dict:
+    """
+    Times each kernel backend building price paths and reducing them to band
+    percentiles on the same normal draws. A warm-up run (which compiles the Numba
+    kernels) is excluded from the timings.
+
+    Parameters:
+        n_simulations - the number of price paths in each run
+        num_steps - the number of time steps on each path
+        repeats - the number of timed runs per backend; the fastest is reported
+        backends - the names of the backends to time; defaults to every installed backend
+
+    Returns: A dictionary mapping each backend name to its fastest run time in seconds
+    """
+    time_grid = calc_time_grid(num_steps)
+    random_normal = np.random.default_rng(0).standard_normal((n_simulations, num_steps - 1))
+
+    timings = {}
+    for name in backends or available_backends():
+        backend = get_backend(name)
+
+        def run() -> None:
+            prices = backend.price_paths(100.0, 0.05, 0.2, time_grid, random_normal)
+            backend.band_summary(prices.transpose())
+
+        run()
+
+        best = float('inf')
+        for _ in range(repeats):
+            start = time.perf_counter()
+            run()
+            best = min(best, time.perf_counter() - start)
+
+        timings[name] = best
+
+    return timings
@@ -0,0 +1,190 @@
+import numpy as np
+from scipy.stats import norm
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine.quantile_sketch import QuantileSketch
+
+
+class BandSummary:
+    """
+    Summary of simulated price paths used to chart forecasts: the mean price and
+    the confidence band percentiles at each time step.
+
+    __init__ Parameters:
+        mean - a 1-dimensional ndarray holding the mean price at each time step
+        percentiles - a dictionary mapping each band percentile (e.g., 2.275) to a
+            1-dimensional ndarray of prices at that percentile for each time step
+        n_paths - the number of simulated price paths that were summarized
+        steps - the time step (trading day) of each value, for summaries of a downsampled 
+            grid of steps; every step from 0 if None
+    """
+    def __init__(self, mean: np.ndarray, percentiles: dict, n_paths: int, steps: np.ndarray = None):
+        self._mean: np.ndarray = mean
+        self._percentiles: dict = percentiles
+        self._n_paths: int = n_paths
+        self._steps: np.ndarray = steps if steps is not None else np.arange(mean.size)
+
+    @classmethod
+    def from_paths(cls, sim_data: np.ndarray, percentiles: tuple = BAND_PERCENTILES) -> 'BandSummary':
+        """
+        Summarizes a full matrix of simulated prices with one row per time step and one
+        column per simulation, as returned by Simulator.monte_carlo_sim.
+
+        Parameters:
+            sim_data - an ndarray of simulated prices
+            percentiles - the percentiles to calculate at each time step
+
+        Returns: A BandSummary of the simulated prices
+        """
+        return cls(
+            mean=sim_data.mean(axis=1, dtype=np.float64),
+            # One partition of each time step for every percentile
+            percentiles=dict(zip(percentiles, np.percentile(sim_data, percentiles, axis=1))),
+            n_paths=sim_data.shape[1]
+            )
+
+    @property
+    def mean(self) -> np.ndarray:
+        return self._mean
+
+    @property
+    def percentiles(self) -> dict:
+        return self._percentiles
+
+    @property
+    def n_paths(self) -> int:
+        return self._n_paths
+
+    @property
+    def num_steps(self) -> int:
+        return self._mean.size
+
+    @property
+    def steps(self) -> np.ndarray:
+        return self._steps
+
+
+class RunningBandSummary:
+    """
+    Accumulates summary statistics one chunk of simulated paths at a time, so that
+    the mean and confidence bands can be calculated without storing every path.
+
+    Band percentiles are estimated by a QuantileSketch of the prices at each time
+    step, within its relative accuracy of the percentiles of the full price matrix.
+    The running sums of prices and squared prices give the arithmetic mean and its
+    standard error, and the count, mean and sum of squared deviations of log-prices
+    (merged between chunks using the parallel variance algorithm) give the standard
+    errors of the percentiles.
+
+    __init__ Parameters:
+        initial_price - the starting price of the simulated paths
+        num_steps - the number of time steps on each price path
+    """
+    def __init__(self, initial_price: float, num_steps: int):
+        self._initial_price: float = initial_price
+        self._count: int = 0
+        self._log_mean: np.ndarray = np.zeros(num_steps)
+        self._log_m2: np.ndarray = np.zeros(num_steps)
+        self._price_sum: np.ndarray = np.zeros(num_steps)
+        self._price_sq_sum: np.ndarray = np.zeros(num_steps)
+        self._sketch: QuantileSketch = QuantileSketch(num_steps)
+
+    def update(self, log_paths: np.ndarray, prices: np.ndarray) -> None:
+        """
+        Folds a chunk of simulated paths into the running summary.
+
+        Parameters:
+            log_paths - an ndarray of log-price paths, one row per path
+            prices - an ndarray of the matching prices, one row per path
+        """
+        chunk_count = log_paths.shape[0]
+
+        # Sums are accumulated in float64 whatever the precision of the paths
+        chunk_mean = log_paths.mean(axis=0, dtype=np.float64)
+        chunk_m2 = ((log_paths - chunk_mean.astype(log_paths.dtype))**2).sum(axis=0, dtype=np.float64)
+
+        self._merge_moments(chunk_count, chunk_mean, chunk_m2)
+        self._price_sum += prices.sum(axis=0, dtype=np.float64)
+        self._price_sq_sum += np.square(prices, dtype=np.float64).sum(axis=0)
+
+        # log(Price(t)) = log(Price(0)) + log-price path, without taking logarithms again;
+        # paths from a price of zero stay at zero and have no logarithm
+        if self._initial_price > 0:
+            self._sketch.update(prices, log_prices=log_paths + log_paths.dtype.type(np.log(self._initial_price)))
+        else:
+            self._sketch.update(prices)
+
+    def merge(self, other: 'RunningBandSummary') -> None:
+        """
+        Combines another running summary of the same price paths into this one.
+
+        Parameters: other - a RunningBandSummary with the same initial price and steps
+        """
+        self._merge_moments(other._count, other._log_mean, other._log_m2)
+        self._price_sum += other._price_sum
+        self._price_sq_sum += other._price_sq_sum
+        self._sketch.merge(other._sketch)
+
+    def _merge_moments(self, count: int, mean: np.ndarray, m2: np.ndarray) -> None:
+        """Merges count, mean and squared deviations of log-prices into the summary"""
+        # Nothing to merge
+        if count == 0:
+            return
+
+        total = self._count + count
+        delta = mean - self._log_mean
+        self._log_mean = self._log_mean + delta * (count / total)
+        self._log_m2 = self._log_m2 + m2 + delta**2 * (self._count * count / total)
+        self._count = total
+
+    def finalize(self, percentiles: tuple = BAND_PERCENTILES) -> BandSummary:
+        """
+        Calculates the mean and band percentiles from the accumulated statistics.
+
+        Parameters: percentiles - the percentiles to calculate at each time step
+
+        Returns: A BandSummary of all paths folded into the running summary
+        """
+        if self._count == 0:
+            raise ValueError('Running summary is empty: no simulated paths have been added.')
+
+        return BandSummary(
+            mean=self._price_sum / self._count,
+            percentiles=self._sketch.quantiles(percentiles),
+            n_paths=self._count
+            )
+
+    def standard_errors(self, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        """
+        Estimates the Monte Carlo standard errors of the mean and band percentiles, 
+        relative to their values, at each time step. The mean's error is the sample 
+        standard deviation of prices / sqrt(count). A sample percentile p has standard 
+        error sqrt(p * (1 - p) / count) / density at the percentile; with approximately 
+        normal log-prices its relative error is about 
+        log standard deviation * sqrt(p * (1 - p) / count) / phi(z), where z is the 
+        standard normal quantile of p and phi the standard normal density.
+
+        Parameters: percentiles - the band percentiles to estimate errors for
+
+        Returns: A dictionary mapping 'mean' and each band percentile to a 1-dimensional
+            ndarray of relative standard errors, one per time step
+        """
+        if self._count < 2:
+            raise ValueError('Running summary needs at least two simulated paths to estimate standard errors.')
+
+        mean = self._price_sum / self._count
+
+        # Sample variance of prices; clipped at zero against rounding error
+        price_var = np.maximum(self._price_sq_sum / self._count - mean**2, 0) * self._count / (self._count - 1)
+        log_std = np.sqrt(self._log_m2 / (self._count - 1))
+
+        errors = {'mean': np.sqrt(price_var / self._count) / mean}
+        for q in percentiles:
+            p = q / 100
+            errors[q] = log_std * np.sqrt(p * (1 - p) / self._count) / norm.pdf(norm.ppf(p))
+
+        return errors
+
+    @property
+    def count(self) -> int:
+        return self._count
@@ -0,0 +1,130 @@
+from collections import OrderedDict
+
+import numpy as np
+
+from monte_carlo_simulator.const import BROWNIAN_CACHE_SIZE
+
+
+class BrownianCache:
+    """
+    Standardized Brownian Motion matrices kept for reruns with common random numbers.
+    Price paths are an affine transform of the same Brownian Motion for any drift and
+    volatility, so a rerun with the same seed and dimensions but new inputs (e.g., a
+    different volatility window or returns method) only rescales a cached matrix
+    instead of drawing it again, and differences between the runs come from the
+    inputs rather than sampling noise.
+
+    Matrices are keyed by the seed and dimensions of the run (and anything else that
+    changes the draws). Once more than max_entries matrices, or more than max_bytes,
+    are held, the least recently used matrices are dropped; a matrix larger than
+    max_bytes is not cached. Cached matrices are read-only.
+
+    __init__ Parameters:
+        max_entries - the most matrices held; 0 disables the cache
+        max_bytes - the most memory the cached matrices may use together, in bytes; 
+            unlimited if None
+    """
+    def __init__(self, max_entries: int = BROWNIAN_CACHE_SIZE, max_bytes: int = None):
+        self._entries: OrderedDict = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._nbytes: int = 0
+        self._max_entries: int = 0
+        self._max_bytes: int = None
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    def get(self, key: tuple) -> np.ndarray:
+        """
+        Returns the matrix cached under key, marking it as the most recently used.
+
+        Parameters: key - a tuple identifying the draws (e.g., seed, paths, time steps)
+
+        Returns: The cached ndarray, or None if key is not cached
+        """
+        brownian = self._entries.get(key)
+
+        if brownian is None:
+            self._misses += 1
+            return None
+
+        self._hits += 1
+        self._entries.move_to_end(key)
+
+        return brownian
+
+    def put(self, key: tuple, brownian: np.ndarray) -> None:
+        """
+        Caches a matrix under key, dropping the least recently used matrices beyond
+        max_entries or max_bytes. The matrix is made read-only.
+
+        Parameters:
+            key - a tuple identifying the draws (e.g., seed, paths, time steps)
+            brownian - an ndarray of Brownian Motion paths, as from calc_brownian_paths
+        """
+        if self._max_entries == 0 or (self._max_bytes is not None and brownian.nbytes > self._max_bytes):
+            return
+
+        # Replace any matrix already cached under key
+        if key in self._entries:
+            self._nbytes -= self._entries.pop(key).nbytes
+
+        brownian.flags.writeable = False
+        self._entries[key] = brownian
+        self._nbytes += brownian.nbytes
+        self._evict()
+
+    def clear(self) -> None:
+        """Drops every cached matrix"""
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _evict(self) -> None:
+        """Drops the least recently used matrices beyond max_entries or max_bytes"""
+        while len(self._entries) > self._max_entries \
+                or (self._max_bytes is not None and self._nbytes > self._max_bytes):
+            _, brownian = self._entries.popitem(last=False)
+            self._nbytes -= brownian.nbytes
+
+    def __contains__(self, key: tuple) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    @property
+    def hits(self) -> int:
+        """The number of lookups that found a cached matrix"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """The number of lookups that found no cached matrix"""
+        return self._misses
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the cached matrices, in bytes"""
+        return self._nbytes
+
+    @max_entries.setter
+    def max_entries(self, max_entries: int) -> None:
+        if not isinstance(max_entries, int) or isinstance(max_entries, bool) or max_entries < 0:
+            raise ValueError(f'"max_entries" must be a non-negative integer, not {max_entries}')
+        self._max_entries = max_entries
+        self._evict()
+
+    @max_bytes.setter
+    def max_bytes(self, max_bytes: int) -> None:
+        if max_bytes is not None and (not isinstance(max_bytes, int) or isinstance(max_bytes, bool) or max_bytes < 0):
+            raise ValueError(f'"max_bytes" must be a non-negative integer or None, not {max_bytes}')
+        self._max_bytes = max_bytes
+        self._evict()
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, DEFAULT_CHUNK_SIZE
+from monte_carlo_simulator.service.engine.band_summary import BandSummary, RunningBandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+def calc_plot_steps(num_steps: int, plot_points: int, include: list = ()) -> np.ndarray:
+    """
+    Chooses a downsampled grid of time steps for plotting: plot_points evenly spaced
+    steps from the first to the last, plus any steps that must be included.
+
+    Parameters:
+        num_steps - the number of time steps on each simulated path
+        plot_points - the approximate number of steps to keep
+        include - steps always kept (e.g., checkpoint steps)
+
+    Returns: A sorted 1-dimensional ndarray of unique step indices
+    """
+    if not isinstance(plot_points, int) or plot_points < 2:
+        raise ValueError(f'"plot_points" must be an integer of at least 2, not {plot_points}')
+
+    even_steps = np.round(np.linspace(0, num_steps - 1, min(plot_points, num_steps))).astype(int)
+
+    return np.union1d(even_steps, np.asarray(include, dtype=int))
+
+def run_checkpoint_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        checkpoint_steps: list,
+        n_simulations: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        rng: SimulationRNG = None,
+        antithetic: bool = False,
+        dtype: type = np.float64,
+        percentiles: tuple = BAND_PERCENTILES,
+        plot_steps: np.ndarray = None
+        ) -> tuple[pd.DataFrame, BandSummary]:
+    """
+    Simulates Geometric Brownian Motion price paths over the whole time grid in chunks,
+    keeping prices only at the checkpoint steps (and running summaries of the plotted
+    steps). Statistics at every checkpoint come from one pass over the longest horizon,
+    while n_simulations * len(checkpoint_steps) prices are stored instead of the full
+    path matrix.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        checkpoint_steps - the indices of the time steps to record statistics at
+        n_simulations - the number of simulations to be run
+        chunk_size - the maximum number of price paths generated at once
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+        percentiles - the percentiles of prices to record at each checkpoint
+        plot_steps - the indices of the time steps summarized for plotting; every step
+            if None
+
+    Returns: A tuple of a pandas.DataFrame with one row per checkpoint step (indexed by
+        step) holding the mean price, each percentile and the probability of loss, and a
+        BandSummary of the plotted steps
+    """
+    checkpoint_steps = np.asarray(checkpoint_steps, dtype=int)
+    if checkpoint_steps.size == 0 or checkpoint_steps.min() < 0 or checkpoint_steps.max() >= time_grid.size:
+        raise ValueError(f'"checkpoint_steps" must be between 0 and {time_grid.size - 1}, not {checkpoint_steps.tolist()}')
+
+    if plot_steps is None:
+        plot_steps = np.arange(time_grid.size)
+
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    checkpoint_prices = np.empty((n_simulations, checkpoint_steps.size), dtype=dtype)
+    running_summary = RunningBandSummary(initial_price, plot_steps.size)
+
+    # Simulate whole paths one chunk at a time, keeping only the recorded steps
+    for chunk_start in range(0, n_simulations, chunk_size):
+        n_paths = min(chunk_size, n_simulations - chunk_start)
+
+        random_normal = rng.standard_normal(
+            chunk_start, chunk_start + n_paths, time_grid.size - 1, antithetic=antithetic, dtype=dtype)
+        log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal)
+        prices = calc_price_paths(initial_price, log_paths)
+
+        checkpoint_prices[chunk_start:chunk_start + n_paths] = prices[:, checkpoint_steps]
+        running_summary.update(log_paths[:, plot_steps], prices[:, plot_steps])
+
+    # One row of statistics per checkpoint, accumulated in float64
+    table = pd.DataFrame(
+        {
+            'mean': checkpoint_prices.mean(axis=0, dtype=np.float64),
+            **dict(zip(percentiles, np.percentile(checkpoint_prices, percentiles, axis=0))),
+            'prob_loss': (checkpoint_prices < initial_price).mean(axis=0)
+            },
+        index=pd.Index(checkpoint_steps, name='step')
+        )
+
+    summary = running_summary.finalize(percentiles)
+
+    return table, BandSummary(summary.mean, summary.percentiles, summary.n_paths, steps=plot_steps)
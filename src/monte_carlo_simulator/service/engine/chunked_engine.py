@@ -0,0 +1,143 @@
+import mmap
+import os
+import tempfile
+import warnings
+import weakref
+
+import numpy as np
+
+from monte_carlo_simulator.const import DEFAULT_CHUNK_SIZE
+from monte_carlo_simulator.service.engine.band_summary import BandSummary, RunningBandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+def run_chunked_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        n_simulations: int,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        rng: SimulationRNG = None,
+        antithetic: bool = False,
+        dtype: type = np.float64
+        ) -> BandSummary:
+    """
+    Streams Geometric Brownian Motion price paths in fixed-size chunks, folding each
+    chunk into running summaries so that the full n_simulations x time steps matrix
+    is never stored. Peak memory use is bounded by chunk_size, not n_simulations.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of simulations to be run
+        chunk_size - the maximum number of price paths generated at once
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+
+    Returns: A BandSummary with the mean and band percentiles of the simulated prices
+    """
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    running_summary = RunningBandSummary(initial_price, time_grid.size)
+
+    # Generate and summarize paths one chunk at a time
+    for chunk_start in range(0, n_simulations, chunk_size):
+        n_paths = min(chunk_size, n_simulations - chunk_start)
+
+        random_normal = rng.standard_normal(
+            chunk_start, chunk_start + n_paths, time_grid.size - 1, antithetic=antithetic, dtype=dtype)
+        log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal)
+
+        running_summary.update(log_paths, calc_price_paths(initial_price, log_paths))
+
+    return running_summary.finalize()
+
+def run_out_of_core_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        n_simulations: int,
+        filename: str = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        rng: SimulationRNG = None,
+        antithetic: bool = False,
+        dtype: type = np.float64
+        ) -> np.memmap:
+    """
+    Simulates Geometric Brownian Motion price paths in fixed-size chunks and writes
+    every path to a .npy file on disk, for runs whose paths do not fit in memory.
+    Peak memory use is bounded by chunk_size; the returned array is memory-mapped, so
+    its paths are read from disk as they are used.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of simulations to be run
+        filename - the .npy file to write; if None, a temporary file is created and
+            deleted once the returned array is released, or at exit
+        chunk_size - the maximum number of price paths generated at once
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+
+    Returns: A memory-mapped ndarray of simulated prices with one row per path, which
+        can be reopened with np.load(filename, mmap_mode='r')
+    """
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    is_temporary = filename is None
+    if is_temporary:
+        file_descriptor, filename = tempfile.mkstemp(suffix='.npy')
+        os.close(file_descriptor)
+
+    paths = np.lib.format.open_memmap(filename, mode='w+', dtype=dtype, shape=(n_simulations, time_grid.size))
+
+    # A temporary file is deleted once the array, and every view of it, is released, 
+    # or at exit; its memory map is closed first, since an open file cannot be deleted 
+    # on every platform
+    if is_temporary:
+        weakref.finalize(paths, _remove_file, filename, paths._mmap)
+
+    # Generate each chunk in place in its rows of the file
+    for chunk_start in range(0, n_simulations, chunk_size):
+        chunk_paths = paths[chunk_start:min(chunk_start + chunk_size, n_simulations)]
+
+        random_normal = rng.standard_normal(
+            chunk_start, chunk_start + len(chunk_paths), time_grid.size - 1, out=chunk_paths[:, 1:], antithetic=antithetic)
+        calc_price_paths(initial_price, calc_log_paths(drift, his_vol, time_grid, random_normal, out=chunk_paths), out=chunk_paths)
+
+    paths.flush()
+
+    return paths
+
+def _remove_file(filename: str, file_map: mmap.mmap = None) -> None:
+    """Closes a file's memory map and deletes it, warning if it cannot be deleted"""
+    # The map is released with the last view of the array, so nothing reads it after
+    if file_map is not None:
+        try:
+            file_map.close()
+        except BufferError:
+            pass
+
+    try:
+        os.remove(filename)
+    except FileNotFoundError:
+        pass
+    except OSError as error:
+        warnings.warn(f'Temporary path file {filename} could not be deleted: {error}', RuntimeWarning)
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET
+from monte_carlo_simulator.service.calculator.risk_calculator import calc_terminal_stats
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+from monte_carlo_simulator.service.engine.forecast_scores import score_forecast
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths_from_brownian, calc_price_paths
+
+
+def run_method_comparison(
+        initial_price: float,
+        expected_returns: dict,
+        his_vol: float,
+        time_grid: np.ndarray,
+        brownian: np.ndarray,
+        backtest_price: float = None,
+        backtest_returns: dict = None,
+        backtest_vol: float = None,
+        actual: pd.DataFrame | pd.Series | np.ndarray = None,
+        percentiles: tuple = BAND_PERCENTILES,
+        memory_budget: int = MEMORY_BUDGET
+        ) -> tuple[pd.DataFrame, dict]:
+    """
+    Compares expected returns methods side by side on one set of standardized Brownian
+    Motion paths, rescaled for each method's drift. Each method's forecast is
+    summarized by its terminal price statistics and, with backtest inputs, its backtest
+    paths are scored against the actual prices (see score_forecast). The paths of one
+    method at a time are built in one reused buffer.
+
+    Parameters:
+        initial_price - the starting price of the forecasts
+        expected_returns - a dictionary mapping each expected returns method (e.g.,
+            'Simple Average Returns') to the expected returns it calculated
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        brownian - an ndarray of Brownian Motion paths, one row per path, as created by
+            calc_brownian_paths, shared by every forecast
+        backtest_price - the starting price of the backtest forecasts; no backtest is
+            scored if None
+        backtest_returns - a dictionary mapping each method to the expected returns it
+            calculated from the training data
+        backtest_vol - the volatility calculated from the training data
+        actual - the prices observed over the testing period
+        percentiles - the percentiles of terminal prices and bands scored
+        memory_budget - the most memory a block of sorted prices may use when scoring,
+            in bytes
+
+    Returns: A tuple of a pandas.DataFrame with one row per method (indexed by
+        exp_ret_flag) holding its expected_returns, the expected terminal price, each
+        terminal price percentile and the probability of loss, then, with a backtest,
+        its backtest_returns, the coverage of each band (e.g., 'coverage_95.45'), the
+        mean pinball loss and the mean CRPS; and a dictionary mapping each method to a
+        BandSummary of its backtest paths (empty without a backtest)
+    """
+    # One buffer of paths, rebuilt for each forecast
+    paths = np.empty_like(brownian)
+
+    def simulate(price: float, returns: float, vol: float) -> np.ndarray:
+        drift = calc_drift(returns, vol)
+
+        log_paths = calc_log_paths_from_brownian(drift, vol, time_grid, brownian, out=paths)
+        return calc_price_paths(price, log_paths, out=log_paths).transpose()
+
+    rows = {}
+    backtest_summaries = {}
+    for exp_ret_flag, returns in expected_returns.items():
+        terminal_stats = calc_terminal_stats(simulate(initial_price, returns, his_vol), initial_price, percentiles)
+        row = {
+            'expected_returns': returns,
+            'expected_price': terminal_stats['expected_price'],
+            **terminal_stats['percentiles'],
+            'prob_loss': terminal_stats['prob_loss']
+            }
+
+        # Score the method's forecast of the testing period on the same draws
+        if backtest_price is not None:
+            backtest_paths = simulate(backtest_price, backtest_returns[exp_ret_flag], backtest_vol)
+            scores = score_forecast(backtest_paths, actual, percentiles, memory_budget=memory_budget)
+            backtest_summaries[exp_ret_flag] = BandSummary.from_paths(backtest_paths, percentiles)
+
+            row['backtest_returns'] = backtest_returns[exp_ret_flag]
+            row.update({f'coverage_{band}': rate for band, rate in scores.coverage_rates.items()})
+            row['pinball'] = float(np.mean(list(scores.mean_pinball.values())))
+            row['crps'] = scores.mean_crps
+
+        rows[exp_ret_flag] = row
+
+    table = pd.DataFrame.from_dict(rows, orient='index')
+    table.index.name = 'exp_ret_flag'
+
+    return table, backtest_summaries
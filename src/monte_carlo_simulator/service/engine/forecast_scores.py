@@ -0,0 +1,208 @@
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET, PIT_BINS
+from monte_carlo_simulator.service.calculator.score_calculator import calc_band_coverage, calc_crps, calc_pinball_loss, \
+    calc_pit, calc_pit_histogram
+from monte_carlo_simulator.service.engine.simulation_result import SimulationResult
+
+
+class ForecastScores:
+    """
+    Scores of probabilistic price forecasts against observed prices, one value per
+    forecast: each time step of a backtest, or each origin of a walk-forward backtest.
+
+    __init__ Parameters:
+        coverage - a dictionary mapping the nominal coverage of each confidence band
+            (e.g., 95.45) to a boolean ndarray, True where the observed price was within
+            the band
+        pinball - a dictionary mapping each band percentile to an ndarray of pinball losses
+        pit - an ndarray of probability integral transform values; None if the
+            simulated paths were not kept
+        crps - an ndarray of continuous ranked probability scores; None if the simulated
+            paths were not kept
+        pit_bins - the number of bins of the PIT histogram
+    """
+    def __init__(
+            self,
+            coverage: dict,
+            pinball: dict,
+            pit: np.ndarray = None,
+            crps: np.ndarray = None,
+            pit_bins: int = PIT_BINS
+            ):
+        self._coverage: dict = coverage
+        self._pinball: dict = pinball
+        self._pit: np.ndarray = pit
+        self._crps: np.ndarray = crps
+        self._pit_bins: int = pit_bins
+
+    @property
+    def coverage(self) -> dict:
+        return self._coverage
+
+    @property
+    def coverage_rates(self) -> dict:
+        """The proportion of observed prices within each band, by nominal coverage"""
+        return {band: float(np.mean(inside)) for band, inside in self._coverage.items()}
+
+    @property
+    def pinball(self) -> dict:
+        return self._pinball
+
+    @property
+    def mean_pinball(self) -> dict:
+        """The mean pinball loss of each band percentile"""
+        return {q: float(np.nanmean(losses)) for q, losses in self._pinball.items()}
+
+    @property
+    def pit(self) -> np.ndarray:
+        return self._pit
+
+    @property
+    def pit_histogram(self) -> np.ndarray:
+        """The proportion of PIT values in each equal-width bin; None without PIT values"""
+        return calc_pit_histogram(self._pit, self._pit_bins) if self._pit is not None else None
+
+    @property
+    def crps(self) -> np.ndarray:
+        return self._crps
+
+    @property
+    def mean_crps(self) -> float:
+        """The mean CRPS over every forecast; None without CRPS values"""
+        return float(np.nanmean(self._crps)) if self._crps is not None else None
+
+    @property
+    def n_forecasts(self) -> int:
+        return next(iter(self._pinball.values())).size
+
+    @property
+    def summary(self) -> dict:
+        """Every score averaged over the forecasts, e.g., to compare many backtests"""
+        pit_histogram = self.pit_histogram
+
+        return {
+            'coverage': self.coverage_rates,
+            'pinball': self.mean_pinball,
+            'crps': self.mean_crps,
+            'pit_histogram': pit_histogram.tolist() if pit_histogram is not None else None
+            }
+
+
+def calc_band_pairs(percentiles: tuple = BAND_PERCENTILES) -> list:
+    """
+    Pairs symmetric percentiles into central confidence bands (e.g., 2.275 and 97.725).
+
+    Parameters: percentiles - the band percentiles
+
+    Returns: A list of (lower, upper) percentile tuples, narrowest band first
+    """
+    lowers = sorted((q for q in percentiles if q < 50), reverse=True)
+
+    return [(lower, upper) for lower in lowers for upper in percentiles if np.isclose(lower + upper, 100)]
+
+def score_forecast(
+        sim_data: np.ndarray | SimulationResult,
+        actual: pd.DataFrame | pd.Series | np.ndarray,
+        percentiles: tuple = BAND_PERCENTILES,
+        pit_bins: int = PIT_BINS,
+        memory_budget: int = MEMORY_BUDGET
+        ) -> ForecastScores:
+    """
+    Scores simulated price paths against the prices observed over the same period, at
+    every time step: band coverage, pinball loss at the band percentiles, the PIT and
+    the CRPS. The paths are sorted in blocks of time steps within the memory budget,
+    and every score of a block is calculated from its sorted prices. Paths with
+    coarser time steps than actual are scored against the prices the same proportion
+    of the way through the period, as charted by backtest_vis.
+
+    Parameters:
+        sim_data - an ndarray of simulated prices with one row per time step, as
+            returned by Simulator.monte_carlo_sim, or a SimulationResult; without paths,
+            only coverage and pinball loss are scored, from its percentiles
+        actual - the observed prices, one per trading day from the first simulated price
+        percentiles - the band percentiles scored
+        pit_bins - the number of bins of the PIT histogram
+        memory_budget - the most memory a block of sorted prices may use, in bytes
+
+    Returns: A ForecastScores with one value per time step
+    """
+    # Verify sim_data is a numpy array or a simulation result
+    if not isinstance(sim_data, (np.ndarray, SimulationResult)):
+        raise TypeError(f'Forecast scoring error: "sim_data" must be a numpy.ndarray or SimulationResult, not {type(sim_data)}')
+
+    # Use the first column of observed prices
+    actual = actual.iloc[:, 0] if isinstance(actual, pd.DataFrame) else actual
+    actual = np.asarray(actual, dtype=np.float64)
+
+    num_steps = sim_data.shape[0] if isinstance(sim_data, np.ndarray) else sim_data.num_steps
+    paths = sim_data if isinstance(sim_data, np.ndarray) else sim_data.paths
+
+    # Each time step of the simulation spans the same proportion of the observed period
+    if actual.size != num_steps:
+        actual = actual[np.round(np.linspace(0, actual.size - 1, num_steps)).astype(int)]
+
+    pit = None
+    crps = None
+
+    # Without paths, score the percentiles already calculated
+    if paths is None:
+        quantiles = sim_data.quantiles(percentiles)
+
+    else:
+        quantiles = {q: np.empty(num_steps) for q in percentiles}
+        pit = np.empty(num_steps)
+        crps = np.empty(num_steps)
+
+        # The time steps whose sorted prices fit in the memory budget at once
+        steps_per_block = max(1, memory_budget // max(paths.shape[1] * paths.dtype.itemsize, 1))
+
+        for start in range(0, num_steps, steps_per_block):
+            stop = min(start + steps_per_block, num_steps)
+
+            block = np.sort(paths[start:stop], axis=1)
+            for q, values in zip(percentiles, np.percentile(block, percentiles, axis=1)):
+                quantiles[q][start:stop] = values
+            pit[start:stop] = calc_pit(block, actual[start:stop])
+            crps[start:stop] = calc_crps(block, actual[start:stop], is_sorted=True)
+
+    return ForecastScores(
+        coverage={
+            round(upper - lower, 4): calc_band_coverage(quantiles[lower], quantiles[upper], actual)
+            for lower, upper in calc_band_pairs(percentiles)
+            },
+        pinball={q: calc_pinball_loss(quantiles[q], actual, q) for q in percentiles},
+        pit=pit,
+        crps=crps,
+        pit_bins=pit_bins
+        )
+
+def score_walk_forward(
+        table: pd.DataFrame,
+        percentiles: tuple = BAND_PERCENTILES,
+        pit_bins: int = PIT_BINS
+        ) -> ForecastScores:
+    """
+    Scores the forecasts of a walk-forward backtest, one per origin, from the table
+    returned by run_walk_forward.
+
+    Parameters:
+        table - a pandas.DataFrame of forecasts, as returned by run_walk_forward
+        percentiles - the band percentiles scored; columns of the table
+        pit_bins - the number of bins of the PIT histogram
+
+    Returns: A ForecastScores with one value per origin
+    """
+    actual = table['actual_price'].to_numpy()
+
+    return ForecastScores(
+        coverage={
+            round(upper - lower, 4): calc_band_coverage(table[lower].to_numpy(), table[upper].to_numpy(), actual)
+            for lower, upper in calc_band_pairs(percentiles)
+            },
+        pinball={q: calc_pinball_loss(table[q].to_numpy(), actual, q) for q in percentiles},
+        pit=table['pit'].to_numpy(),
+        crps=table['crps'].to_numpy() if 'crps' in table else None,
+        pit_bins=pit_bins
+        )
@@ -0,0 +1,144 @@
+import numpy as np
+
+from monte_carlo_simulator.const import MEMORY_BUDGET, SIM_OUTPUTS
+from monte_carlo_simulator.service.engine.quantile_sketch import QuantileSketch
+
+# Path-sized arrays alive at the peak of each strategy: a full run holds the path
+# matrix and either its normal draws or the copy np.percentile sorts; a chunk holds
+# its draws, log-price paths, prices and the squares folded into running moments
+_FULL_MATRICES = 2
+_CHUNK_MATRICES = 4
+_TERMINAL_ARRAYS = 2
+
+# Sketch-sized arrays alive while streaming bands: the quantile sketch's bucket counts
+# and the counts of the chunk being added to them
+_SKETCH_ARRAYS = 2
+
+
+class SimulationPlan:
+    """
+    The execution strategy chosen for a simulation and its estimated memory footprint.
+
+    __init__ Parameters:
+        strategy - 'full' to hold every path in memory, 'chunked' to stream paths into
+            running summaries, 'terminal' to sample terminal prices only, or
+            'out_of_core' to write every path to a file on disk in chunks
+        estimated_bytes - the estimated peak memory use of the simulation's arrays
+        memory_budget - the memory budget the plan was made for, in bytes
+        chunk_size - the number of paths simulated at once by the 'chunked' and
+            'out_of_core' strategies; None otherwise
+        disk_bytes - the size of the paths written to disk by 'out_of_core'; 0 otherwise
+    """
+    def __init__(
+            self,
+            strategy: str,
+            estimated_bytes: int,
+            memory_budget: int,
+            chunk_size: int = None,
+            disk_bytes: int = 0
+            ):
+        self._strategy: str = strategy
+        self._estimated_bytes: int = estimated_bytes
+        self._memory_budget: int = memory_budget
+        self._chunk_size: int = chunk_size
+        self._disk_bytes: int = disk_bytes
+
+    @property
+    def strategy(self) -> str:
+        return self._strategy
+
+    @property
+    def estimated_bytes(self) -> int:
+        return self._estimated_bytes
+
+    @property
+    def memory_budget(self) -> int:
+        return self._memory_budget
+
+    @property
+    def chunk_size(self) -> int:
+        return self._chunk_size
+
+    @property
+    def disk_bytes(self) -> int:
+        return self._disk_bytes
+
+
+def estimate_path_bytes(n_simulations: int, num_steps: int, dtype: type = np.float64) -> int:
+    """
+    Calculates the size of a matrix holding every simulated price path.
+
+    Parameters:
+        n_simulations - the number of simulations
+        num_steps - the number of time steps on each path, as returned by calc_num_steps
+        dtype - the floating point type of the simulated paths
+
+    Returns: The size of the path matrix in bytes
+    """
+    return n_simulations * num_steps * np.dtype(dtype).itemsize
+
+def plan_simulation(
+        n_simulations: int,
+        num_steps: int,
+        dtype: type = np.float64,
+        outputs: tuple = ('bands',),
+        memory_budget: int = MEMORY_BUDGET,
+        log_std: float = None,
+        log_drift: float = 0.0
+        ) -> SimulationPlan:
+    """
+    Chooses how to run a simulation within a memory budget, given the outputs needed:
+        - terminal prices only are sampled directly ('terminal')
+        - otherwise every path is held in memory if it fits ('full')
+        - otherwise, if every path is needed, paths are written to disk ('out_of_core'),
+          and if only bands are needed, paths are streamed into summaries ('chunked')
+    Chunks are as large as the budget allows, up to n_simulations.
+
+    Parameters:
+        n_simulations - the number of simulations
+        num_steps - the number of time steps on each path, as returned by calc_num_steps
+        dtype - the floating point type of the simulated paths
+        outputs - the outputs needed, a subset of SIM_OUTPUTS: 'bands' for the mean
+            and confidence bands, 'paths' for every price path, 'terminal' for
+            terminal prices
+        memory_budget - the most memory the simulation's arrays should use, in bytes
+        log_std - the standard deviation of log-prices at the end of the paths; if set,
+            the memory of the quantile sketch that streams bands is reserved from the
+            budget of 'chunked' runs (see QuantileSketch.estimate_nbytes)
+        log_drift - the mean change of log-prices over the paths
+
+    Returns: A SimulationPlan
+    """
+    outputs = set(outputs)
+    if not outputs or not outputs.issubset(SIM_OUTPUTS):
+        raise ValueError(f'"outputs" must be a non-empty subset of {SIM_OUTPUTS}, not {tuple(outputs)}')
+    if not isinstance(memory_budget, int) or memory_budget <= 0:
+        raise ValueError(f'"memory_budget" must be a positive integer, not {memory_budget}')
+
+    itemsize = np.dtype(dtype).itemsize
+
+    if outputs == {'terminal'}:
+        return SimulationPlan('terminal', _TERMINAL_ARRAYS * n_simulations * itemsize, memory_budget)
+
+    full_bytes = _FULL_MATRICES * estimate_path_bytes(n_simulations, num_steps, dtype)
+    if full_bytes <= memory_budget:
+        return SimulationPlan('full', full_bytes, memory_budget)
+
+    # Streamed bands keep a quantile sketch beside each chunk; paths written to disk do not
+    sketch_bytes = 0
+    if 'paths' not in outputs and log_std is not None:
+        sketch_bytes = _SKETCH_ARRAYS * QuantileSketch.estimate_nbytes(num_steps, n_simulations, log_std, log_drift)
+
+    # The largest chunk of paths within the rest of the budget; running moments are
+    # kept in float64
+    bytes_per_path = _CHUNK_MATRICES * num_steps * max(itemsize, np.dtype(np.float64).itemsize)
+    chunk_size = int(min(n_simulations, max(1, (memory_budget - sketch_bytes) // bytes_per_path)))
+    chunk_bytes = chunk_size * bytes_per_path
+
+    if 'paths' in outputs:
+        return SimulationPlan(
+            'out_of_core', chunk_bytes, memory_budget, chunk_size=chunk_size,
+            disk_bytes=estimate_path_bytes(n_simulations, num_steps, dtype)
+            )
+
+    return SimulationPlan('chunked', chunk_bytes + sketch_bytes, memory_budget, chunk_size=chunk_size)
@@ -0,0 +1,136 @@
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from monte_carlo_simulator.const import DEFAULT_CHUNK_SIZE
+from monte_carlo_simulator.service.engine.band_summary import BandSummary, RunningBandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+def run_parallel_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        n_simulations: int,
+        rng: SimulationRNG = None,
+        n_workers: int = None,
+        block_size: int = DEFAULT_CHUNK_SIZE,
+        return_paths: bool = False,
+        antithetic: bool = False,
+        dtype: type = np.float64
+        ) -> BandSummary | np.ndarray:
+    """
+    Splits a Geometric Brownian Motion simulation across a pool of worker processes.
+
+    The simulations are divided into blocks of block_size paths, and the partial
+    results are merged in block order. Random draws come from the SimulationRNG's
+    independent, SeedSequence-spawned streams. Because blocks and streams do not
+    depend on the number of workers, results for a given seed are bit-for-bit
+    identical however many workers run them.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of simulations to be run
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        n_workers - the number of worker processes; defaults to the number of CPUs
+        block_size - the number of price paths simulated by each task
+        return_paths - if True, returns every simulated path instead of a summary
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+
+    Returns: A BandSummary of the simulated prices, or, if return_paths is True, an
+        ndarray of simulated prices with one row per time step (as monte_carlo_sim)
+    """
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    if n_workers is None:
+        n_workers = os.cpu_count() or 1
+
+    # Fixed-size blocks of paths, independent of the number of workers
+    block_starts = list(range(0, n_simulations, block_size))
+    block_stops = [min(start + block_size, n_simulations) for start in block_starts]
+    n_blocks = len(block_starts)
+
+    with ProcessPoolExecutor(max_workers=n_workers, mp_context=_get_mp_context()) as executor:
+        # Executor.map returns results in block order, keeping the merge deterministic
+        block_results = list(executor.map(
+            _simulate_block,
+            [initial_price] * n_blocks,
+            [drift] * n_blocks,
+            [his_vol] * n_blocks,
+            [time_grid] * n_blocks,
+            block_starts,
+            block_stops,
+            [rng] * n_blocks,
+            [return_paths] * n_blocks,
+            [antithetic] * n_blocks,
+            [dtype] * n_blocks,
+            chunksize=max(1, n_blocks // (4 * n_workers))
+            ))
+
+    # Combine the simulated paths of every block
+    if return_paths:
+        return np.concatenate(block_results).transpose()
+
+    # Merge block summaries in order
+    running_summary = RunningBandSummary(initial_price, time_grid.size)
+    for block_summary in block_results:
+        running_summary.merge(block_summary)
+
+    return running_summary.finalize()
+
+def _simulate_block(
+        initial_price: float,
+        drift: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        start: int,
+        stop: int,
+        rng: SimulationRNG,
+        return_paths: bool,
+        antithetic: bool,
+        dtype: type
+        ) -> RunningBandSummary | np.ndarray:
+    """
+    Worker task: simulates paths start to stop (exclusive) from their random streams.
+
+    Returns: A RunningBandSummary of the block, or, if return_paths is True, the
+        simulated prices with one row per path
+    """
+    random_normal = rng.standard_normal(start, stop, time_grid.size - 1, antithetic=antithetic, dtype=dtype)
+    log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal)
+    prices = calc_price_paths(initial_price, log_paths)
+
+    if return_paths:
+        return prices
+
+    block_summary = RunningBandSummary(initial_price, time_grid.size)
+    block_summary.update(log_paths, prices)
+
+    return block_summary
+
+def _get_mp_context() -> multiprocessing.context.BaseContext:
+    """
+    Returns the multiprocessing context used to start workers. Workers are never forked
+    directly from the calling process: forking a process whose thread pools are running
+    (e.g., after the Numba kernel backend has been used) can deadlock. A fork server is
+    used where the platform has one; it imports this module once, so workers start
+    much faster than spawned ones.
+    """
+    if 'forkserver' in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context('forkserver')
+        context.set_forkserver_preload([__name__])
+        return context
+
+    return multiprocessing.get_context('spawn')
@@ -0,0 +1,222 @@
+import numpy as np
+
+from monte_carlo_simulator.const import ANNUAL_TRADING_DAYS, MONTHS_PER_YEAR, STEP_GRANULARITIES
+
+
+def calc_days_per_step(step_granularity: str | int = 'daily') -> int:
+    """
+    Converts a simulation step size into a number of trading days.
+
+    Parameters: step_granularity - a key of STEP_GRANULARITIES ('daily', 'weekly' or 
+        'monthly') or a positive integer number of trading days per step
+
+    Returns: An integer with the number of trading days per time step
+    """
+    if isinstance(step_granularity, str) and step_granularity in STEP_GRANULARITIES:
+        return STEP_GRANULARITIES[step_granularity]
+
+    if isinstance(step_granularity, int) and not isinstance(step_granularity, bool) and step_granularity > 0:
+        return step_granularity
+
+    raise ValueError(f'Step granularity must be one of {list(STEP_GRANULARITIES.keys())} or a positive integer, not {step_granularity}')
+
+def calc_num_steps(time_horizon: int, step_granularity: str | int = 'daily') -> int:
+    """
+    Converts an investment time horizon into the number of simulated time steps:
+    one step per trading day, or per step_granularity trading days.
+
+    Parameters: 
+        time_horizon - the future period to be forecasted (in months)
+        step_granularity - the simulation step size (see calc_days_per_step)
+
+    Returns: An integer with the number of points on each simulated price path: the 
+        number of trading days in the time horizon for daily steps
+    """
+    # The investment time horizon is divided by the time measure (months)
+    # divided by the number of trading days in a year
+    trading_days = round(time_horizon / (MONTHS_PER_YEAR/ANNUAL_TRADING_DAYS))
+
+    days_per_step = calc_days_per_step(step_granularity)
+    if days_per_step == 1:
+        return trading_days
+
+    # Whole steps spanning the trading days after time zero (at least one), plus time zero
+    return max(round((trading_days - 1) / days_per_step), 1) + 1
+
+def calc_drift(expected_returns: float | np.ndarray, his_vol: float | np.ndarray) -> float | np.ndarray:
+    """
+    Calculates the stochastic drift of Geometric Brownian Motion: the change in the 
+    average value of a random process, net of the volatility drag on log prices.
+
+    Parameters:
+        expected_returns - the expected returns of the asset, or an ndarray of them
+        his_vol - the asset's volatility, or an ndarray of volatilities broadcast 
+            against expected_returns
+
+    Returns: The drift, expected_returns - 0.5 * his_vol**2, as a float or an ndarray
+    """
+    return expected_returns - 0.5 * his_vol**2
+
+def calc_horizon_time(time_horizon: int) -> float:
+    """
+    Converts an investment time horizon into years, the units of the annual expected
+    returns and volatility that scale the drift and spread of terminal prices. A time
+    grid spans 0 to 1 whatever the horizon, so horizons are told apart only by this time.
+
+    Parameters: time_horizon - the future period to be forecasted (in months)
+
+    Returns: A float with the length of the time horizon in years
+    """
+    return time_horizon / MONTHS_PER_YEAR
+
+def calc_time_grid(num_steps: int) -> np.ndarray:
+    """
+    Creates the simulation time grid as a proportion of the time horizon.
+    The first point is time zero (the initial price) and the last point is the
+    end of the time horizon.
+
+    Parameters: num_steps - the number of points on each simulated price path
+
+    Returns: A 1-dimensional ndarray of increasing times between 0 and 1
+    """
+    # A single step holds only the initial price
+    if num_steps == 1:
+        return np.zeros(1)
+
+    return np.linspace(0, 1, num_steps)
+
+def calc_log_paths(
+        drift: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        random_normal: np.ndarray,
+        out: np.ndarray = None
+        ) -> np.ndarray:
+    """
+    Builds log-price paths, log(Price(t)/Price(0)) = Drift*t + Volatility*Brownian Motion,
+    from standard normal draws. Each row of the output is one price path.
+
+    Parameters:
+        drift - the stochastic drift, expected returns - 0.5 * volatility**2
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        random_normal - an ndarray of standard normal draws with one row per path and
+            one column per time increment (len(time_grid) - 1 columns)
+        out - an optional ndarray of shape (paths, len(time_grid)) to build the paths in;
+            random_normal may be the view out[:, 1:], in which case no memory is allocated
+
+    Returns: An ndarray of log-price paths with shape (paths, len(time_grid)), with the
+        floating point type of random_normal
+    """
+    log_paths = calc_brownian_paths(time_grid, random_normal, out=out)
+
+    # Apply volatility and drift to the Brownian Motion in place
+    return calc_log_paths_from_brownian(drift, his_vol, time_grid, log_paths, out=log_paths)
+
+def calc_brownian_paths(time_grid: np.ndarray, random_normal: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Builds standardized Brownian Motion paths, with no drift and unit volatility, from
+    standard normal draws. Each row of the output is one path, starting at 0.
+
+    Parameters:
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        random_normal - an ndarray of standard normal draws with one row per path and
+            one column per time increment (len(time_grid) - 1 columns)
+        out - an optional ndarray of shape (paths, len(time_grid)) to build the paths in;
+            random_normal may be the view out[:, 1:]
+
+    Returns: An ndarray of Brownian Motion paths with shape (paths, len(time_grid)), with
+        the floating point type of random_normal
+    """
+    # Keep every intermediate in the precision of the draws
+    time_grid = time_grid.astype(random_normal.dtype, copy=False)
+
+    brownian = out
+    if brownian is None:
+        brownian = np.empty((random_normal.shape[0], time_grid.size), dtype=random_normal.dtype)
+
+    # Scale the normal draws to the size of each time increment and take the
+    # cumulative sum in place to simulate Brownian Motion
+    np.multiply(random_normal, np.sqrt(np.diff(time_grid)), out=brownian[:, 1:])
+    np.cumsum(brownian[:, 1:], axis=1, out=brownian[:, 1:])
+
+    # Every path starts at time zero, at the initial price
+    brownian[:, 0] = 0
+
+    return brownian
+
+def calc_log_paths_from_brownian(
+        drift: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        brownian: np.ndarray,
+        out: np.ndarray = None
+        ) -> np.ndarray:
+    """
+    Applies drift and volatility to standardized Brownian Motion paths created by 
+    calc_brownian_paths: log(Price(t)/Price(0)) = Drift*t + Volatility*Brownian Motion. 
+    The same Brownian Motion can be rescaled for any drift and volatility.
+
+    Parameters:
+        drift - the stochastic drift, expected returns - 0.5 * volatility**2
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        brownian - an ndarray of Brownian Motion paths, one row per path
+        out - an optional ndarray of the same shape to build the paths in; pass brownian
+            to rescale it in place
+
+    Returns: An ndarray of log-price paths with the same shape and type as brownian
+    """
+    log_paths = np.multiply(brownian, his_vol, out=out)
+    log_paths += drift * time_grid.astype(brownian.dtype, copy=False)
+
+    return log_paths
+
+def calc_price_paths(initial_price: float, log_paths: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+    """
+    Converts log-price paths created by calc_log_paths into prices.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        log_paths - an ndarray of log-price paths
+        out - an optional ndarray of the same shape to store the prices in; pass
+            log_paths to convert the paths in place
+
+    Returns: An ndarray of simulated prices with the same shape and type as log_paths
+    """
+    prices = np.exp(log_paths, out=out)
+
+    # Scaled in place so that a float64 initial price does not promote float32 paths
+    prices *= initial_price
+
+    return prices
+
+def calc_terminal_prices(
+        initial_price: float,
+        drift: float,
+        his_vol: float,
+        horizon_time: float,
+        random_normal: np.ndarray
+        ) -> np.ndarray:
+    """
+    Samples prices at the end of the time horizon directly. Under Geometric Brownian
+    Motion the terminal price is exactly log-normally distributed:
+    log(Price(T)/Price(0)) = Drift*T + Volatility*sqrt(T)*Z, where Z is standard normal.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        drift - the stochastic drift, expected returns - 0.5 * volatility**2
+        his_vol - a floating point number representing the asset's volatility
+        horizon_time - the time at the end of the horizon (the last value of the time grid)
+        random_normal - a 1-dimensional ndarray with one standard normal draw per simulation
+
+    Returns: A 1-dimensional ndarray of simulated prices at the end of the time horizon,
+        with the floating point type of random_normal
+    """
+    # Scaled in place so that float64 parameters do not promote float32 draws
+    prices = random_normal * random_normal.dtype.type(his_vol * np.sqrt(horizon_time))
+    prices += drift * horizon_time
+    np.exp(prices, out=prices)
+    prices *= initial_price
+
+    return prices
@@ -0,0 +1,165 @@
+import os
+
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+
+
+class PathStore:
+    """
+    Handle to simulated price paths kept in a .npy file on disk, as written by
+    run_out_of_core_simulation, for runs too large to hold in memory. The file is only
+    memory-mapped when its paths are first used. Statistics are calculated exactly,
+    streaming blocks of time steps from disk, each block holding every path and no
+    more than memory_budget bytes, so run size is limited by disk space rather than
+    memory.
+
+    __init__ Parameters:
+        filename - the .npy file of simulated prices, one row per path
+        memory_budget - the most memory a block of paths read from disk may use, in bytes
+    """
+    def __init__(self, filename: str, memory_budget: int = MEMORY_BUDGET):
+        if not isinstance(memory_budget, int) or isinstance(memory_budget, bool) or memory_budget <= 0:
+            raise ValueError(f'"memory_budget" must be a positive integer, not {memory_budget}')
+
+        # Read the array's shape and type from the file's header, without mapping it
+        with open(filename, 'rb') as file:
+            if np.lib.format.read_magic(file) == (1, 0):
+                shape, _, dtype = np.lib.format.read_array_header_1_0(file)
+            else:
+                shape, _, dtype = np.lib.format.read_array_header_2_0(file)
+
+        self._filename: str = os.fspath(filename)
+        self._shape: tuple = shape
+        self._dtype: np.dtype = dtype
+        self._memory_budget: int = memory_budget
+        self._paths: np.memmap = None
+
+    def mean(self) -> np.ndarray:
+        """
+        Calculates the mean price at each time step, accumulated in float64.
+
+        Returns: A 1-dimensional ndarray of prices, one per time step
+        """
+        return np.concatenate([block.mean(axis=0, dtype=np.float64) for _, block in self._step_blocks()])
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        """
+        Calculates the standard deviation of prices at each time step, accumulated in
+        float64.
+
+        Parameters: ddof - the delta degrees of freedom
+
+        Returns: A 1-dimensional ndarray, one standard deviation per time step
+        """
+        return np.concatenate([block.std(axis=0, ddof=ddof, dtype=np.float64) for _, block in self._step_blocks()])
+
+    def percentiles(self, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        """
+        Calculates percentiles of prices at each time step, as np.percentile.
+
+        Parameters: percentiles - the percentiles to calculate
+
+        Returns: A dictionary mapping each percentile to a 1-dimensional ndarray of
+            prices, one per time step
+        """
+        blocks = [np.percentile(block, percentiles, axis=0) for _, block in self._step_blocks()]
+
+        return dict(zip(percentiles, np.concatenate(blocks, axis=1)))
+
+    def band_summary(self, percentiles: tuple = BAND_PERCENTILES) -> BandSummary:
+        """
+        Summarizes the stored paths for visualization, as BandSummary.from_paths, in one
+        pass over the file.
+
+        Parameters: percentiles - the percentiles to calculate at each time step
+
+        Returns: A BandSummary of the stored paths
+        """
+        mean = []
+        bands = []
+        for _, block in self._step_blocks():
+            mean.append(block.mean(axis=0, dtype=np.float64))
+            bands.append(np.percentile(block, percentiles, axis=0))
+
+        return BandSummary(
+            mean=np.concatenate(mean),
+            percentiles=dict(zip(percentiles, np.concatenate(bands, axis=1))),
+            n_paths=self.n_paths
+            )
+
+    def terminal_prices(self) -> np.ndarray:
+        """
+        Reads the prices at the end of the time horizon into memory.
+
+        Returns: A 1-dimensional ndarray of terminal prices, one per path
+        """
+        return np.array(self.paths[:, -1])
+
+    def sample(self, n_paths: int, seed: int = None) -> np.ndarray:
+        """
+        Reads a random sample of the stored paths into memory (e.g., to chart them).
+
+        Parameters:
+            n_paths - the number of paths to sample; every path if there are fewer
+            seed - an integer seed for the sample; fresh entropy is used if None
+
+        Returns: An ndarray of the sampled paths' prices with one row per time step and
+            one column per path, as returned by Simulator.monte_carlo_sim
+        """
+        if n_paths >= self.n_paths:
+            return np.array(self.paths).transpose()
+
+        # Paths are read in file order, so the disk is read sequentially
+        rows = np.sort(np.random.default_rng(seed).choice(self.n_paths, size=n_paths, replace=False))
+
+        return self.paths[rows].transpose()
+
+    def close(self) -> None:
+        """Unmaps the file; it is mapped again when its paths are next used"""
+        self._paths = None
+
+    def _step_blocks(self):
+        """Yields the first time step of each block of steps and every path's prices over them"""
+        steps_per_block = max(1, self._memory_budget // max(self.n_paths * self._dtype.itemsize, 1))
+
+        for start in range(0, self.num_steps, steps_per_block):
+            yield start, np.asarray(self.paths[:, start:start + steps_per_block])
+
+    @property
+    def paths(self) -> np.memmap:
+        """The stored prices, one row per path, memory-mapped read-only when first used"""
+        if self._paths is None:
+            self._paths = np.load(self._filename, mmap_mode='r')
+
+        return self._paths
+
+    @property
+    def filename(self) -> str:
+        return self._filename
+
+    @property
+    def shape(self) -> tuple:
+        return self._shape
+
+    @property
+    def dtype(self) -> np.dtype:
+        return self._dtype
+
+    @property
+    def n_paths(self) -> int:
+        return self._shape[0]
+
+    @property
+    def num_steps(self) -> int:
+        return self._shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the stored prices on disk, in bytes"""
+        return self.n_paths * self.num_steps * self._dtype.itemsize
+
+    @property
+    def memory_budget(self) -> int:
+        return self._memory_budget
@@ -0,0 +1,130 @@
+import warnings
+
+import numpy as np
+from scipy.stats import norm, qmc
+
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+# The largest number of dimensions (time increments) supported by scipy's Sobol' engine
+MAX_SOBOL_DIMENSIONS = 21201
+
+
+class SobolRNG(SimulationRNG):
+    """
+    Quasi-Monte Carlo source of normal draws using scrambled Sobol' sequences, with
+    the same interface as SimulationRNG.
+
+    Each path is one point of a scrambled Sobol' sequence with one dimension per time
+    increment. Uniform points are converted to standard normals with the inverse
+    normal distribution, and paths are assembled with a Brownian bridge: the first
+    dimension sets the end of the path, the next sets the midpoint, and so on. The
+    most uniform, low-numbered dimensions therefore decide the overall shape of each
+    path, which makes smooth statistics like the mean and percentiles converge much
+    faster than with pseudo-random draws. Returned draws are the standardized
+    increments of the bridged paths, so they can be used wherever SimulationRNG
+    draws are. Time steps are assumed to be equally spaced, as from calc_time_grid.
+
+    The sequence is at its most uniform when the number of paths is a power of 2.
+
+    __init__ Parameters:
+        seed - an integer seed for the scrambling; fresh entropy is used if None
+    """
+    def __init__(self, seed: int = None):
+        super().__init__(seed=seed)
+        self._engines: dict = {}
+
+    def _draw_normal(self, start: int, stop: int, n_increments: int, out: np.ndarray) -> np.ndarray:
+        """Fills out with bridged normal increments of Sobol' points start to stop"""
+        # Nothing to draw for paths without increments
+        if n_increments == 0:
+            return out
+
+        if n_increments > MAX_SOBOL_DIMENSIONS:
+            raise ValueError(f'Sobol\' sampling supports at most {MAX_SOBOL_DIMENSIONS} time steps, not {n_increments}')
+
+        # Position the sequence at the first requested point
+        engine = self._sobol_engine(n_increments)
+        engine.reset()
+        if start > 0:
+            engine.fast_forward(start)
+
+        # Sobol' balance warnings are expected when chunks are not powers of 2
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=UserWarning)
+            uniform = engine.random(stop - start)
+
+        # Inverse normal transform; keeps points strictly inside (0, 1)
+        bridge_normal = norm.ppf(np.clip(uniform, 1e-12, 1 - 1e-12))
+
+        out[:] = calc_bridge_increments(bridge_normal)
+
+        return out
+
+    def _sobol_engine(self, n_increments: int) -> qmc.Sobol:
+        """Returns the scrambled Sobol' engine for this number of dimensions, creating it once"""
+        if n_increments not in self._engines:
+            self._engines[n_increments] = qmc.Sobol(d=n_increments, scramble=True, seed=self.seed)
+
+        return self._engines[n_increments]
+
+    def __getstate__(self) -> dict:
+        # Engines are rebuilt on demand rather than sent to worker processes
+        state = self.__dict__.copy()
+        state['_engines'] = {}
+
+        return state
+
+    @property
+    def bit_generator(self) -> str:
+        return 'Sobol'
+
+
+def calc_bridge_increments(bridge_normal: np.ndarray) -> np.ndarray:
+    """
+    Assembles Brownian motion with a Brownian bridge and returns its standardized
+    increments. Column k of bridge_normal fills the k-th point of the bridge order:
+    the end point first, then midpoints of ever smaller intervals.
+
+    Parameters: bridge_normal - an ndarray of standard normal draws, one row per path
+        and one column per (equally spaced) time increment
+
+    Returns: An ndarray with the same shape as bridge_normal holding the standard
+        normal increments of each bridged path
+    """
+    n_paths, n_increments = bridge_normal.shape
+
+    # Brownian motion at steps 0 to n_increments, in units of one time step
+    brownian_motion = np.zeros((n_paths, n_increments + 1))
+
+    # The end point of each path
+    brownian_motion[:, n_increments] = np.sqrt(n_increments) * bridge_normal[:, 0]
+
+    # Fill midpoints breadth-first, from the coarsest interval to the finest
+    intervals = [(0, n_increments)]
+    dimension = 1
+    while intervals:
+        next_intervals = []
+
+        for left, right in intervals:
+            # Intervals with no interior point are complete
+            if right - left < 2:
+                continue
+
+            middle = (left + right) // 2
+
+            # Mean and standard deviation of the bridge point between its neighbours
+            left_weight = (right - middle) / (right - left)
+            right_weight = (middle - left) / (right - left)
+            bridge_std = np.sqrt((middle - left) * (right - middle) / (right - left))
+
+            brownian_motion[:, middle] = left_weight * brownian_motion[:, left] \
+                + right_weight * brownian_motion[:, right] \
+                + bridge_std * bridge_normal[:, dimension]
+
+            dimension += 1
+            next_intervals.extend([(left, middle), (middle, right)])
+
+        intervals = next_intervals
+
+    return np.diff(brownian_motion, axis=1)
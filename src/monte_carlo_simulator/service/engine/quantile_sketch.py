@@ -0,0 +1,212 @@
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, SKETCH_RELATIVE_ACCURACY
+
+
+class QuantileSketch:
+    """
+    Streaming estimate of the quantiles of simulated prices at every time step, built
+    one chunk of paths at a time without storing the paths.
+
+    Prices are counted in logarithmically spaced buckets: bucket i holds prices in
+    (gamma**(i - 1), gamma**i], where gamma = (1 + relative_accuracy) / (1 - relative_accuracy).
+    Any price in a bucket is within relative_accuracy of the bucket's representative
+    value, so every quantile is estimated within relative_accuracy of the exact sample
+    quantile, whatever the distribution of prices. Prices of zero, which have no
+    logarithm, are counted in a bucket of their own. Bucket counts are integers, so
+    sketches of different chunks merge exactly, in any order.
+
+    __init__ Parameters:
+        num_steps - the number of time steps on each price path
+        relative_accuracy - the relative error bound of the quantile estimates
+    """
+    def __init__(self, num_steps: int, relative_accuracy: float = SKETCH_RELATIVE_ACCURACY):
+        if not 0 < relative_accuracy < 1:
+            raise ValueError(f'"relative_accuracy" must be between 0 and 1, not {relative_accuracy}')
+
+        self._relative_accuracy: float = relative_accuracy
+        self._log_gamma: float = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+        self._count: int = 0
+
+        # Bucket counts per time step; column j holds bucket self._offset + j
+        self._counts: np.ndarray = np.zeros((num_steps, 0), dtype=np.int64)
+        self._offset: int = 0
+
+        # Counts of prices of zero per time step, below every bucket
+        self._zero_counts: np.ndarray = np.zeros(num_steps, dtype=np.int64)
+
+        # Exact extremes, which bound the estimates
+        self._min: np.ndarray = np.full(num_steps, np.inf)
+        self._max: np.ndarray = np.full(num_steps, -np.inf)
+
+    def update(self, prices: np.ndarray, log_prices: np.ndarray = None) -> None:
+        """
+        Counts a chunk of simulated paths into the sketch.
+
+        Parameters:
+            prices - an ndarray of non-negative prices, one row per path and one column 
+                per time step
+            log_prices - optionally, the natural logarithm of prices, if already known;
+                ignored for prices of zero
+        """
+        if prices.shape[0] == 0:
+            return
+
+        # Prices of zero are only counted; the rest are bucketed by their logarithm
+        positive = prices > 0
+        has_zeros = not positive.all()
+        if has_zeros:
+            self._zero_counts += (~positive).sum(axis=0)
+
+        if log_prices is None:
+            log_prices = np.log(prices, out=np.zeros(prices.shape), where=positive)
+        elif has_zeros:
+            log_prices = np.where(positive, log_prices, 0)
+
+        # The bucket of every price
+        buckets = np.ceil(log_prices / self._log_gamma).astype(np.int64)
+        bucketed = buckets[positive] if has_zeros else buckets
+
+        if bucketed.size > 0:
+            lowest, highest = int(bucketed.min()), int(bucketed.max())
+            self._cover(lowest, highest)
+
+            # Count the buckets of all time steps at once, each step in its own range of
+            # indices spanning only the chunk's buckets
+            num_steps = self._counts.shape[0]
+            width = highest - lowest + 1
+            buckets -= lowest
+            buckets += np.arange(num_steps) * width
+            indices = buckets[positive] if has_zeros else buckets.ravel()
+
+            start = lowest - self._offset
+            self._counts[:, start:start + width] += \
+                np.bincount(indices, minlength=num_steps * width).reshape(num_steps, width)
+
+        np.minimum(self._min, prices.min(axis=0), out=self._min)
+        np.maximum(self._max, prices.max(axis=0), out=self._max)
+        self._count += prices.shape[0]
+
+    def merge(self, other: 'QuantileSketch') -> None:
+        """
+        Combines another sketch of the same time steps and accuracy into this one.
+
+        Parameters: other - a QuantileSketch of other paths
+        """
+        if other._relative_accuracy != self._relative_accuracy:
+            raise ValueError('Only sketches with the same relative accuracy can be merged.')
+
+        # Nothing to merge
+        if other._count == 0:
+            return
+
+        self._zero_counts += other._zero_counts
+
+        # Sketches of prices of zero alone have no buckets
+        if other._counts.shape[1] > 0:
+            self._cover(other._offset, other._offset + other._counts.shape[1] - 1)
+            start = other._offset - self._offset
+            self._counts[:, start:start + other._counts.shape[1]] += other._counts
+
+        np.minimum(self._min, other._min, out=self._min)
+        np.maximum(self._max, other._max, out=self._max)
+        self._count += other._count
+
+    def _cover(self, lowest: int, highest: int) -> None:
+        """Widens the bucket counts to include buckets lowest to highest"""
+        width = self._counts.shape[1]
+
+        # Buckets already covered
+        if width > 0 and lowest >= self._offset and highest < self._offset + width:
+            return
+
+        new_offset = lowest if width == 0 else min(lowest, self._offset)
+        new_width = (highest if width == 0 else max(highest, self._offset + width - 1)) - new_offset + 1
+
+        counts = np.zeros((self._counts.shape[0], new_width), dtype=np.int64)
+        counts[:, self._offset - new_offset:self._offset - new_offset + width] = self._counts
+
+        self._counts = counts
+        self._offset = new_offset
+
+    def quantiles(self, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        """
+        Estimates percentiles of the counted prices at each time step, interpolating
+        linearly between the closest ranks as np.percentile does.
+
+        Parameters: percentiles - the percentiles to estimate
+
+        Returns: A dictionary mapping each percentile to a 1-dimensional ndarray of
+            prices, one per time step
+        """
+        if self._count == 0:
+            raise ValueError('Quantile sketch is empty: no simulated paths have been added.')
+
+        # Cumulative counts of the bucket of zeros, then of each bucket
+        cumulative = np.cumsum(np.column_stack((self._zero_counts, self._counts)), axis=1)
+
+        # The representative value of each bucket, within relative_accuracy of its prices
+        bucket_values = np.concatenate((
+            [0],
+            2 * np.exp((np.arange(self._counts.shape[1]) + self._offset) * self._log_gamma) / (1 + np.exp(self._log_gamma))
+            ))
+
+        estimates = {}
+        for q in percentiles:
+            rank = q / 100 * (self._count - 1)
+            lower = int(np.floor(rank))
+            upper = min(lower + 1, self._count - 1)
+
+            # The k-th smallest price (from 0) is in the first bucket counting more than k
+            lower_value = bucket_values[(cumulative <= lower).sum(axis=1)]
+            upper_value = bucket_values[(cumulative <= upper).sum(axis=1)]
+            estimate = lower_value + (upper_value - lower_value) * (rank - lower)
+
+            estimates[q] = np.clip(estimate, self._min, self._max)
+
+        return estimates
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def relative_accuracy(self) -> float:
+        return self._relative_accuracy
+
+    @property
+    def nbytes(self) -> int:
+        """The size of the bucket counts and extremes, in bytes"""
+        return self._counts.nbytes + self._zero_counts.nbytes + self._min.nbytes + self._max.nbytes
+
+    @staticmethod
+    def estimate_nbytes(
+            num_steps: int,
+            n_simulations: int,
+            log_std: float,
+            log_drift: float = 0.0,
+            relative_accuracy: float = SKETCH_RELATIVE_ACCURACY
+            ) -> int:
+        """
+        Estimates the size of a sketch of Geometric Brownian Motion price paths, whose
+        buckets span the lowest to the highest log-price of any path at any time step.
+
+        Parameters:
+            num_steps - the number of time steps on each price path
+            n_simulations - the number of simulated paths
+            log_std - the standard deviation of log-prices at the end of the paths
+            log_drift - the mean change of log-prices over the paths
+            relative_accuracy - the relative error bound of the quantile estimates
+
+        Returns: The estimated size of the sketch in bytes
+        """
+        log_gamma = np.log((1 + relative_accuracy) / (1 - relative_accuracy))
+
+        # The most extreme of n normal draws is rarely more than sqrt(2 ln n) + 1
+        # standard deviations from their mean
+        extreme = (np.sqrt(2 * np.log(max(n_simulations, 2))) + 1) * abs(log_std)
+        log_range = abs(log_drift) + 2 * extreme
+        width = int(np.ceil(log_range / log_gamma)) + 1
+
+        # Bucket counts, then counts of zeros and the extremes, all 8 bytes per value
+        return 8 * num_steps * (width + 3)
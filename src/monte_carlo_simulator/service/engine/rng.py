@@ -0,0 +1,147 @@
+import numpy as np
+
+from monte_carlo_simulator.const import RNG_BLOCK_SIZE
+
+
+# Bit generators available for simulations, by name. PCG64 is numpy's default;
+# Philox is counter-based
+BIT_GENERATORS = {
+    'PCG64': np.random.PCG64,
+    'PCG64DXSM': np.random.PCG64DXSM,
+    'Philox': np.random.Philox,
+    'SFC64': np.random.SFC64
+    }
+
+
+class SimulationRNG:
+    """
+    Seedable source of random draws shared by the simulation engines.
+
+    Simulated paths are split into fixed blocks of block_size paths. Each block
+    draws from its own np.random.Generator, seeded by the block's child of
+    np.random.SeedSequence(seed). Any block's stream can be created directly from
+    its index without drawing the streams before it, so any range of paths can be
+    regenerated on its own, and results for a seed do not depend on how the paths
+    are chunked or divided between workers.
+
+    __init__ Parameters:
+        seed - an integer seed; fresh entropy is drawn from the operating system if None
+        bit_generator - the name of the bit generator to use, a key of BIT_GENERATORS
+        block_size - the number of paths drawn from each random stream
+    """
+    def __init__(self, seed: int = None, bit_generator: str = 'PCG64', block_size: int = RNG_BLOCK_SIZE):
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f'"bit_generator" must be one of {list(BIT_GENERATORS.keys())}, not {bit_generator}')
+        if not isinstance(block_size, int) or block_size <= 0:
+            raise ValueError(f'"block_size" must be a positive integer, not {block_size}')
+
+        self._seed_seq: np.random.SeedSequence = np.random.SeedSequence(seed)
+        self._bit_generator: str = bit_generator
+        self._block_size: int = block_size
+
+    def block_generator(self, block_index: int) -> np.random.Generator:
+        """
+        Creates the random number generator for one block of paths.
+
+        Parameters: block_index - the index of the block (paths block_index * block_size onwards)
+
+        Returns: An np.random.Generator positioned at the start of the block's stream
+        """
+        # Equivalent to SeedSequence(seed).spawn(n)[block_index], without spawning
+        # the children before it
+        block_seed = np.random.SeedSequence(self._seed_seq.entropy, spawn_key=(block_index,))
+
+        return np.random.Generator(BIT_GENERATORS[self._bit_generator](block_seed))
+
+    def standard_normal(
+            self, 
+            start: int, 
+            stop: int, 
+            n_increments: int, 
+            out: np.ndarray = None, 
+            antithetic: bool = False,
+            dtype: type = np.float64
+            ) -> np.ndarray:
+        """
+        Draws the standard normal increments of paths start to stop (exclusive). The
+        same paths always receive the same draws, whichever range they are drawn in.
+
+        Parameters:
+            start - the index of the first path
+            stop - the index after the last path
+            n_increments - the number of time increments on each path
+            out - an optional ndarray of shape (stop - start, n_increments) to fill, 
+                such as a view of a preallocated path matrix
+            antithetic - if True, paths come in pairs: every odd-numbered path mirrors
+                the draws of the path before it (Z, -Z), halving the number of draws
+            dtype - the floating point type of the output when out is None; draws are 
+                made in float64 and rounded, so float32 draws match float64 draws for 
+                the same seed
+
+        Returns: An ndarray of standard normal draws, one row per path
+        """
+        if out is None:
+            out = np.empty((stop - start, n_increments), dtype=dtype)
+
+        if antithetic:
+            return self._antithetic_normal(start, stop, n_increments, out)
+
+        return self._draw_normal(start, stop, n_increments, out)
+
+    def _draw_normal(self, start: int, stop: int, n_increments: int, out: np.ndarray) -> np.ndarray:
+        """Fills out with the draws of paths start to stop from their block streams"""
+        # Fill the output from each block overlapping the range of paths
+        for block_index in range(start // self._block_size, (stop - 1) // self._block_size + 1):
+            block_start = block_index * self._block_size
+            first_path = max(start, block_start)
+            last_path = min(stop, block_start + self._block_size)
+
+            generator = self.block_generator(block_index)
+
+            # Paths are drawn in order, so the first rows of a block do not depend on
+            # how many rows are drawn after them. Draws are made directly into out when
+            # it is a contiguous float64 array, otherwise through one block of draws
+            if first_path == block_start and out.dtype == np.float64 and out.flags.c_contiguous:
+                generator.standard_normal(out=out[first_path - start:last_path - start])
+            else:
+                block_draws = generator.standard_normal(size=(last_path - block_start, n_increments))
+                out[first_path - start:last_path - start] = block_draws[first_path - block_start:]
+
+        return out
+
+    def _antithetic_normal(self, start: int, stop: int, n_increments: int, out: np.ndarray) -> np.ndarray:
+        """Fills out with antithetic pairs; pair k uses the draws of path k"""
+        first_pair = start // 2
+
+        # Rows of out holding even paths, which take the draws, and odd paths, which
+        # take the mirrored draws
+        even_rows = out[start % 2::2]
+        odd_rows = out[1 - start % 2::2]
+
+        # From an even path, each pair's draws go straight into its even row
+        if start % 2 == 0:
+            self.standard_normal(first_pair, first_pair + len(even_rows), n_increments, out=even_rows)
+            np.negative(even_rows[:len(odd_rows)], out=odd_rows)
+
+            return out
+
+        # Otherwise the first row is the second path of a pair; draw one row per pair
+        # overlapping the range of paths
+        pair_draws = self.standard_normal(first_pair, (stop + 1) // 2, n_increments, dtype=out.dtype)
+        even_rows[:] = pair_draws[1:len(even_rows) + 1]
+        np.negative(pair_draws[:len(odd_rows)], out=odd_rows)
+
+        return out
+
+    @property
+    def seed(self) -> int:
+        """The entropy used to seed the streams; reproduces the run if passed as seed"""
+        return self._seed_seq.entropy
+
+    @property
+    def bit_generator(self) -> str:
+        return self._bit_generator
+
+    @property
+    def block_size(self) -> int:
+        return self._block_size
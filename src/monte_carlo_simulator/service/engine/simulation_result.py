@@ -0,0 +1,221 @@
+import hashlib
+from functools import cached_property
+
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator.risk_calculator import calc_terminal_stats
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+from monte_carlo_simulator.service.engine.path_store import PathStore
+
+
+class SimulationResult:
+    """
+    The output of one simulation run, shared by everything that displays or exports
+    it: the simulated price paths (or, for streamed runs, their summary) with the
+    metadata needed to reproduce them. Statistics are calculated the first time they
+    are requested and cached, so consumers share one calculation.
+
+    __init__ Parameters:
+        initial_price - the starting price of the simulated paths
+        paths - an ndarray of simulated prices with one row per time step and one
+            column per simulation, as returned by Simulator.monte_carlo_sim, or a
+            PathStore of paths kept on disk, whose statistics are streamed from the
+            file; None for runs that only kept a summary
+        summary - a BandSummary of the run, if already calculated; required without paths
+        seed - the entropy that reproduces the run's random draws
+        parameters - a dictionary of the simulation's inputs (e.g., 'his_vol')
+        data_fingerprint - a digest of the market data the inputs were calculated
+            from, as returned by calc_data_fingerprint
+        checkpoint_table - for runs with checkpoint horizons, a pandas.DataFrame of price
+            statistics at each checkpoint
+    """
+    def __init__(
+            self,
+            initial_price: float,
+            paths: np.ndarray | PathStore = None,
+            summary: BandSummary = None,
+            seed: int = None,
+            parameters: dict = None,
+            data_fingerprint: str = None,
+            checkpoint_table: pd.DataFrame = None
+            ):
+        if paths is None and summary is None:
+            raise ValueError('A simulation result needs simulated paths or a summary of them.')
+
+        # Reductions over simulations need each path, or each time step, in one block
+        if isinstance(paths, np.ndarray) and not (paths.flags.c_contiguous or paths.flags.f_contiguous):
+            paths = np.ascontiguousarray(paths)
+
+        self._initial_price: float = initial_price
+        self._paths: np.ndarray | PathStore = paths
+        self._summary: BandSummary = summary
+        self._seed: int = seed
+        self._parameters: dict = parameters if parameters is not None else {}
+        self._data_fingerprint: str = data_fingerprint
+        self._checkpoint_table: pd.DataFrame = checkpoint_table
+
+        # Percentiles calculated so far, by percentile
+        self._quantiles: dict = dict(summary.percentiles) if summary is not None else {}
+
+    def quantiles(self, percentiles: tuple = BAND_PERCENTILES) -> dict:
+        """
+        Calculates percentiles of simulated prices at each time step. Percentiles are
+        cached; those not yet calculated are calculated together, in one partition of
+        the paths. Without paths, only the summary's percentiles are available.
+
+        Parameters: percentiles - the percentiles to calculate
+
+        Returns: A dictionary mapping each percentile to a 1-dimensional ndarray of
+            prices, one per time step
+        """
+        missing = [q for q in percentiles if q not in self._quantiles]
+
+        if missing:
+            if self._paths is None:
+                raise ValueError(f'Percentiles {missing} cannot be calculated: the simulated paths were not kept.')
+
+            if isinstance(self._paths, PathStore):
+                self._quantiles.update(self._paths.percentiles(missing))
+            else:
+                self._quantiles.update(zip(missing, np.percentile(self._paths, missing, axis=1)))
+
+        return {q: self._quantiles[q] for q in percentiles}
+
+    def release_paths(self) -> None:
+        """
+        Drops the reference to the simulated paths, e.g., before their memory is reused.
+        Statistics already calculated remain available.
+        """
+        self._paths = None
+
+    @cached_property
+    def mean(self) -> np.ndarray:
+        """The mean price at each time step"""
+        if self._summary is not None:
+            return self._summary.mean
+
+        paths = self._require_paths()
+        if isinstance(paths, PathStore):
+            return paths.mean()
+
+        return paths.mean(axis=1, dtype=np.float64)
+
+    @cached_property
+    def band_summary(self) -> BandSummary:
+        """The mean and confidence band percentiles, as charted by monte_carlo_sim_vis"""
+        if self._summary is not None:
+            return self._summary
+
+        # Summarize paths on disk in one pass over the file
+        if isinstance(self._paths, PathStore) and any(q not in self._quantiles for q in BAND_PERCENTILES):
+            summary = self._paths.band_summary(BAND_PERCENTILES)
+            self._quantiles.update(summary.percentiles)
+            self.__dict__.setdefault('mean', summary.mean)
+            return summary
+
+        return BandSummary(mean=self.mean, percentiles=self.quantiles(BAND_PERCENTILES), n_paths=self.n_paths)
+
+    @cached_property
+    def terminal_prices(self) -> np.ndarray:
+        """A contiguous copy of the simulated prices at the end of the time horizon"""
+        paths = self._require_paths()
+        if isinstance(paths, PathStore):
+            return paths.terminal_prices()
+
+        return paths[-1].copy()
+
+    @cached_property
+    def terminal_stats(self) -> dict:
+        """The expected terminal price, terminal percentiles and probability of loss"""
+        return calc_terminal_stats(self.terminal_prices, self._initial_price)
+
+    @cached_property
+    def standard_errors(self) -> np.ndarray:
+        """The standard error of the mean price at each time step, relative to the mean"""
+        paths = self._require_paths()
+
+        # Sample standard deviation at each step, accumulated in float64
+        if self.n_paths <= 1:
+            std = np.full(self.num_steps, np.nan)
+        elif isinstance(paths, PathStore):
+            std = paths.std(ddof=1)
+        else:
+            std = paths.std(axis=1, ddof=1, dtype=np.float64)
+
+        return std / np.sqrt(self.n_paths) / self.mean
+
+    def _require_paths(self) -> np.ndarray:
+        """Returns the simulated paths, raising a ValueError if they were not kept"""
+        if self._paths is None:
+            raise ValueError('The simulated paths were not kept: only the mean and confidence bands are available.')
+
+        return self._paths
+
+    @property
+    def paths(self) -> np.ndarray:
+        """The simulated prices, one row per time step; memory-mapped for paths on disk"""
+        if isinstance(self._paths, PathStore):
+            return self._paths.paths.transpose()
+
+        return self._paths
+
+    @property
+    def path_store(self) -> PathStore:
+        """The PathStore of a run whose paths were kept on disk, otherwise None"""
+        return self._paths if isinstance(self._paths, PathStore) else None
+
+    @property
+    def has_paths(self) -> bool:
+        return self._paths is not None
+
+    @property
+    def initial_price(self) -> float:
+        return self._initial_price
+
+    @property
+    def n_paths(self) -> int:
+        if isinstance(self._paths, PathStore):
+            return self._paths.n_paths
+
+        return self._paths.shape[1] if self._paths is not None else self._summary.n_paths
+
+    @property
+    def num_steps(self) -> int:
+        if isinstance(self._paths, PathStore):
+            return self._paths.num_steps
+
+        return self._paths.shape[0] if self._paths is not None else self._summary.num_steps
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def parameters(self) -> dict:
+        return self._parameters
+
+    @property
+    def data_fingerprint(self) -> str:
+        return self._data_fingerprint
+
+    @property
+    def checkpoint_table(self) -> pd.DataFrame:
+        return self._checkpoint_table
+
+
+def calc_data_fingerprint(data: pd.DataFrame) -> str:
+    """
+    Calculates a digest of market data, identifying the data a simulation's inputs
+    were calculated from.
+
+    Parameters: data - a pandas.DataFrame of market data (e.g., asset prices)
+
+    Returns: A hexadecimal SHA-256 digest of the data's values and index
+    """
+    # Verify data is a DataFrame
+    if not isinstance(data, pd.DataFrame):
+        raise TypeError(f'"data" parameter must be a DataFrame, not {type(data)}')
+
+    return hashlib.sha256(pd.util.hash_pandas_object(data, index=True).values.tobytes()).hexdigest()
@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_brownian_paths, calc_horizon_time
+from monte_carlo_simulator.service.engine.qmc import SobolRNG
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+def draw_terminal_brownian(
+        time_grid: np.ndarray,
+        n_simulations: int,
+        rng: SimulationRNG,
+        antithetic: bool = False,
+        dtype: type = np.float64
+        ) -> np.ndarray:
+    """
+    Draws standardized Brownian Motion at the end of the time grid, one value per path.
+    Pseudo-random values are drawn directly, as monte_carlo_sim does for terminal prices;
+    Sobol' points fill every increment of a path together, so their paths are built and
+    only the last step kept. Forecasts rescaled from the same draws differ only through 
+    their inputs, not through sampling noise.
+
+    Parameters:
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of paths
+        rng - the SimulationRNG to draw from
+        antithetic - if True, paths are drawn in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the draws, np.float64 or np.float32
+
+    Returns: A 1-dimensional float64 ndarray of Brownian Motion values at time_grid[-1]
+    """
+    if isinstance(rng, SobolRNG):
+        random_normal = rng.standard_normal(0, n_simulations, time_grid.size - 1, antithetic=antithetic, dtype=dtype)
+        terminal_brownian = calc_brownian_paths(time_grid, random_normal)[:, -1]
+    else:
+        terminal_brownian = rng.standard_normal(0, n_simulations, 1, antithetic=antithetic, dtype=dtype)[:, 0]
+        terminal_brownian *= terminal_brownian.dtype.type(np.sqrt(time_grid[-1]))
+
+    return terminal_brownian.astype(np.float64)
+
+def calc_sweep_terminal_stats(
+        initial_price: float,
+        expected_returns: np.ndarray,
+        his_vol: np.ndarray,
+        terminal_brownian: np.ndarray,
+        horizon_time: float = 1.0,
+        percentiles: tuple = BAND_PERCENTILES,
+        memory_budget: int = MEMORY_BUDGET
+        ) -> dict:
+    """
+    Calculates terminal price statistics of Geometric Brownian Motion for many pairs of
+    expected returns and volatility from the same terminal Brownian Motion values, in
+    batches of pairs sized to the memory budget. Each pair in a batch holds its terminal
+    prices, the copy np.percentile sorts and a mask of losses, so a batch is sized to fit
+    all three.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a 1-dimensional ndarray of expected returns, one per pair
+        his_vol - a 1-dimensional ndarray of volatilities, one per pair
+        terminal_brownian - a 1-dimensional ndarray of Brownian Motion values at the end
+            of the time horizon, one per simulated path
+        horizon_time - the length of the time horizon, in the time units of
+            expected_returns and his_vol (see calc_horizon_time)
+        percentiles - the percentiles of terminal prices to calculate
+        memory_budget - the most memory a batch's terminal prices and their working copies
+            may use, in bytes
+
+    Returns: A dictionary of 1-dimensional ndarrays, one value per pair: the expected
+        terminal price ('expected_price'), each terminal price percentile (keyed by
+        percentile) and the probability of loss ('prob_loss')
+    """
+    expected_returns = np.asarray(expected_returns, dtype=np.float64)
+    his_vol = np.asarray(his_vol, dtype=np.float64)
+    terminal_brownian = terminal_brownian.astype(np.float64, copy=False)
+
+    # Calculating the stochastic drift of each pair over the time horizon
+    drift = calc_drift(expected_returns, his_vol) * horizon_time
+
+    stats = {
+        'expected_price': np.empty(drift.size),
+        **{q: np.empty(drift.size) for q in percentiles},
+        'prob_loss': np.empty(drift.size)
+        }
+
+    # The pairs whose terminal prices, percentile copy and loss mask fit in the memory
+    # budget at once
+    pair_bytes = 2 * terminal_brownian.nbytes + terminal_brownian.size
+    batch_size = max(memory_budget // (pair_bytes or 1), 1)
+
+    for start in range(0, drift.size, batch_size):
+        stop = min(start + batch_size, drift.size)
+
+        # Terminal prices of every pair in the batch, one row per pair, from the same draws
+        prices = np.multiply.outer(his_vol[start:stop], terminal_brownian)
+        prices += drift[start:stop, np.newaxis]
+        np.exp(prices, out=prices)
+        prices *= initial_price
+
+        stats['expected_price'][start:stop] = prices.mean(axis=1)
+        for q, values in zip(percentiles, np.percentile(prices, percentiles, axis=1)):
+            stats[q][start:stop] = values
+        stats['prob_loss'][start:stop] = (prices < initial_price).mean(axis=1)
+
+    return stats
+
+def run_parameter_sweep(
+        initial_price: float,
+        expected_returns: dict,
+        his_vols: dict,
+        time_grids: dict,
+        n_simulations: int,
+        rng: SimulationRNG = None,
+        antithetic: bool = False,
+        dtype: type = np.float64,
+        percentiles: tuple = BAND_PERCENTILES,
+        memory_budget: int = MEMORY_BUDGET
+        ) -> pd.DataFrame:
+    """
+    Forecasts terminal prices for every combination of expected returns method,
+    volatility window and time horizon. Each horizon's Brownian Motion is drawn once and
+    shared by every combination (see draw_terminal_brownian), so the cost of a sweep is 
+    about one simulation per horizon. Each horizon is scaled by its length in years, so 
+    longer horizons spread wider.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a dictionary mapping each expected returns method (e.g.,
+            'Simple Average Returns') to the expected returns it calculated
+        his_vols - a dictionary mapping each volatility window to the volatility
+            calculated over it
+        time_grids - a dictionary mapping each time horizon (in months) to its time
+            grid, as created by calc_time_grid
+        n_simulations - the number of simulations run for each horizon
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+        percentiles - the percentiles of terminal prices to calculate
+        memory_budget - the most memory a batch's terminal prices and their working copies
+            may use, in bytes
+
+    Returns: A pandas.DataFrame with one row per combination: its time_horizon,
+        exp_ret_flag, standev_window, expected_returns and his_vol, then the expected
+        terminal price, each terminal price percentile and the probability of loss
+    """
+    if rng is None:
+        rng = SimulationRNG()
+
+    # Every pairing of expected returns and volatility, simulated at each horizon
+    index = pd.MultiIndex.from_product(
+        [list(expected_returns.keys()), list(his_vols.keys())], names=['exp_ret_flag', 'standev_window'])
+    pairs = pd.DataFrame(
+        {
+            'expected_returns': np.repeat(list(expected_returns.values()), len(his_vols)),
+            'his_vol': np.tile(list(his_vols.values()), len(expected_returns))
+            },
+        index=index
+        ).reset_index()
+
+    tables = []
+    for time_horizon, time_grid in time_grids.items():
+        # The time grid spans one unit whatever the horizon, so scale by its length
+        horizon_time = calc_horizon_time(time_horizon)
+
+        # One set of terminal Brownian Motion values, shared by every pair at this horizon
+        terminal_brownian = draw_terminal_brownian(time_grid, n_simulations, rng, antithetic, dtype)
+        terminal_brownian *= np.sqrt(horizon_time / time_grid[-1]) if time_grid[-1] > 0 else 0
+
+        stats = calc_sweep_terminal_stats(
+            initial_price, pairs['expected_returns'].to_numpy(), pairs['his_vol'].to_numpy(),
+            terminal_brownian, horizon_time, percentiles, memory_budget
+            )
+
+        tables.append(pd.concat([pairs.assign(time_horizon=time_horizon), pd.DataFrame(stats)], axis=1))
+
+    table = pd.concat(tables, ignore_index=True)
+
+    # Identify each row by its inputs first
+    columns = ['time_horizon', 'exp_ret_flag', 'standev_window', 'expected_returns', 'his_vol']
+    return table[columns + [column for column in table.columns if column not in columns]]
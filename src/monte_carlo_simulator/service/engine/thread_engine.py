@@ -0,0 +1,111 @@
+import copy
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from monte_carlo_simulator.const import DEFAULT_CHUNK_SIZE, GIL_THREAD_LIMIT
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+
+
+def is_gil_enabled() -> bool:
+    """
+    Returns False when running on a free-threaded build of Python (3.13t or later) with
+    the GIL disabled, where threads run Python code in parallel, and True otherwise.
+    """
+    return getattr(sys, '_is_gil_enabled', lambda: True)()
+
+def default_thread_count() -> int:
+    """
+    Chooses the number of simulation threads: one per CPU on free-threaded Python, and
+    at most GIL_THREAD_LIMIT with the GIL, where only NumPy's array loops (random
+    fills, exp, cumsum) run in parallel and more threads mostly wait for the GIL.
+
+    Returns: An integer with the number of threads
+    """
+    n_cpus = os.cpu_count() or 1
+
+    if is_gil_enabled():
+        return min(n_cpus, GIL_THREAD_LIMIT)
+
+    return n_cpus
+
+def run_threaded_simulation(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        n_simulations: int,
+        rng: SimulationRNG = None,
+        n_threads: int = None,
+        block_size: int = DEFAULT_CHUNK_SIZE,
+        antithetic: bool = False,
+        dtype: type = np.float64,
+        out: np.ndarray = None
+        ) -> np.ndarray:
+    """
+    Simulates Geometric Brownian Motion price paths on a pool of threads, each building
+    a contiguous range of paths in place in one shared output array. Unlike worker
+    processes, threads need no pickling or start-up and return no copies, so the pool
+    is cheap enough to use inside the GUI process. NumPy releases the GIL in its random
+    fills and array loops; on free-threaded Python the threads run fully in parallel.
+
+    Each thread draws from its own copy of rng. The draws of every path come from its
+    block's random stream, so results for a seed are bit-for-bit identical to a
+    single-threaded run, however many threads are used.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of simulations to be run
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        n_threads - the number of threads; defaults to default_thread_count()
+        block_size - the number of paths each thread builds at a time
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+        out - an optional C-contiguous ndarray of shape (n_simulations, len(time_grid))
+            and type dtype to build the paths in
+
+    Returns: An ndarray of simulated prices with one row per path
+    """
+    drift = calc_drift(expected_returns, his_vol)
+
+    if rng is None:
+        rng = SimulationRNG()
+
+    if n_threads is None:
+        n_threads = default_thread_count()
+
+    if out is None:
+        out = np.empty((n_simulations, time_grid.size), dtype=dtype)
+
+    # One contiguous range of paths per thread, split on block boundaries
+    n_blocks = -(-n_simulations // block_size)
+    range_starts = [block_size * (n_blocks * thread // n_threads) for thread in range(n_threads)]
+    range_stops = range_starts[1:] + [n_simulations]
+
+    def simulate_range(start: int, stop: int) -> None:
+        # Random sources may keep state between draws, so each thread has its own
+        thread_rng = copy.copy(rng)
+
+        for block_start in range(start, stop, block_size):
+            block = out[block_start:min(block_start + block_size, stop)]
+
+            # Draw into the columns after the initial price, then build the paths over them
+            random_normal = thread_rng.standard_normal(
+                block_start, block_start + block.shape[0], time_grid.size - 1,
+                out=block[:, 1:], antithetic=antithetic, dtype=dtype)
+            log_paths = calc_log_paths(drift, his_vol, time_grid, random_normal, out=block)
+            calc_price_paths(initial_price, log_paths, out=log_paths)
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        # Surface any exception raised by a thread
+        for future in [executor.submit(simulate_range, start, stop) for start, stop in zip(range_starts, range_stops) if start < stop]:
+            future.result()
+
+    return out
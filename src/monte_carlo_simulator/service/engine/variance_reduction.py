@@ -0,0 +1,166 @@
+import numpy as np
+
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift, calc_log_paths, calc_price_paths
+
+
+# Variance reduction methods applied after the normal draws are generated
+VARIANCE_REDUCTION_METHODS = ('moment_matching', 'control_variate', 'both')
+
+
+class VarianceReductionReport:
+    """
+    Describes the effect of variance reduction on a simulation run, measured against
+    the known expectation of Geometric Brownian Motion, E[Price(T)] = Price(0) * e^(Return*T).
+
+    __init__ Parameters:
+        method - the variance reduction method applied, one of VARIANCE_REDUCTION_METHODS
+        mean_error_before - the relative error of the simulated terminal mean before correction
+        mean_error_after - the relative error of the simulated terminal mean after correction
+        variance_ratio - with the control variate, the estimated variance of the uncorrected
+            terminal mean divided by the variance of the corrected mean, 1/(1 - rho**2), where
+            rho is the correlation between terminal prices and terminal Brownian Motion; the
+            number of times more simulations needed for the same precision without correction.
+            None for moment matching alone, which has no such estimate from a single run
+        n_paths - the number of simulated price paths
+    """
+    def __init__(self, method: str, mean_error_before: float, mean_error_after: float, variance_ratio: float | None, n_paths: int):
+        self._method: str = method
+        self._mean_error_before: float = mean_error_before
+        self._mean_error_after: float = mean_error_after
+        self._variance_ratio: float | None = variance_ratio
+        self._n_paths: int = n_paths
+
+    @property
+    def method(self) -> str:
+        return self._method
+
+    @property
+    def mean_error_before(self) -> float:
+        return self._mean_error_before
+
+    @property
+    def mean_error_after(self) -> float:
+        return self._mean_error_after
+
+    @property
+    def variance_ratio(self) -> float | None:
+        return self._variance_ratio
+
+    @property
+    def n_paths(self) -> int:
+        return self._n_paths
+
+
+def moment_match(random_normal: np.ndarray) -> np.ndarray:
+    """
+    Standardizes normal draws in place so that each time increment has a sample mean
+    of exactly 0 and a sample standard deviation of exactly 1 across paths.
+
+    Parameters: random_normal - an ndarray of standard normal draws with one row per
+        path and one column per time increment
+
+    Returns: The same ndarray, with matched moments
+    """
+    # Moments cannot be matched with fewer than two paths
+    if random_normal.shape[0] < 2:
+        return random_normal
+
+    random_normal -= random_normal.mean(axis=0)
+
+    # Leave columns with no spread centred but unscaled
+    std = random_normal.std(axis=0)
+    random_normal /= np.where(std > 0, std, 1)
+
+    return random_normal
+
+def control_variate_adjust(prices: np.ndarray, brownian_motion: np.ndarray) -> np.ndarray:
+    """
+    Corrects simulated prices with Brownian Motion as a control variate. Brownian
+    Motion has a known mean of 0, so any sample mean away from 0 is simulation error;
+    prices at each time step are shifted by the part of that error they are correlated
+    with, b(t) * mean(W(t)), where b(t) = Cov(Price(t), W(t)) / Var(W(t)). The shape of
+    the distribution at each step is unchanged.
+
+    Parameters:
+        prices - an ndarray of simulated prices with one row per path; changed in place
+        brownian_motion - an ndarray of the Brownian Motion that generated the prices,
+            with the same shape
+
+    Returns: The adjusted prices ndarray
+    """
+    # The regression coefficient of prices on Brownian Motion at each time step
+    w_centred = brownian_motion - brownian_motion.mean(axis=0)
+    w_variance = np.mean(w_centred**2, axis=0)
+    covariance = np.mean(w_centred * (prices - prices.mean(axis=0)), axis=0)
+    coefficients = np.divide(covariance, w_variance, out=np.zeros_like(covariance), where=w_variance > 0)
+
+    prices -= coefficients * brownian_motion.mean(axis=0)
+
+    return prices
+
+def simulate_reduced_variance(
+        initial_price: float,
+        expected_returns: float,
+        his_vol: float,
+        time_grid: np.ndarray,
+        random_normal: np.ndarray,
+        method: str
+        ) -> tuple[np.ndarray, VarianceReductionReport]:
+    """
+    Simulates Geometric Brownian Motion price paths with variance reduction and
+    measures its effect on the terminal mean.
+
+    Parameters:
+        initial_price - the starting price of the asset
+        expected_returns - a floating point number representing the expected returns of
+            the asset
+        his_vol - a floating point number representing the asset's volatility
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        random_normal - an ndarray of standard normal draws with one row per path and
+            one column per time increment; moment matching changes it in place
+        method - 'moment_matching' to standardize the normal draws, 'control_variate'
+            to correct prices against Brownian Motion, or 'both'
+
+    Returns: A tuple of an ndarray of price paths with one row per path and a
+        VarianceReductionReport
+    """
+    if method not in VARIANCE_REDUCTION_METHODS:
+        raise ValueError(f'"method" must be one of {list(VARIANCE_REDUCTION_METHODS)}, not {method}')
+
+    drift = calc_drift(expected_returns, his_vol)
+
+    # The exact expected terminal price
+    exact_mean = initial_price * np.exp(expected_returns * time_grid[-1])
+
+    # Terminal Brownian Motion and prices of the uncorrected draws
+    terminal_bm = random_normal @ np.sqrt(np.diff(time_grid))
+    terminal_prices = initial_price * np.exp(drift * time_grid[-1] + his_vol * terminal_bm)
+    mean_error_before = abs(terminal_prices.mean() / exact_mean - 1)
+
+    if method in ('moment_matching', 'both'):
+        moment_match(random_normal)
+
+    prices = calc_price_paths(initial_price, calc_log_paths(drift, his_vol, time_grid, random_normal))
+
+    if method in ('control_variate', 'both'):
+        # Brownian Motion is the log-price path with no drift and unit volatility
+        control_variate_adjust(prices, calc_log_paths(0, 1, time_grid, random_normal))
+
+    return prices, VarianceReductionReport(
+        method=method,
+        mean_error_before=float(mean_error_before),
+        mean_error_after=float(abs(prices[:, -1].mean() / exact_mean - 1)),
+        variance_ratio=_calc_variance_ratio(terminal_prices, terminal_bm) if method != 'moment_matching' else None,
+        n_paths=random_normal.shape[0]
+        )
+
+def _calc_variance_ratio(terminal_prices: np.ndarray, terminal_bm: np.ndarray) -> float:
+    """Estimates 1/(1 - rho**2) for the correlation of terminal prices and Brownian Motion"""
+    # No reduction can be measured without spread in both samples
+    if terminal_prices.size < 2 or np.ptp(terminal_prices) == 0 or np.ptp(terminal_bm) == 0:
+        return 1.0
+
+    rho = np.corrcoef(terminal_prices, terminal_bm)[0, 1]
+
+    # Perfectly correlated samples leave no variance to reduce
+    return float(1 / max(1 - rho**2, np.finfo(float).eps))
@@ -0,0 +1,193 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+from scipy.stats import norm
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET
+from monte_carlo_simulator.service.calculator.score_calculator import calc_crps, calc_lognormal_crps
+from monte_carlo_simulator.service.engine.path_kernel import calc_drift
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+from monte_carlo_simulator.service.engine.sweep_engine import calc_sweep_terminal_stats, draw_terminal_brownian
+from monte_carlo_simulator.service.engine.thread_engine import default_thread_count
+
+
+def calc_walk_forward_origins(n_prices: int, horizon_steps: int, origin_step: int, min_history: int) -> np.ndarray:
+    """
+    Chooses the forecast origins of a walk-forward backtest: every origin_step-th index
+    of the price history with at least min_history prices before it and horizon_steps
+    prices from it, ending at the last origin whose horizon is fully observed.
+
+    Parameters:
+        n_prices - the number of prices in the asset data
+        horizon_steps - the number of prices in each testing period, starting with the
+            price at the origin
+        origin_step - the number of prices between consecutive origins
+        min_history - the fewest prices before an origin needed to calculate its inputs
+
+    Returns: A 1-dimensional ndarray of origin indices, in ascending order
+    """
+    if not isinstance(origin_step, int) or isinstance(origin_step, bool) or origin_step <= 0:
+        raise ValueError(f'"origin_step" must be a positive integer, not {origin_step}')
+
+    # Step back from the last origin, so the most recent testing period is always included
+    last_origin = n_prices - horizon_steps
+
+    return np.arange(last_origin, min_history - 1, -origin_step)[::-1]
+
+def run_walk_forward(
+        initial_prices: np.ndarray,
+        actual_prices: np.ndarray,
+        expected_returns: np.ndarray,
+        his_vols: np.ndarray,
+        time_grid: np.ndarray,
+        n_simulations: int = 1000,
+        rng: SimulationRNG = None,
+        analytic: bool = False,
+        n_threads: int = None,
+        antithetic: bool = False,
+        dtype: type = np.float64,
+        percentiles: tuple = BAND_PERCENTILES,
+        memory_budget: int = MEMORY_BUDGET,
+        origins: pd.Index = None,
+        horizon_time: float = None,
+        sorted_brownian: np.ndarray = None
+        ) -> pd.DataFrame:
+    """
+    Forecasts the terminal price at many forecast origins and records where the actual
+    price landed in each forecast. One set of terminal Brownian Motion values is drawn
+    (see draw_terminal_brownian) and shared by every origin, so the cost of a
+    backtest is about one simulation; the origins are then evaluated, vectorized, on a
+    pool of threads. With analytic, the log-normal terminal distribution is used in
+    closed form instead, with no random draws.
+
+    Parameters:
+        initial_prices - a 1-dimensional ndarray with the price at each origin
+        actual_prices - a 1-dimensional ndarray with the price observed at the end of
+            each origin's time horizon
+        expected_returns - a 1-dimensional ndarray with the expected returns calculated
+            at each origin
+        his_vols - a 1-dimensional ndarray with the volatility calculated at each origin
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        n_simulations - the number of simulations shared by every origin
+        rng - the SimulationRNG to draw from; a freshly seeded one is used if None
+        analytic - if True, the terminal distribution is calculated in closed form
+        n_threads - the number of threads evaluating origins; defaults to
+            default_thread_count()
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+        percentiles - the percentiles of terminal prices to calculate
+        memory_budget - the most memory the terminal prices of a batch may use, in bytes
+        origins - an optional index labelling the origins (e.g., their dates)
+        horizon_time - the length of each origin's time horizon, in the time units of
+            expected_returns and his_vols (see calc_horizon_time); the span of the time
+            grid, as in monte_carlo_sim, if None
+        sorted_brownian - Brownian Motion values at the end of the time grid in ascending
+            order, as drawn by draw_terminal_brownian, to share with other backtests; drawn
+            from rng if None
+
+    Returns: A pandas.DataFrame with one row per origin: its initial_price,
+        expected_returns, his_vol and actual_price, then the expected terminal price,
+        each terminal price percentile, the probability of loss, the probability
+        integral transform of the actual price ('pit'), the forecast probability of a
+        price at or below it, and the continuous ranked probability score of the
+        forecast ('crps'; see calc_crps)
+    """
+    initial_prices = np.asarray(initial_prices, dtype=np.float64)
+    actual_prices = np.asarray(actual_prices, dtype=np.float64)
+    expected_returns = np.asarray(expected_returns, dtype=np.float64)
+    his_vols = np.asarray(his_vols, dtype=np.float64)
+    if horizon_time is None:
+        horizon_time = time_grid[-1]
+
+    # Calculating the stochastic drift of each origin over the time horizon
+    drift = calc_drift(expected_returns, his_vols) * horizon_time
+
+    # The terminal log-return at which each actual price landed, in units of volatility
+    with np.errstate(divide='ignore', invalid='ignore'):
+        landed = (np.log(actual_prices / initial_prices) - drift) / his_vols
+
+    if analytic:
+        # Terminal log-prices are normally distributed, with this standard deviation
+        log_std = his_vols * np.sqrt(horizon_time)
+
+        stats = {
+            'expected_price': initial_prices * np.exp(expected_returns * horizon_time),
+            **{q: initial_prices * np.exp(drift + norm.ppf(q / 100) * log_std) for q in percentiles},
+            'prob_loss': norm.cdf(-drift / log_std),
+            'pit': norm.cdf(landed / np.sqrt(horizon_time)),
+            'crps': calc_lognormal_crps(np.log(initial_prices) + drift, log_std, actual_prices)
+            }
+
+    else:
+        if n_threads is None:
+            n_threads = default_thread_count()
+
+        # One set of terminal Brownian Motion values, shared by every origin
+        if sorted_brownian is None:
+            sorted_brownian = np.sort(
+                draw_terminal_brownian(time_grid, n_simulations, rng or SimulationRNG(), antithetic, dtype))
+        n_simulations = sorted_brownian.size
+
+        # Brownian Motion at the end of the horizon, which the time grid spans in one unit;
+        # statistics of terminal prices do not depend on the order of the draws
+        if time_grid[-1] > 0:
+            sorted_brownian = sorted_brownian * np.sqrt(horizon_time / time_grid[-1])
+        terminal_brownian = sorted_brownian
+
+        # Statistics of terminal prices relative to the initial price, which scale with it
+        stats = {
+            'expected_price': np.empty(drift.size),
+            **{q: np.empty(drift.size) for q in percentiles},
+            'prob_loss': np.empty(drift.size)
+            }
+        crps = np.empty(drift.size)
+
+        # The origins whose sorted terminal prices fit in a thread's share of the memory
+        # budget at once
+        batch_size = max(memory_budget // n_threads // (terminal_brownian.nbytes or 1), 1)
+
+        def evaluate_range(start: int, stop: int) -> None:
+            range_stats = calc_sweep_terminal_stats(
+                1.0, expected_returns[start:stop], his_vols[start:stop], terminal_brownian,
+                horizon_time, percentiles, memory_budget // n_threads
+                )
+            for key, values in range_stats.items():
+                stats[key][start:stop] = values
+
+            # Terminal prices relative to the initial price keep the order of the sorted
+            # draws, so each origin's CRPS is calculated without sorting again
+            for batch_start in range(start, stop, batch_size):
+                batch = slice(batch_start, min(batch_start + batch_size, stop))
+                prices = np.exp(drift[batch, np.newaxis] + his_vols[batch, np.newaxis] * sorted_brownian)
+                crps[batch] = calc_crps(
+                    prices, actual_prices[batch] / initial_prices[batch], is_sorted=True) * initial_prices[batch]
+
+        # One contiguous range of origins per thread
+        range_starts = [drift.size * thread // n_threads for thread in range(n_threads)]
+        range_stops = range_starts[1:] + [drift.size]
+
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            # Surface any exception raised by a thread
+            for future in [executor.submit(evaluate_range, start, stop) for start, stop in zip(range_starts, range_stops) if start < stop]:
+                future.result()
+
+        stats['expected_price'] *= initial_prices
+        for q in percentiles:
+            stats[q] *= initial_prices
+
+        # The proportion of simulated terminal prices at or below each actual price
+        pit = np.searchsorted(sorted_brownian, landed, side='right') / n_simulations
+        stats['pit'] = np.where(np.isnan(landed), np.nan, pit)
+        stats['crps'] = crps
+
+    return pd.DataFrame(
+        {
+            'initial_price': initial_prices,
+            'expected_returns': expected_returns,
+            'his_vol': his_vols,
+            'actual_price': actual_prices,
+            **stats
+            },
+        index=origins
+        )
@@ -0,0 +1,456 @@
+import itertools
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, MEMORY_BUDGET, WINDOW_SEARCH_METRICS
+from monte_carlo_simulator.service.engine.forecast_scores import ForecastScores, score_walk_forward
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+from monte_carlo_simulator.service.engine.sweep_engine import draw_terminal_brownian
+from monte_carlo_simulator.service.engine.thread_engine import default_thread_count
+from monte_carlo_simulator.service.engine.walk_forward_engine import run_walk_forward
+
+
+class RollingMoments:
+    """
+    Running sums of an asset's returns, calculated once per price history, from which
+    the rolling volatility (as calc_rolling_volatility) and rolling expected returns
+    (as calc_rolling_exp_returns) of any window are calculated in one vectorized
+    subtraction, without another pass over the data for each window.
+
+    __init__ Parameters:
+        prices - a 1-dimensional ndarray or pandas.Series of closing prices, oldest first
+    """
+    def __init__(self, prices: np.ndarray | pd.Series):
+        prices = np.asarray(prices, dtype=np.float64)
+
+        # The return at each date; the first price has none
+        pct_returns = np.full(prices.size, np.nan)
+        pct_returns[1:] = prices[1:] / prices[:-1] - 1
+        log_returns = np.log(pct_returns + 1)
+
+        # Returns centred on their mean, so that the running sums of squares stay accurate
+        self._log_mean: float = float(np.nanmean(log_returns)) if prices.size > 1 else 0.0
+        self._pct_mean: float = float(np.nanmean(pct_returns)) if prices.size > 1 else 0.0
+        centred_log = log_returns[1:] - self._log_mean
+
+        # Sums of the first k returns after the first price, for every k
+        self._log_sums: np.ndarray = np.concatenate(([0], np.cumsum(centred_log)))
+        self._log_sums_of_squares: np.ndarray = np.concatenate(([0], np.cumsum(centred_log**2)))
+        self._pct_sums: np.ndarray = np.concatenate(([0], np.cumsum(pct_returns[1:] - self._pct_mean)))
+
+        self._pct_returns: np.ndarray = pct_returns
+        self._prices: np.ndarray = prices
+
+        # Exponential weighted averages calculated so far, by span
+        self._ewm_returns: dict = {}
+
+    def volatility(self, standev_window: int) -> np.ndarray:
+        """
+        Calculates historical volatility at every date, as calc_rolling_volatility does.
+
+        Parameters: standev_window - the number of returns in each window
+
+        Returns: A 1-dimensional ndarray of volatilities, one per price; NaN for dates
+            with fewer than standev_window returns up to them
+        """
+        self._verify_window('standev_window', standev_window)
+
+        volatility = np.full(self.n_prices, np.nan)
+        if standev_window < 2 or standev_window >= self.n_prices:
+            return volatility
+
+        # Sums of the returns of each window ending on a date with a full window
+        sums = self._log_sums[standev_window:] - self._log_sums[:-standev_window]
+        sums_of_squares = self._log_sums_of_squares[standev_window:] - self._log_sums_of_squares[:-standev_window]
+
+        # Standard deviation using denominator degrees of freedom of 1
+        variances = np.maximum((sums_of_squares - sums**2 / standev_window) / (standev_window - 1), 0)
+        volatility[standev_window:] = np.sqrt(variances) * np.sqrt(standev_window)
+
+        return volatility
+
+    def expected_returns(self, exp_ret_flag: str, returns_window: int) -> np.ndarray:
+        """
+        Calculates expected returns at every date, as calc_rolling_exp_returns does.
+        Exponential weighted averages are calculated once per span and kept.
+
+        Parameters:
+            exp_ret_flag - 'Simple Average Returns' or 'Exponential Weighted Average Returns'
+            returns_window - the number of prices in each window, or the span of the
+                exponential weighted average
+
+        Returns: A 1-dimensional ndarray of expected returns, one per price; NaN for dates
+            with fewer than returns_window prices up to them, for simple average returns
+        """
+        self._verify_window('returns_window', returns_window)
+
+        match exp_ret_flag:
+
+            case 'Simple Average Returns':
+                # The average of the returns between the last returns_window prices
+                n_returns = returns_window - 1
+                expected_returns = np.full(self.n_prices, np.nan)
+                if 0 < n_returns < self.n_prices:
+                    sums = self._pct_sums[n_returns:] - self._pct_sums[:-n_returns]
+                    expected_returns[n_returns:] = sums / n_returns + self._pct_mean
+
+                return expected_returns
+
+            case 'Exponential Weighted Average Returns':
+                if returns_window not in self._ewm_returns:
+                    self._ewm_returns[returns_window] = pd.Series(self._pct_returns) \
+                        .ewm(span=returns_window, adjust=False) \
+                        .mean() \
+                        .to_numpy()
+
+                return self._ewm_returns[returns_window]
+
+        raise ValueError(f'Rolling expected returns cannot be calculated with "{exp_ret_flag}"')
+
+    @staticmethod
+    def _verify_window(name: str, window: int) -> None:
+        """Raises an error unless window is a positive integer"""
+        if not isinstance(window, (int, np.integer)) or isinstance(window, bool):
+            raise TypeError(f'"{name}" must be a positive integer, not {type(window)}')
+        if window <= 0:
+            raise ValueError(f'"{name}" must be a positive integer, not {window}')
+
+    @property
+    def prices(self) -> np.ndarray:
+        return self._prices
+
+    @property
+    def n_prices(self) -> int:
+        return self._prices.size
+
+
+class WindowSearchResult:
+    """
+    The trials of a window search, each scored by a walk-forward backtest over the
+    same forecast origins, and the windows of the best one.
+
+    __init__ Parameters:
+        trials - a pandas.DataFrame with one row per trial, in the order they were run:
+            its standev_window and returns_window, its score, and its walk-forward scores
+        exp_ret_flag - the returns calculation method whose windows were searched
+        metric - the score minimized, one of WINDOW_SEARCH_METRICS
+        stopped_early - True if the search stopped before running every candidate
+    """
+    def __init__(self, trials: pd.DataFrame, exp_ret_flag: str, metric: str, stopped_early: bool = False):
+        self._trials: pd.DataFrame = trials
+        self._exp_ret_flag: str = exp_ret_flag
+        self._metric: str = metric
+        self._stopped_early: bool = stopped_early
+
+    @property
+    def trials(self) -> pd.DataFrame:
+        return self._trials
+
+    @property
+    def best_trial(self) -> pd.Series:
+        """The trial with the lowest score; trials without a score are never the best"""
+        return self._trials.loc[self._trials['score'].idxmin()]
+
+    @property
+    def best_windows(self) -> dict:
+        """The standev_window and returns_window of the best trial; returns_window is None
+        for methods without one"""
+        best = self.best_trial
+
+        return {
+            'standev_window': int(best['standev_window']),
+            'returns_window': None if pd.isna(best['returns_window']) else int(best['returns_window'])
+            }
+
+    @property
+    def best_score(self) -> float:
+        return float(self.best_trial['score'])
+
+    @property
+    def exp_ret_flag(self) -> str:
+        return self._exp_ret_flag
+
+    @property
+    def metric(self) -> str:
+        return self._metric
+
+    @property
+    def stopped_early(self) -> bool:
+        return self._stopped_early
+
+    @property
+    def n_trials(self) -> int:
+        return len(self._trials)
+
+    def to_dict(self) -> dict:
+        """The best windows with how they were found, ready to be written as JSON"""
+        return {
+            **self.best_windows,
+            'metric': self._metric,
+            'score': self.best_score,
+            'n_trials': self.n_trials,
+            'stopped_early': self._stopped_early
+            }
+
+
+def calc_window_candidates(
+        standev_windows: list,
+        returns_windows: list = (None,),
+        search: str = 'grid',
+        n_trials: int = None,
+        seed: int = None
+        ) -> list:
+    """
+    Chooses the candidate windows of a window search: every combination of volatility
+    and returns window, or, for a random search, n_trials of them drawn without
+    replacement.
+
+    Parameters:
+        standev_windows - a list of volatility windows
+        returns_windows - a list of returns windows; (None,) for methods without one
+        search - 'grid' or 'random'
+        n_trials - the number of combinations drawn by a random search; every
+            combination if None
+        seed - an integer seed for the draws of a random search
+
+    Returns: A list of (standev_window, returns_window) tuples, in the order to be tried
+    """
+    grid = list(itertools.product(standev_windows, returns_windows))
+
+    match search:
+
+        case 'grid':
+            return grid
+
+        case 'random':
+            if n_trials is None:
+                n_trials = len(grid)
+            if not isinstance(n_trials, int) or isinstance(n_trials, bool) or n_trials <= 0:
+                raise ValueError(f'"n_trials" must be a positive integer, not {n_trials}')
+
+            picks = np.random.default_rng(seed).choice(len(grid), size=min(n_trials, len(grid)), replace=False)
+            return [grid[pick] for pick in picks]
+
+    raise ValueError(f'"search" must be \'grid\' or \'random\', not {search}')
+
+def calc_search_score(scores: ForecastScores, metric: str = 'crps') -> float:
+    """
+    Reduces the walk-forward scores of a trial to the single score a window search
+    minimizes.
+
+    Parameters:
+        scores - the ForecastScores of a walk-forward backtest
+        metric - 'crps' for the mean CRPS, 'pinball' for the mean pinball loss over the
+            band percentiles, or 'coverage' for the mean distance of each band's
+            coverage from its nominal coverage
+
+    Returns: A float, lower for better forecasts
+    """
+    match metric:
+
+        case 'crps':
+            return scores.mean_crps
+
+        case 'pinball':
+            return float(np.mean(list(scores.mean_pinball.values())))
+
+        case 'coverage':
+            return float(np.mean([abs(rate - band / 100) for band, rate in scores.coverage_rates.items()]))
+
+    raise ValueError(f'"metric" must be among {list(WINDOW_SEARCH_METRICS)}, not {metric}')
+
+def run_window_search(
+        moments: RollingMoments,
+        exp_ret_flag: str,
+        standev_windows: list,
+        returns_windows: list,
+        origins: np.ndarray,
+        horizon_steps: int,
+        time_grid: np.ndarray,
+        expected_returns: np.ndarray = None,
+        search: str = 'grid',
+        n_trials: int = None,
+        metric: str = 'crps',
+        patience: int = None,
+        n_simulations: int = 1000,
+        rng: SimulationRNG = None,
+        analytic: bool = False,
+        n_threads: int = None,
+        antithetic: bool = False,
+        dtype: type = np.float64,
+        percentiles: tuple = BAND_PERCENTILES,
+        memory_budget: int = MEMORY_BUDGET,
+        seed: int = None,
+        horizon_time: float = None
+        ) -> WindowSearchResult:
+    """
+    Searches for the volatility and returns windows whose forecasts score best in a
+    walk-forward backtest (see run_walk_forward). Every trial's inputs are sliced from
+    the same RollingMoments, its forecasts share the same origins and the terminal
+    Brownian Motion drawn once before any trial runs, and trials run in rounds of
+    n_threads, one per thread. With patience, the search stops
+    after a round ends patience or more trials since the best score last improved.
+
+    Parameters:
+        moments - the RollingMoments of the asset's prices
+        exp_ret_flag - the returns calculation method whose windows are searched
+        standev_windows - a list of candidate volatility windows
+        returns_windows - a list of candidate returns windows; ignored with
+            expected_returns
+        origins - a 1-dimensional ndarray of origin indices into the prices, as chosen by
+            calc_walk_forward_origins, each with a full window of every candidate before it
+        horizon_steps - the number of prices in each testing period, starting with the
+            price at the origin
+        time_grid - a 1-dimensional ndarray of times, as created by calc_time_grid
+        expected_returns - a 1-dimensional ndarray of expected returns at each origin,
+            for methods without a returns window (e.g., the Capital Asset Pricing Model)
+        search - 'grid' to try every combination of windows, or 'random' to try n_trials
+            of them (see calc_window_candidates)
+        n_trials - the number of combinations tried by a random search
+        metric - the score minimized, one of WINDOW_SEARCH_METRICS (see calc_search_score)
+        patience - the number of trials without improvement after which the search
+            stops; every candidate is tried if None
+        n_simulations - the number of simulations shared by every origin
+        rng - the SimulationRNG the shared draws are taken from; a freshly seeded one is
+            used if None
+        analytic - if True, terminal distributions are calculated in closed form
+        n_threads - the number of trials run at once; defaults to default_thread_count()
+        antithetic - if True, paths are simulated in antithetic pairs (Z, -Z)
+        dtype - the floating point type of the simulated paths, np.float64 or np.float32
+        percentiles - the band percentiles scored
+        memory_budget - the most memory the trials running at once may use, in bytes
+        seed - an integer seed for the candidates drawn by a random search
+        horizon_time - the length of each origin's time horizon, in the time units of the
+            expected returns and volatility (see run_walk_forward)
+
+    Returns: A WindowSearchResult of every trial run
+    """
+    if metric not in WINDOW_SEARCH_METRICS:
+        raise ValueError(f'"metric" must be among {list(WINDOW_SEARCH_METRICS)}, not {metric}')
+    if patience is not None and (not isinstance(patience, int) or isinstance(patience, bool) or patience <= 0):
+        raise ValueError(f'"patience" must be a positive integer, not {patience}')
+
+    if expected_returns is not None:
+        returns_windows = (None,)
+    candidates = calc_window_candidates(standev_windows, returns_windows, search, n_trials, seed)
+
+    if n_threads is None:
+        n_threads = default_thread_count()
+
+    # Every trial shares the same draws, taken once so that no two threads use rng
+    sorted_brownian = None
+    if not analytic:
+        sorted_brownian = np.sort(
+            draw_terminal_brownian(time_grid, n_simulations, rng or SimulationRNG(), antithetic, dtype))
+
+    # The price at each origin, and at the end of its time horizon
+    initial_prices = moments.prices[origins]
+    actual_prices = moments.prices[origins + horizon_steps - 1]
+
+    def run_trial(standev_window: int, returns_window: int) -> ForecastScores:
+        # The inputs of each origin are calculated from the data before it
+        his_vols = moments.volatility(standev_window)[origins - 1]
+        trial_returns = expected_returns if returns_window is None \
+            else moments.expected_returns(exp_ret_flag, returns_window)[origins - 1]
+
+        table = run_walk_forward(
+            initial_prices, actual_prices, trial_returns, his_vols, time_grid,
+            n_simulations=n_simulations, analytic=analytic, n_threads=1, percentiles=percentiles,
+            memory_budget=memory_budget // n_threads, horizon_time=horizon_time, sorted_brownian=sorted_brownian
+            )
+
+        return score_walk_forward(table, percentiles)
+
+    rows = []
+    best_score = np.inf
+    trials_since_best = 0
+    stopped_early = False
+
+    with ThreadPoolExecutor(max_workers=n_threads) as executor:
+        for start in range(0, len(candidates), n_threads):
+            round_candidates = candidates[start:start + n_threads]
+
+            for (standev_window, returns_window), scores in zip(
+                    round_candidates, executor.map(lambda candidate: run_trial(*candidate), round_candidates)):
+                score = calc_search_score(scores, metric)
+                rows.append({
+                    'standev_window': standev_window,
+                    'returns_window': returns_window,
+                    'score': score,
+                    **{f'coverage_{band}': rate for band, rate in scores.coverage_rates.items()},
+                    'pinball': float(np.mean(list(scores.mean_pinball.values()))),
+                    'crps': scores.mean_crps
+                    })
+
+                if score < best_score:
+                    best_score = score
+                    trials_since_best = 0
+                else:
+                    trials_since_best += 1
+
+            # Stop once the best score has not improved for patience trials
+            if patience is not None and trials_since_best >= patience and start + n_threads < len(candidates):
+                stopped_early = True
+                break
+
+    trials = pd.DataFrame(rows)
+    trials.index.name = 'trial'
+
+    return WindowSearchResult(trials, exp_ret_flag, metric, stopped_early)
+
+def save_best_windows(path: str, asset_symbol: str, result: WindowSearchResult) -> dict:
+    """
+    Records the best windows of a search in a JSON file, by ticker symbol and returns
+    method, so later runs can reuse them (see load_best_windows). Records of other
+    tickers and methods already in the file are kept; the file is replaced in one step,
+    so it is never left partly written.
+
+    Parameters:
+        path - the path of the JSON file; created if it does not exist
+        asset_symbol - the ticker symbol whose windows were searched (e.g., 'AAPL')
+        result - the WindowSearchResult of the search
+
+    Returns: A dictionary of every record in the file, by ticker symbol then returns method
+    """
+    records = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as file:
+            records = json.load(file)
+
+    records.setdefault(asset_symbol, {})[result.exp_ret_flag] = result.to_dict()
+
+    temp_path = f'{path}.tmp'
+    with open(temp_path, 'w', encoding='utf-8') as file:
+        json.dump(records, file, indent=4)
+    os.replace(temp_path, path)
+
+    return records
+
+def load_best_windows(path: str, asset_symbol: str, exp_ret_flag: str = None) -> dict:
+    """
+    Reads the best windows recorded by save_best_windows.
+
+    Parameters:
+        path - the path of the JSON file
+        asset_symbol - a ticker symbol (e.g., 'AAPL')
+        exp_ret_flag - a returns calculation method; every method recorded for the ticker
+            if None
+
+    Returns: A dictionary with the standev_window, returns_window, metric, score,
+        n_trials and stopped_early of the record (or a dictionary of such records by
+        returns method, without exp_ret_flag); None if nothing is recorded
+    """
+    if not os.path.exists(path):
+        return None
+
+    with open(path, 'r', encoding='utf-8') as file:
+        records = json.load(file).get(asset_symbol)
+
+    if records is None or exp_ret_flag is None:
+        return records
+
+    return records.get(exp_ret_flag)
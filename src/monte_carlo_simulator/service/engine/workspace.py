@@ -0,0 +1,58 @@
+import numpy as np
+
+
+class SimulationWorkspace:
+    """
+    Preallocated arrays reused by consecutive simulation runs. A run asks for a named
+    buffer of a given shape and type; if the buffer held under that name already has
+    that shape and type it is returned as is, otherwise it is replaced. Runs of the
+    same size therefore allocate nothing after the first.
+
+    Buffers are overwritten by the next run that uses them, so results built in a
+    workspace must be reduced or copied before the next run.
+    """
+    def __init__(self):
+        self._buffers: dict = {}
+
+    def buffer(self, name: str, shape: tuple, dtype: type = np.float64) -> np.ndarray:
+        """
+        Returns the named buffer, reallocating it if its shape or type has changed. The
+        contents of a returned buffer are undefined.
+
+        Parameters:
+            name - the name of the buffer (e.g., 'paths')
+            shape - the shape of the buffer
+            dtype - the type of the buffer's elements
+
+        Returns: A C-contiguous ndarray of the requested shape and type
+        """
+        shape = tuple(shape)
+        dtype = np.dtype(dtype)
+
+        array = self._buffers.get(name)
+        if array is not None and array.shape == shape and array.dtype == dtype:
+            return array
+
+        # Drop the old buffer before allocating its replacement, so both are never held
+        self._buffers.pop(name, None)
+
+        try:
+            array = np.empty(shape, dtype=dtype)
+
+        # Under memory pressure, release every held buffer and try again
+        except MemoryError:
+            self.release()
+            array = np.empty(shape, dtype=dtype)
+
+        self._buffers[name] = array
+
+        return array
+
+    def release(self) -> None:
+        """Frees every buffer held by the workspace"""
+        self._buffers.clear()
+
+    @property
+    def nbytes(self) -> int:
+        """The total size of the buffers held, in bytes"""
+        return sum(array.nbytes for array in self._buffers.values())
@@ -3,14 +3,17 @@ from typing import List
 from matplotlib.figure import Figure
 from numbers import Number
 import numpy as np
+import pandas as pd
 
 from monte_carlo_simulator.model import *
 from monte_carlo_simulator.data_fetcher import MarketDataFetcher
 from monte_carlo_simulator.service.interface.subject_inter import Subject
-from monte_carlo_simulator.const import ANNUAL_TRADING_DAYS, MONTHS_PER_YEAR
+from monte_carlo_simulator.const import DEFAULT_CHUNK_SIZE, DEFAULT_TOLERANCE, MAX_SIMULATIONS, SIM_DTYPES, \
+    MEMORY_BUDGET, EXP_RETURN_METHODS
 from monte_carlo_simulator.service.util.price_col_checker import price_col_checker
 from monte_carlo_simulator.service.calculator import *
-from monte_carlo_simulator.service.util.data_visualizer import monte_carlo_sim_vis, backtest_vis
+from monte_carlo_simulator.service.util.data_visualizer import monte_carlo_sim_vis, backtest_vis, method_comparison_vis
+from monte_carlo_simulator.service.engine import *
 
 class Simulator(Subject):
     """
@@ -38,7 +41,20 @@ class Simulator(Subject):
         self._risk_free_sec: RiskFreeSecurity = risk_free_sec
         self._backtest_figure: Figure = None
         self._sim_figure: Figure = None
+        self._comparison_figure: Figure = None
         self._error_message: str = None
+        self._bit_generator: str = 'PCG64'
+        self._kernel_backend: str = 'numpy'
+        self._step_granularity: str | int = 'daily'
+        self._seed: int = None
+        self._variance_report: VarianceReductionReport = None
+        self._convergence_report: ConvergenceReport = None
+        self._workspace: SimulationWorkspace = SimulationWorkspace()
+        self._memory_budget: int = MEMORY_BUDGET
+        self._brownian_cache: BrownianCache = BrownianCache(max_bytes=MEMORY_BUDGET // 2)
+        self._simulation_plan: SimulationPlan = None
+        self._simulation_result: SimulationResult = None
+        self._forecast_scores: ForecastScores = None
 
     def attach(self, observer) -> None:
         if observer not in self._observers:
@@ -138,7 +154,20 @@ class Simulator(Subject):
             n_simulations: int = 1000,
             standev_window: int = 30,
             market_symbol: str = None, 
-            rfr_symbol: str = None
+            rfr_symbol: str = None,
+            chunk_size: int = None,
+            n_workers: int = None,
+            seed: int = None,
+            analytic: bool = False,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            variance_reduction: str = None,
+            tolerance: float = None,
+            dtype: type = np.float64,
+            checkpoints: list = None,
+            plot_points: int = None,
+            n_threads: int = None,
+            path_file: str = None
             ) -> None:
         """
         Facilitates running Monte Carlo simulation: Manages gathering data and
@@ -158,6 +187,42 @@ class Simulator(Subject):
                 deviation of asset prices 
             market_symbol - a ticker symbol for a market index (e.g., '^GSPC')
             rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX')
+            chunk_size - if set, price paths are streamed in chunks of this many paths 
+                and only the mean and confidence bands are kept, bounding memory use; if 
+                None, paths are streamed only if they do not fit in the memory_budget 
+                property, as decided by plan_simulation
+            n_workers - if set, the simulation is split across this many worker 
+                processes and only the mean and confidence bands are kept
+            seed - an integer seed for the simulation's random draws; a run can be 
+                reproduced by passing the seed property of a previous run
+            analytic - if True, the mean and confidence bands are calculated in closed 
+                form instead of simulated, with no random draws
+            antithetic - if True, price paths are simulated in antithetic pairs, 
+                mirroring half of the random draws
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            variance_reduction - None, or the variance reduction method applied to the 
+                simulated paths (see monte_carlo_sim); every path must be kept in memory, so 
+                it cannot be combined with analytic, chunk_size, n_workers, tolerance, 
+                checkpoints or path_file, or paths that do not fit in the memory budget
+            tolerance - if set, paths are simulated in batches (of chunk_size paths) until 
+                the relative standard errors of the mean and confidence bands are within 
+                this tolerance, with n_simulations as the most paths simulated; the paths 
+                used and errors achieved are reported by the convergence_report property; 
+                cannot be combined with antithetic or the 'sobol' sampler
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+            checkpoints - if set, a list of horizons (in months, at most time_horizon) at 
+                which price statistics are recorded in one streamed run; the table is kept 
+                in the checkpoint_table of the simulation_result property
+            plot_points - with checkpoints, the approximate number of time steps kept for 
+                charting the confidence bands; every step if None
+            n_threads - if set, every path is built on this many threads (see 
+                monte_carlo_sim); like variance_reduction, it cannot be combined with 
+                analytic, chunk_size, n_workers, tolerance, checkpoints, path_file or 
+                variance_reduction, or paths that do not fit in the memory budget
+            path_file - if set, every path is kept in this .npy file (see monte_carlo_sim); 
+                the simulation_result property streams its statistics from disk
 
         Returns: None; this method calls self.notify() to notify observers
             of simulation results. Observers then display results or any error 
@@ -185,17 +250,185 @@ class Simulator(Subject):
             self.financial_asset.his_vol = calc_volatility(
                 self.financial_asset.asset_data, standev_window)
 
+            # Only adaptive runs have a convergence report
+            self._convergence_report = None
+
+            # The previous result's paths may be in the workspace this run reuses
+            if self._simulation_result is not None:
+                self._simulation_result.release_paths()
+
+            # Only runs that keep every path have them in their result
+            sim_paths = None
+
+            # Only checkpoint runs have a checkpoint table
+            checkpoint_table = None
+
+            # Plan a run without a chunk size within the memory budget: paths that do not
+            # fit are streamed in chunks sized to the budget
+            if chunk_size is None and not analytic and tolerance is None and n_workers is None and checkpoints is None \
+                    and path_file is None:
+                self._validate_sim_inputs(
+                    initial_price, self.financial_asset.expected_returns, self.financial_asset.his_vol, 
+                    time_horizon, n_simulations
+                    )
+                plan = self.plan_simulation(
+                    n_simulations, time_horizon, dtype, outputs=('bands',),
+                    expected_returns=self.financial_asset.expected_returns, his_vol=self.financial_asset.his_vol
+                    )
+                chunk_size = plan.chunk_size
+
+            # Variance reduction corrects every path at once, so only runs that keep them all can use it
+            if variance_reduction is not None and (analytic or chunk_size is not None or tolerance is not None 
+                    or n_workers is not None or checkpoints is not None or path_file is not None):
+                self.error_message = 'Error encountered in Monte Carlo simulation: "variance_reduction" needs every path in memory, and cannot be used with "analytic", "chunk_size", "n_workers", "tolerance", "checkpoints", "path_file", or paths that do not fit in the memory budget'
+                raise ValueError
+
+            # Threads build every path in one matrix, so only runs that keep them all can use them
+            if n_threads is not None and (analytic or chunk_size is not None or tolerance is not None 
+                    or n_workers is not None or checkpoints is not None or path_file is not None 
+                    or variance_reduction is not None):
+                self.error_message = 'Error encountered in Monte Carlo simulation: "n_threads" builds every path in memory, and cannot be used with "analytic", "chunk_size", "n_workers", "tolerance", "checkpoints", "path_file", "variance_reduction", or paths that do not fit in the memory budget'
+                raise ValueError
+
+            # Calculate the exact mean and confidence bands without simulating
+            if analytic:
+                sim_data = self.analytic_bands(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon
+                    )
+
+            # Record statistics at each checkpoint horizon from one run of the longest
+            elif checkpoints is not None:
+                checkpoint_table, sim_data = self.monte_carlo_sim_checkpoints(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    checkpoints=checkpoints,
+                    n_simulations=n_simulations,
+                    chunk_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                    seed=seed,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    dtype=dtype,
+                    plot_points=plot_points
+                    )
+
+            # Simulate batches until the mean and confidence bands converge
+            elif tolerance is not None:
+                sim_data = self.monte_carlo_sim_adaptive(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    tolerance=tolerance,
+                    max_simulations=n_simulations,
+                    batch_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                    seed=seed,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    dtype=dtype
+                    )
+
+            # Keep every path on disk, summarizing them in one pass over the file
+            elif path_file is not None:
+                sim_paths = self.monte_carlo_sim(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    n_simulations=n_simulations,
+                    seed=seed,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    dtype=dtype,
+                    path_file=path_file
+                    )
+                sim_data = sim_paths.band_summary()
+
+            # Split the simulation across worker processes
+            elif n_workers is not None:
+                sim_data = self.monte_carlo_sim_parallel(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    n_simulations=n_simulations,
+                    seed=seed,
+                    n_workers=n_workers,
+                    block_size=chunk_size or DEFAULT_CHUNK_SIZE,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    dtype=dtype
+                    )
+
             # Run Monte Carlo simulation to predict future prices
-            sim_data = self.monte_carlo_sim(
-                initial_price=initial_price, 
-                expected_returns=self.financial_asset.expected_returns,
-                his_vol=self.financial_asset.his_vol,
-                time_horizon=time_horizon,
-                n_simulations=n_simulations
+            elif chunk_size is None:
+                sim_paths = self.monte_carlo_sim(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    n_simulations=n_simulations,
+                    seed=seed,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    variance_reduction=variance_reduction,
+                    dtype=dtype,
+                    workspace=self.workspace,
+                    brownian_cache=self.brownian_cache,
+                    n_threads=n_threads
+                    )
+
+                # Reduce the paths to the mean and confidence bands with the selected backend
+                sim_data = get_backend(self.kernel_backend).band_summary(sim_paths)
+
+                # Report the plan made for the bands rather than monte_carlo_sim's plan
+                self._simulation_plan = plan
+
+            # Stream simulated paths, keeping only the summaries needed for visualization
+            else:
+                sim_data = self.monte_carlo_sim_chunked(
+                    initial_price=initial_price, 
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    n_simulations=n_simulations,
+                    chunk_size=chunk_size,
+                    seed=seed,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    dtype=dtype
+                    )
+
+            # Keep the run's output and metadata; statistics are calculated once, when first 
+            # needed, and shared by every observer
+            self._simulation_result = SimulationResult(
+                initial_price=initial_price,
+                paths=sim_paths,
+                summary=sim_data,
+                seed=None if analytic else self.seed,
+                parameters=dict(
+                    asset_symbol=asset_symbol,
+                    exp_ret_flag=exp_ret_flag,
+                    expected_returns=self.financial_asset.expected_returns,
+                    his_vol=self.financial_asset.his_vol,
+                    time_horizon=time_horizon,
+                    n_simulations=sim_data.n_paths,
+                    antithetic=antithetic,
+                    sampler=sampler,
+                    variance_reduction=variance_reduction,
+                    dtype=self._validate_dtype(dtype).name,
+                    step_granularity=self.step_granularity
+                    ),
+                data_fingerprint=calc_data_fingerprint(self.financial_asset.asset_data),
+                checkpoint_table=checkpoint_table
                 )
 
-            # Get simulation visualization figure
-            self._sim_figure = monte_carlo_sim_vis(sim_data, time_horizon)
+            # Get simulation visualization figure, with time steps of the selected size
+            self._sim_figure = monte_carlo_sim_vis(self.simulation_result, time_horizon, self.step_granularity)
 
             self.notify()  # Notify observers of updated data
         
@@ -216,7 +449,13 @@ class Simulator(Subject):
             n_simulations: int = 1000,
             standev_window: int = 30,
             market_symbol: str = None, 
-            rfr_symbol: str = None
+            rfr_symbol: str = None,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            variance_reduction: str = None,
+            dtype: type = np.float64,
+            path_file: str = None
             ) -> None:
         """
         Splits data into "training" and testing data, with testing data length equal to
@@ -229,7 +468,8 @@ class Simulator(Subject):
 
         Uses the testing data to chart price paths predicted by the Monte Carlo 
         simulator using the training inputs against the actual prices observed over 
-        the testing period.
+        the testing period, and scores them against those prices at every time step 
+        (see score_forecast); the scores are kept in the forecast_scores property.
 
         Parameters:
             asset_symbol - a ticker symbol for a financial asset (e.g., 'AAPL')
@@ -244,6 +484,17 @@ class Simulator(Subject):
                 deviation of asset prices 
             market_symbol - a ticker symbol for a market index (e.g., '^GSPC')
             rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX')
+            seed - an integer seed for the simulation's random draws
+            antithetic - if True, price paths are simulated in antithetic pairs, 
+                mirroring half of the random draws
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            variance_reduction - None, or the variance reduction method applied to the 
+                simulated paths (see monte_carlo_sim)
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+            path_file - if set, every path is kept in this .npy file (see monte_carlo_sim) 
+                and a sample of them is read back for the chart
 
         Returns: None; this method calls self.notify() to notify observers
             of simulation results. Observers then display results or any error 
@@ -258,9 +509,8 @@ class Simulator(Subject):
             close_column = price_col_checker(self.financial_asset.asset_data)
 
             # Set the starting index for the testing data equal to the investment horizon 
-            # The investment time horizon is divided by the time measure 
-            # (months, days, years) divided by the number of trading days in a year
-            test_start_index = round(time_horizon / (MONTHS_PER_YEAR/ANNUAL_TRADING_DAYS)) 
+            # (the number of trading days in the investment time horizon)
+            test_start_index = calc_num_steps(time_horizon)
 
             # If chosen period is shorter than time horizon, abort function, output error message
             if test_start_index > self.financial_asset.asset_data.index.size:
@@ -285,11 +535,24 @@ class Simulator(Subject):
                 expected_returns=self.financial_asset.expected_returns,
                 his_vol=self.financial_asset.his_vol,
                 time_horizon=time_horizon,
-                n_simulations=n_simulations
+                n_simulations=n_simulations,
+                seed=seed,
+                antithetic=antithetic,
+                sampler=sampler,
+                variance_reduction=variance_reduction,
+                dtype=dtype,
+                path_file=path_file
             )
 
             # Visualize training data against testing data
             self._backtest_figure = backtest_vis(train_sim, asset_test[close_column])
+
+            # Score the simulated prices against the testing data at every time step
+            self._forecast_scores = score_forecast(
+                SimulationResult(initial_price=asset_test[close_column].iloc[0, 0], paths=train_sim),
+                asset_test[close_column],
+                memory_budget=self.memory_budget
+                )
             
             self.notify()
 
@@ -306,8 +569,18 @@ class Simulator(Subject):
             expected_returns: float,
             his_vol: float,
             time_horizon: int,
-            n_simulations: int = 1000
-            ) -> np.ndarray:
+            n_simulations: int = 1000,
+            seed: int = None,
+            terminal_only: bool = False,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            variance_reduction: str = None,
+            dtype: type = np.float64,
+            workspace: SimulationWorkspace = None,
+            brownian_cache: BrownianCache = None,
+            n_threads: int = None,
+            path_file: str = None
+            ) -> np.ndarray | PathStore:
         """
         Returns future stock price predictions using the Geometric Brownian Motion
         model:
@@ -330,10 +603,1270 @@ class Simulator(Subject):
             time_horizon - the future period to be forecasted by the Monte Carlo 
                 simulation (in months)
             n_simulations - the number of simulations to be run    
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            terminal_only - if True, only prices at the end of the time horizon are 
+                sampled, directly from their log-normal distribution, using O(n_simulations) 
+                memory and time
+            antithetic - if True, simulations are generated in antithetic pairs: half of 
+                the normal draws are generated and mirrored (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge, which lowers the error of 
+                the mean and bands, most of all for powers of 2 simulations
+            variance_reduction - None for no correction, 'moment_matching' to standardize 
+                the normal draws of each time step across simulations, 'control_variate' to 
+                correct prices against Brownian Motion, whose mean is known to be 0, or 'both'; 
+                the effect is reported by the variance_report property
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+            workspace - an optional SimulationWorkspace; the normal draws and price paths 
+                are built in place in its reused path matrix, without allocating. The 
+                returned prices are a view of the workspace, overwritten by its next run
+            brownian_cache - an optional BrownianCache; with a seed, a run with the same 
+                seed and dimensions as a cached one rescales the cached Brownian Motion for 
+                its drift and volatility with NumPy instead of drawing again. Otherwise 
+                the run is built as it would be without a cache, on n_threads or with the 
+                selected kernel backend, and unthreaded runs cache their standardized 
+                Brownian Motion if it fits in the memory budget beside the run's arrays
+            n_threads - if set, the paths are built on this many threads writing into one 
+                output array, each with its own random streams (see run_threaded_simulation); 
+                0 uses default_thread_count(). The paths match a single-threaded run with 
+                the NumPy kernel. Cannot be combined with terminal_only, variance_reduction 
+                or path_file, or paths that do not fit in the memory budget
+            path_file - if set, every path is written to this .npy file in chunks sized to 
+                the memory_budget property, and a PathStore handle to the file is returned 
+                instead of an ndarray; its statistics are streamed from disk, so the run is 
+                limited by disk space rather than memory
+
+        Returns: An ndarray containing simulated future prices of the asset, one row per 
+            time step of the step_granularity property (daily by default), or a 
+            1-dimensional ndarray of terminal prices if terminal_only is True. If the paths 
+            do not fit in the memory_budget property, they are written to a temporary .npy 
+            file and a memory-mapped ndarray is returned (see plan_simulation). With 
+            path_file, a PathStore of the paths written to it
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, n_simulations)
+        dtype = self._validate_dtype(dtype)
+
+        if variance_reduction is not None and variance_reduction not in VARIANCE_REDUCTION_METHODS:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "variance_reduction" must be one of {list(VARIANCE_REDUCTION_METHODS)}, not {variance_reduction}'
+            raise ValueError
+        if n_threads is not None and (not isinstance(n_threads, int) or isinstance(n_threads, bool) or n_threads < 0):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "n_threads" must be a non-negative integer, not {n_threads}'
+            raise ValueError
+        if path_file is not None and (terminal_only or variance_reduction is not None):
+            self.error_message = 'Error encountered in Monte Carlo simulation: "path_file" stores full paths, and cannot be used with "terminal_only" or "variance_reduction"'
+            raise ValueError
+        if n_threads is not None and (terminal_only or variance_reduction is not None or path_file is not None):
+            self.error_message = 'Error encountered in Monte Carlo simulation: "n_threads" builds full paths in memory, and cannot be used with "terminal_only", "variance_reduction" or "path_file"'
+            raise ValueError
+
+        # Only runs with variance reduction have a report
+        self._variance_report = None
+
+        # Set the number of time steps (trading days, by default) to match the time_horizon
+        num_steps = calc_num_steps(time_horizon, self.step_granularity)
+
+        # The proportion of the time horizon passed at each step; the first value
+        # is time zero, filled in with the initial price of the asset
+        time_grid = calc_time_grid(num_steps)
+
+        drift = calc_drift(expected_returns, his_vol)
+
+        # Plan the run within the memory budget
+        plan = self.plan_simulation(n_simulations, time_horizon, dtype, outputs=('terminal',) if terminal_only else ('paths',))
+
+        # Sample terminal prices without simulating the intermediate steps
+        if terminal_only:
+            random_normal = self._create_rng(seed, sampler).standard_normal(0, n_simulations, 1, antithetic=antithetic, dtype=dtype)
+
+            # Correct terminal prices as one-step paths from time zero to the horizon
+            if variance_reduction is not None:
+                prices, self._variance_report = simulate_reduced_variance(
+                    initial_price, expected_returns, his_vol, 
+                    np.array([0, time_grid[-1]]), random_normal, variance_reduction
+                    )
+                return prices[:, -1]
+
+            return calc_terminal_prices(initial_price, drift, his_vol, time_grid[-1], random_normal[:, 0])
+
+        # Write every path to the requested file, one chunk within the memory budget at a
+        # time, and hand back a handle that maps the file only when it is read
+        if path_file is not None:
+            run_out_of_core_simulation(
+                initial_price=initial_price,
+                expected_returns=expected_returns,
+                his_vol=his_vol,
+                time_grid=time_grid,
+                n_simulations=n_simulations,
+                filename=path_file,
+                chunk_size=plan.chunk_size or n_simulations,
+                rng=self._create_rng(seed, sampler),
+                antithetic=antithetic,
+                dtype=dtype
+                )
+            return PathStore(path_file, memory_budget=self.memory_budget)
+
+        # Write paths that do not fit in memory to disk, one chunk at a time
+        if plan.strategy == 'out_of_core':
+            if variance_reduction is not None:
+                self.error_message = f'Error encountered in Monte Carlo simulation: variance reduction needs every path in memory, but {n_simulations} simulations need about {plan.disk_bytes} bytes; reduce "n_simulations" or raise the memory budget'
+                raise MemoryError
+            if n_threads is not None:
+                self.error_message = f'Error encountered in Monte Carlo simulation: "n_threads" builds every path in memory, but {n_simulations} simulations need about {plan.disk_bytes} bytes; reduce "n_simulations" or raise the memory budget'
+                raise MemoryError
+
+            prices = run_out_of_core_simulation(
+                initial_price=initial_price,
+                expected_returns=expected_returns,
+                his_vol=his_vol,
+                time_grid=time_grid,
+                n_simulations=n_simulations,
+                chunk_size=plan.chunk_size,
+                rng=self._create_rng(seed, sampler),
+                antithetic=antithetic,
+                dtype=dtype
+                )
+            return prices.transpose()
+
+        # Reuse the workspace's path matrix, drawing the normals into the columns after
+        # the initial price so that the paths are then built over them in place
+        paths = None
+        if workspace is not None and variance_reduction is None:
+            paths = workspace.buffer('paths', (n_simulations, num_steps), dtype)
+
+        # Rescale the cached Brownian Motion of a run with the same seed and dimensions
+        cache_key = None
+        if brownian_cache is not None and seed is not None and variance_reduction is None:
+            cache_key = self._brownian_key(seed, n_simulations, time_grid, antithetic, sampler, dtype)
+            brownian = brownian_cache.get(cache_key)
+            if brownian is not None:
+                # Validates the sampler and records the seed, as an uncached run does
+                self._create_rng(seed, sampler)
+                log_paths = calc_log_paths_from_brownian(drift, his_vol, time_grid, brownian, out=paths)
+                return calc_price_paths(initial_price, log_paths, out=log_paths).transpose()
+
+            # On a miss, the run is built as without a cache, and its draws kept only if 
+            # they fit in the memory budget beside it
+            if not self._fits_brownian_cache(n_simulations, num_steps, dtype):
+                cache_key = None
+
+        # Build ranges of paths on a pool of threads, in one shared output array
+        if n_threads is not None:
+            prices = run_threaded_simulation(
+                initial_price=initial_price,
+                expected_returns=expected_returns,
+                his_vol=his_vol,
+                time_grid=time_grid,
+                n_simulations=n_simulations,
+                rng=self._create_rng(seed, sampler),
+                n_threads=n_threads or None,
+                antithetic=antithetic,
+                dtype=dtype,
+                out=paths
+                )
+            return prices.transpose()
+
+        # Get random normal distribution with the right dimensions
+        random_normal = self._create_rng(seed, sampler).standard_normal(
+            0, n_simulations, num_steps - 1, 
+            out=None if paths is None else paths[:, 1:], 
+            antithetic=antithetic, 
+            dtype=dtype
+            )
+
+        # Simulate corrected price paths and record the variance reduction achieved
+        if variance_reduction is not None:
+            prices, self._variance_report = simulate_reduced_variance(
+                initial_price, expected_returns, his_vol, time_grid, random_normal, variance_reduction
+                )
+            return prices.transpose()
+
+        # Keep the run's standardized Brownian Motion before the kernel builds paths over 
+        # its draws
+        if cache_key is not None:
+            brownian_cache.put(cache_key, calc_brownian_paths(time_grid, random_normal))
+
+        # Simulate Brownian Motion and calculate simulation results with the selected backend
+        prices = get_backend(self.kernel_backend).price_paths(
+            initial_price, drift, his_vol, time_grid, random_normal, out=paths)
+
+        # Transpose data for visualizations (a view; no data is copied)
+        return prices.transpose()
+
+    def monte_carlo_sim_chunked(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int,
+            n_simulations: int = 1000,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64
+            ) -> BandSummary:
+        """
+        Runs the same Geometric Brownian Motion simulation as monte_carlo_sim, but
+        streams price paths in chunks of chunk_size paths and returns only the mean
+        and confidence bands needed for visualizations. Memory use is bounded by the
+        chunk size rather than the number of simulations.
+
+        Parameters:
+            initial_price - the starting price of the asset
+            expected_returns - a floating point number representing the expected returns of
+                the asset
+            his_vol - a floating point number representing the asset's volatility
+            time_horizon - the future period to be forecasted by the Monte Carlo 
+                simulation (in months)
+            n_simulations - the number of simulations to be run
+            chunk_size - the maximum number of price paths held in memory at once
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+
+        Returns: A BandSummary containing the mean and band percentiles of simulated prices
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, n_simulations)
+        dtype = self._validate_dtype(dtype)
+
+        if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "chunk_size" must be an integer, not {type(chunk_size)}'
+            raise TypeError
+        if chunk_size <= 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "chunk_size" must be greater than zero, not {chunk_size}'
+            raise ValueError
+
+        return run_chunked_simulation(
+            initial_price=initial_price,
+            expected_returns=expected_returns,
+            his_vol=his_vol,
+            time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)),
+            n_simulations=n_simulations,
+            chunk_size=chunk_size,
+            rng=self._create_rng(seed, sampler),
+            antithetic=antithetic,
+            dtype=dtype
+            )
+
+    def monte_carlo_sim_parallel(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int,
+            n_simulations: int = 1000,
+            seed: int = None,
+            n_workers: int = None,
+            block_size: int = DEFAULT_CHUNK_SIZE,
+            return_paths: bool = False,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64
+            ) -> BandSummary | np.ndarray:
+        """
+        Runs the same Geometric Brownian Motion simulation as monte_carlo_sim, split 
+        across a pool of worker processes. Each block of block_size paths draws from an 
+        independent random stream spawned from the seed, so results are reproducible 
+        for a given seed regardless of the number of workers.
+
+        Parameters:
+            initial_price - the starting price of the asset
+            expected_returns - a floating point number representing the expected returns of
+                the asset
+            his_vol - a floating point number representing the asset's volatility
+            time_horizon - the future period to be forecasted by the Monte Carlo 
+                simulation (in months)
+            n_simulations - the number of simulations to be run
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            n_workers - the number of worker processes; defaults to the number of CPUs
+            block_size - the number of price paths simulated by each worker task
+            return_paths - if True, returns every simulated path instead of a summary
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+
+        Returns: A BandSummary containing the mean and band percentiles of simulated prices,
+            or an ndarray of simulated prices (as monte_carlo_sim) if return_paths is True
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, n_simulations)
+        dtype = self._validate_dtype(dtype)
+
+        if not isinstance(block_size, int) or isinstance(block_size, bool):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "block_size" must be an integer, not {type(block_size)}'
+            raise TypeError
+        if block_size <= 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "block_size" must be greater than zero, not {block_size}'
+            raise ValueError
+        if n_workers is not None and n_workers <= 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "n_workers" must be greater than zero, not {n_workers}'
+            raise ValueError
+
+        return run_parallel_simulation(
+            initial_price=initial_price,
+            expected_returns=expected_returns,
+            his_vol=his_vol,
+            time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)),
+            n_simulations=n_simulations,
+            rng=self._create_rng(seed, sampler),
+            n_workers=n_workers,
+            block_size=block_size,
+            return_paths=return_paths,
+            antithetic=antithetic,
+            dtype=dtype
+            )
+
+    def monte_carlo_sim_checkpoints(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int,
+            checkpoints: list,
+            n_simulations: int = 1000,
+            chunk_size: int = DEFAULT_CHUNK_SIZE,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64,
+            plot_points: int = None
+            ) -> tuple[pd.DataFrame, BandSummary]:
+        """
+        Runs the same Geometric Brownian Motion simulation as monte_carlo_sim over 
+        time_horizon, streaming paths in chunks and recording prices only at the 
+        checkpoint horizons. One run gives a multi-horizon forecast table at the cost of 
+        the longest horizon. A checkpoint of h months is the step reached after 
+        calc_num_steps(h) - 1 time steps on the time_horizon run's time grid.
+
+        Parameters:
+            initial_price - the starting price of the asset
+            expected_returns - a floating point number representing the expected returns of
+                the asset
+            his_vol - a floating point number representing the asset's volatility
+            time_horizon - the future period to be forecasted by the Monte Carlo 
+                simulation (in months)
+            checkpoints - a list of horizons (in months) between 1 and time_horizon
+            n_simulations - the number of simulations to be run
+            chunk_size - the maximum number of price paths generated at once
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+            plot_points - the approximate number of time steps kept for charting the 
+                confidence bands (checkpoint steps are always kept); every step if None
+
+        Returns: A tuple of a pandas.DataFrame indexed by checkpoint horizon (in months), 
+            with the checkpoint's time step, mean price, band percentiles and probability 
+            of loss, and a BandSummary of the charted time steps
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, n_simulations)
+        dtype = self._validate_dtype(dtype)
+
+        if not isinstance(checkpoints, (list, tuple)) or len(checkpoints) == 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "checkpoints" must be a non-empty list, not {checkpoints}'
+            raise TypeError
+        for checkpoint in checkpoints:
+            if not isinstance(checkpoint, int) or isinstance(checkpoint, bool):
+                self.error_message = f'Error encountered in Monte Carlo simulation: checkpoints must be integers, not {type(checkpoint)}'
+                raise TypeError
+            if not 0 < checkpoint <= time_horizon:
+                self.error_message = f'Error encountered in Monte Carlo simulation: checkpoints must be between 1 and the time horizon ({time_horizon}), not {checkpoint}'
+                raise ValueError
+        if plot_points is not None and (not isinstance(plot_points, int) or isinstance(plot_points, bool) or plot_points < 2):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "plot_points" must be an integer of at least 2, not {plot_points}'
+            raise ValueError
+
+        # Set the number of time steps (trading days, by default) to match the time_horizon
+        num_steps = calc_num_steps(time_horizon, self.step_granularity)
+
+        # The step reached at the end of each checkpoint horizon
+        checkpoint_steps = [calc_num_steps(checkpoint, self.step_granularity) - 1 for checkpoint in checkpoints]
+
+        table, sim_data = run_checkpoint_simulation(
+            initial_price=initial_price,
+            expected_returns=expected_returns,
+            his_vol=his_vol,
+            time_grid=calc_time_grid(num_steps),
+            checkpoint_steps=checkpoint_steps,
+            n_simulations=n_simulations,
+            chunk_size=chunk_size,
+            rng=self._create_rng(seed, sampler),
+            antithetic=antithetic,
+            dtype=dtype,
+            plot_steps=None if plot_points is None else calc_plot_steps(num_steps, plot_points, checkpoint_steps)
+            )
+
+        # Label each row with its checkpoint horizon
+        table = table.reset_index()
+        table.index = pd.Index(checkpoints, name='horizon_months')
 
-        Returns: An ndarray containing simulated future prices of the asset
+        return table, sim_data
+
+    def monte_carlo_sim_adaptive(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int,
+            tolerance: float = DEFAULT_TOLERANCE,
+            max_simulations: int = MAX_SIMULATIONS,
+            batch_size: int = DEFAULT_CHUNK_SIZE,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64
+            ) -> BandSummary:
         """
+        Runs the same Geometric Brownian Motion simulation as monte_carlo_sim in batches 
+        of batch_size paths, stopping once the Monte Carlo standard errors of the mean and 
+        of each confidence band, relative to their values, are within tolerance at every 
+        time step, or once max_simulations paths have been simulated. The number of paths 
+        used and the errors achieved are stored in the convergence_report property.
 
+        Parameters:
+            initial_price - the starting price of the asset
+            expected_returns - a floating point number representing the expected returns of
+                the asset
+            his_vol - a floating point number representing the asset's volatility
+            time_horizon - the future period to be forecasted by the Monte Carlo 
+                simulation (in months)
+            tolerance - the target relative standard error (e.g., 0.005 for 0.5%)
+            max_simulations - the most simulations to run
+            batch_size - the number of simulations run between convergence checks
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            antithetic - must be False: the standard errors assume independent simulations,
+                which antithetic pairs (Z, -Z) are not
+            sampler - must be 'pseudo', for pseudo-random draws: Sobol' points are not
+                independent either
+            dtype - the floating point type of the simulated paths: np.float64, or np.float32 
+                to halve memory use, with statistics accumulated in float64
+
+        Returns: A BandSummary containing the mean and band percentiles of simulated prices
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, max_simulations)
+        dtype = self._validate_dtype(dtype)
+
+        if not isinstance(tolerance, Number):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "tolerance" must be a number, not {type(tolerance)}'
+            raise TypeError
+        if tolerance <= 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "tolerance" must be greater than zero, not {tolerance}'
+            raise ValueError
+        if not isinstance(batch_size, int) or isinstance(batch_size, bool):
+            self.error_message = f'Error encountered in Monte Carlo simulation: "batch_size" must be an integer, not {type(batch_size)}'
+            raise TypeError
+        if batch_size <= 0:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "batch_size" must be greater than zero, not {batch_size}'
+            raise ValueError
+        if antithetic or sampler == 'sobol':
+            self.error_message = 'Error encountered in Monte Carlo simulation: "tolerance" estimates standard errors from independent simulations, and cannot be used with "antithetic" or the \'sobol\' sampler'
+            raise ValueError
+
+        sim_data, self._convergence_report = run_adaptive_simulation(
+            initial_price=initial_price,
+            expected_returns=expected_returns,
+            his_vol=his_vol,
+            time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)),
+            tolerance=tolerance,
+            max_simulations=max_simulations,
+            batch_size=batch_size,
+            rng=self._create_rng(seed, sampler),
+            antithetic=antithetic,
+            dtype=dtype
+            )
+
+        return sim_data
+
+    def analytic_bands(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int
+            ) -> BandSummary:
+        """
+        Calculates the mean and confidence bands of the Geometric Brownian Motion model 
+        used by monte_carlo_sim in closed form, in O(time steps) with no random draws. 
+        Serves as an instant forecast and as the reference for simulated bands.
+
+        Parameters:
+            initial_price - the starting price of the asset
+            expected_returns - a floating point number representing the expected returns of
+                the asset
+            his_vol - a floating point number representing the asset's volatility
+            time_horizon - the future period to be forecasted (in months)
+
+        Returns: A BandSummary containing the exact mean and band percentiles of prices
+        """
+        # Verify arguments are of the correct type and within the expected range
+        self._validate_sim_inputs(initial_price, expected_returns, his_vol, time_horizon, 1)
+
+        return calc_analytic_bands(
+            initial_price=initial_price,
+            expected_returns=expected_returns,
+            his_vol=his_vol,
+            time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity))
+            )
+
+    def run_parameter_sweep(
+            self,
+            asset_symbol: str,
+            period: str,
+            exp_ret_flags: list,
+            standev_windows: list,
+            time_horizons: list = (12,),
+            n_simulations: int = 1000,
+            market_symbol: str = None,
+            rfr_symbol: str = None,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64
+            ) -> pd.DataFrame:
+        """
+        Forecasts terminal prices over a grid of inputs: every combination of expected 
+        returns method, volatility window and time horizon. The asset data is loaded once; 
+        expected returns are calculated once per method and the volatility of every window 
+        in one vectorized pass. Each horizon's Brownian Motion is drawn once and shared by 
+        every combination, so a sweep of many combinations costs about one simulation 
+        per horizon.
+
+        Parameters:
+            asset_symbol - a ticker symbol for a financial asset (e.g., 'AAPL')
+            period - the period of historical asset, market, and risk-free rate, data
+                used in the calculations
+            exp_ret_flags - a list of returns calculation methods (see EXP_RETURN_METHODS)
+            standev_windows - a list of the numbers of days used to calculate the rolling 
+                standard deviation of asset prices
+            time_horizons - a list of future periods to be forecasted (in months); each is 
+                scaled by its length in years, the units of the expected returns
+            n_simulations - the number of simulations run for each horizon
+            market_symbol - a ticker symbol for a market index (e.g., '^GSPC'); needed 
+                for the Capital Asset Pricing Model
+            rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX'); needed 
+                for the Capital Asset Pricing Model
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64 or np.float32
+
+        Returns: A pandas.DataFrame with one row per combination: its time_horizon, 
+            exp_ret_flag, standev_window, expected_returns and his_vol, then the expected 
+            terminal price, each terminal price percentile and the probability of loss. 
+            This method calls self.notify() to notify observers of the run, or of any 
+            error message before the error is raised
+        """
+        # Run as protected code, so observers see the outcome of every run
+        try:
+            dtype = self._validate_dtype(dtype)
+
+            # Verify the grid of inputs
+            for name, values in (
+                    ('exp_ret_flags', exp_ret_flags), ('standev_windows', standev_windows), ('time_horizons', time_horizons)):
+                if not isinstance(values, (list, tuple)) or len(values) == 0:
+                    self.error_message = f'Error encountered in parameter sweep: "{name}" must be a non-empty list, not {values}'
+                    raise TypeError
+            for exp_ret_flag in exp_ret_flags:
+                if exp_ret_flag not in EXP_RETURN_METHODS:
+                    self.error_message = f'Error encountered in parameter sweep: returns methods must be among {list(EXP_RETURN_METHODS)}, not {exp_ret_flag}'
+                    raise ValueError
+            for time_horizon in time_horizons:
+                if not isinstance(time_horizon, int) or isinstance(time_horizon, bool):
+                    self.error_message = f'Error encountered in parameter sweep: time horizons must be integers, not {type(time_horizon)}'
+                    raise TypeError
+
+            # Calculate expected returns once for each method, fetching only missing data
+            expected_returns = {}
+            for exp_ret_flag in exp_ret_flags:
+                self.populate_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag)
+                expected_returns[exp_ret_flag] = calc_exp_returns(
+                    financial_asset=self.financial_asset,
+                    market_index=self.market_index,
+                    risk_free_sec=self.risk_free_sec
+                    )
+
+            # Handle possible KeyErrors for market_data with only a 'Close' column
+            close_column = price_col_checker(self.financial_asset.asset_data)
+
+            # Set initial price for Monte Carlo simulations to most recent value
+            initial_price = self.financial_asset.asset_data[close_column].iloc[-1, -1]
+
+            # Calculate the historic volatility of every window in one pass
+            his_vols = dict(zip(standev_windows, calc_volatilities(self.financial_asset.asset_data, standev_windows)))
+
+            for time_horizon in time_horizons:
+                self._validate_sim_inputs(initial_price, 0, 0, time_horizon, n_simulations)
+
+            table = run_parameter_sweep(
+                initial_price=initial_price,
+                expected_returns=expected_returns,
+                his_vols=his_vols,
+                time_grids={
+                    time_horizon: calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)) 
+                    for time_horizon in time_horizons
+                    },
+                n_simulations=n_simulations,
+                rng=self._create_rng(seed, sampler),
+                antithetic=antithetic,
+                dtype=dtype,
+                memory_budget=self.memory_budget
+                )
+
+        # Notify observers if an exception occurred, then raise it to the caller
+        except Exception as e:
+            # If no exception message has been set, use generalized message
+            if self.error_message == None:
+                self.error_message = f'An exception occurred: {e}'
+
+            self.notify()
+            raise
+
+        self.notify()
+
+        return table
+
+    def run_walk_forward(
+            self,
+            asset_symbol: str,
+            period: str,
+            exp_ret_flag: str,
+            time_horizon: int = 12,
+            n_simulations: int = 1000,
+            standev_window: int = 30,
+            market_symbol: str = None,
+            rfr_symbol: str = None,
+            origin_step: int = 21,
+            seed: int = None,
+            analytic: bool = False,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64,
+            n_threads: int = None
+            ) -> pd.DataFrame:
+        """
+        Runs a walk-forward backtest: slides the forecast origin across the asset's 
+        history, every origin_step trading days, and at each origin forecasts the price 
+        at the end of the time horizon from inputs calculated only with the data before 
+        it, as run_backtest does for the most recent origin. Volatility, and expected 
+        returns by average methods, are calculated for every origin in one vectorized 
+        pass over rolling statistics; every origin shares one set of random draws.
+
+        Parameters:
+            asset_symbol - a ticker symbol for a financial asset (e.g., 'AAPL')
+            period - the period of historical asset, market, and risk-free rate, data
+                used in the calculations
+            exp_ret_flag - a string holding the returns calculation method used to
+                predict future asset returns (e.g., 'Simple Average Returns')
+            time_horizon - the future period forecasted from each origin (in months); 
+                forecasts drift and spread over its length in years, the units of the 
+                expected returns, to the price time_horizon months after the origin
+            n_simulations - the number of simulations shared by every origin
+            standev_window - the number of days used to calculate the rolling standard 
+                deviation of asset prices
+            market_symbol - a ticker symbol for a market index (e.g., '^GSPC')
+            rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX')
+            origin_step - the number of trading days between consecutive origins (e.g., 
+                21 for monthly origins)
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            analytic - if True, terminal prices are forecast in closed form, with no 
+                random draws
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64 or np.float32
+            n_threads - the number of threads evaluating origins; defaults to 
+                default_thread_count()
+
+        Returns: A pandas.DataFrame with one row per origin, indexed by origin date (see 
+            run_walk_forward): its inputs, the actual price at the end of its time horizon, 
+            the forecast terminal price statistics, the probability integral transform of 
+            the actual price and the forecast's CRPS. The scores of all origins together 
+            are kept in the forecast_scores property. This method calls self.notify() to 
+            notify observers of the scores, or of any error message before the error is 
+            raised
+        """
+        # Run as protected code, so observers see the outcome of every run
+        try:
+            dtype = self._validate_dtype(dtype)
+
+            if not isinstance(origin_step, int) or isinstance(origin_step, bool) or origin_step <= 0:
+                self.error_message = f'Error encountered in walk-forward backtest: "origin_step" must be a positive integer, not {origin_step}'
+                raise ValueError
+
+            # Populating primary data fields for the calculations
+            self.populate_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag)
+
+            # Get correct close column label
+            close_column = price_col_checker(self.financial_asset.asset_data)
+            prices = self.financial_asset.asset_data[close_column].iloc[:, 0]
+
+            # Each testing period holds the trading days of the time horizon, as in run_backtest
+            horizon_steps = calc_num_steps(time_horizon)
+
+            # Origins with a full volatility window of returns before them
+            origins = calc_walk_forward_origins(prices.size, horizon_steps, origin_step, min_history=standev_window + 1)
+            if origins.size == 0:
+                self.error_message = 'Error encountered in walk-forward backtest: Chosen time period must be longer than the investment horizon plus the volatility window.'
+                raise ValueError
+
+            # The inputs of each origin are calculated from the data before it, which ends
+            # on the previous date
+            his_vols = calc_rolling_volatility(self.financial_asset.asset_data, standev_window).to_numpy()[origins - 1]
+            if exp_ret_flag in ('Simple Average Returns', 'Exponential Weighted Average Returns'):
+                expected_returns = calc_rolling_exp_returns(self.financial_asset.asset_data, exp_ret_flag).to_numpy()[origins - 1]
+            else:
+                expected_returns = np.array([
+                    calc_exp_returns(
+                        financial_asset=self.financial_asset,
+                        market_index=self.market_index,
+                        risk_free_sec=self.risk_free_sec,
+                        end_index=origin
+                        )
+                    for origin in origins
+                    ])
+
+            # Drop origins without enough history for their expected returns
+            has_inputs = ~np.isnan(expected_returns) & ~np.isnan(his_vols)
+            if not has_inputs.any():
+                self.error_message = 'Error encountered in walk-forward backtest: Chosen time period is too short to calculate expected returns before any origin.'
+                raise ValueError
+            origins, expected_returns, his_vols = origins[has_inputs], expected_returns[has_inputs], his_vols[has_inputs]
+
+            initial_prices = prices.to_numpy()[origins]
+            self._validate_sim_inputs(float(initial_prices[0]), 0, 0, time_horizon, n_simulations)
+
+            table = run_walk_forward(
+                initial_prices=initial_prices,
+                actual_prices=prices.to_numpy()[origins + horizon_steps - 1],
+                expected_returns=expected_returns,
+                his_vols=his_vols,
+                time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)),
+                n_simulations=n_simulations,
+                rng=None if analytic else self._create_rng(seed, sampler),
+                analytic=analytic,
+                n_threads=n_threads,
+                antithetic=antithetic,
+                dtype=dtype,
+                memory_budget=self.memory_budget,
+                origins=prices.index[origins].rename('origin'),
+                horizon_time=calc_horizon_time(time_horizon)
+                )
+
+            # Score the forecasts of every origin together
+            self._forecast_scores = score_walk_forward(table)
+
+        # Notify observers if an exception occurred, then raise it to the caller
+        except Exception as e:
+            # If no exception message has been set, use generalized message
+            if self.error_message == None:
+                self.error_message = f'An exception occurred: {e}'
+
+            self.notify()
+            raise
+
+        self.notify()
+
+        return table
+
+    def compare_return_methods(
+            self,
+            asset_symbol: str,
+            period: str,
+            exp_ret_flags: list = EXP_RETURN_METHODS,
+            time_horizon: int = 12,
+            n_simulations: int = 1000,
+            standev_window: int = 30,
+            market_symbol: str = None,
+            rfr_symbol: str = None,
+            seed: int = None,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64
+            ) -> pd.DataFrame:
+        """
+        Compares expected returns methods side by side in one pass, instead of one run 
+        per method. The asset data is loaded once and every applicable method's expected 
+        returns are calculated from it, both over the whole period and, as in 
+        run_backtest, over the training data alone. One standardized Brownian Motion 
+        matrix (cached by seed in the brownian_cache property) is rescaled for each 
+        method's drift, both to forecast the time horizon and to backtest the method 
+        against the testing data. The overlaid backtests are charted in the 
+        comparison_figure property.
+
+        Parameters:
+            asset_symbol - a ticker symbol for a financial asset (e.g., 'AAPL')
+            period - the period of historical asset, market, and risk-free rate, data
+                used in the calculations
+            exp_ret_flags - a list of returns calculation methods (see EXP_RETURN_METHODS); 
+                methods that do not apply (the Dividend Discount Model for an asset 
+                without a usable dividend history, or the Capital Asset Pricing Model 
+                without market_symbol and rfr_symbol) are left out, with the reason in 
+                the table; any other error is raised
+            time_horizon - the future period to be forecasted and backtested (in months)
+            n_simulations - the number of simulations shared by every method
+            standev_window - the number of days used to calculate the rolling standard 
+                deviation of asset prices
+            market_symbol - a ticker symbol for a market index (e.g., '^GSPC'); needed 
+                for the Capital Asset Pricing Model
+            rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX'); needed 
+                for the Capital Asset Pricing Model
+            seed - an integer seed for the random draws; fresh entropy is used if None
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64 or np.float32
+
+        Returns: A pandas.DataFrame with one row per method, indexed by exp_ret_flag (see 
+            run_method_comparison): its expected returns and terminal price statistics, 
+            then its backtest expected returns and backtest scores, and finally why the 
+            method was left out ('skipped'; None for compared methods); the other 
+            columns of a method left out are NaN. This method calls self.notify() to 
+            notify observers of the comparison_figure, or of any error message before 
+            the error is raised
+        """
+        # Run as protected code, so observers see the outcome of every run
+        try:
+            dtype = self._validate_dtype(dtype)
+
+            # Verify the methods compared
+            if not isinstance(exp_ret_flags, (list, tuple)) or len(exp_ret_flags) == 0:
+                self.error_message = f'Error encountered in returns method comparison: "exp_ret_flags" must be a non-empty list, not {exp_ret_flags}'
+                raise TypeError
+            for exp_ret_flag in exp_ret_flags:
+                if exp_ret_flag not in EXP_RETURN_METHODS:
+                    self.error_message = f'Error encountered in returns method comparison: returns methods must be among {list(EXP_RETURN_METHODS)}, not {exp_ret_flag}'
+                    raise ValueError
+
+            # Set the starting index for the testing data equal to the investment horizon, 
+            # as in run_backtest
+            test_start_index = calc_num_steps(time_horizon)
+
+            # The method of the last run, restored once every method has been calculated
+            previous_flag = self.financial_asset.exp_ret_flag
+
+            # Calculate expected returns once for each method, over the whole period and over
+            # the training data, fetching only missing data
+            expected_returns = {}
+            backtest_returns = {}
+            skipped = {}
+            try:
+                for exp_ret_flag in exp_ret_flags:
+                    # The Capital Asset Pricing Model needs market and risk-free rate data
+                    if exp_ret_flag == 'Capital Asset Pricing Model' and (type(market_symbol) != str or type(rfr_symbol) != str):
+                        skipped[exp_ret_flag] = '"market_symbol" and "rfr_symbol" are needed'
+                        continue
+
+                    try:
+                        self.populate_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag)
+                        expected_returns[exp_ret_flag] = calc_exp_returns(
+                            financial_asset=self.financial_asset,
+                            market_index=self.market_index,
+                            risk_free_sec=self.risk_free_sec
+                            )
+                        backtest_returns[exp_ret_flag] = calc_exp_returns(
+                            financial_asset=self.financial_asset,
+                            market_index=self.market_index,
+                            risk_free_sec=self.risk_free_sec,
+                            end_index=-test_start_index # The ending index of the training data
+                            )
+
+                    # The Dividend Discount Model applies only to assets with a usable dividend 
+                    # history before the testing data; any other error is raised
+                    except (ValueError, IndexError) as error:
+                        if exp_ret_flag != 'Dividend Discount Model':
+                            raise
+                        expected_returns.pop(exp_ret_flag, None)
+                        skipped[exp_ret_flag] = f'no usable dividend history ({error})'
+
+            # Leave the asset's method as it was, even if a method failed
+            finally:
+                if isinstance(previous_flag, str):
+                    self.financial_asset.exp_ret_flag = previous_flag
+
+            if not expected_returns:
+                self.error_message = f'Error encountered in returns method comparison: none of {list(exp_ret_flags)} could be calculated for {asset_symbol}: {skipped}'
+                raise ValueError
+
+            # Get correct close column label
+            close_column = price_col_checker(self.financial_asset.asset_data)
+
+            # If chosen period is shorter than time horizon, there is no training data
+            if test_start_index >= self.financial_asset.asset_data.index.size:
+                self.error_message = 'Error encountered in returns method comparison: Chosen time period must be greater than investment horizon for training data comparison.'
+                raise ValueError
+
+            # Split the asset data into training data and testing data
+            asset_train = self.financial_asset.asset_data.iloc[:-test_start_index]
+            asset_test = self.financial_asset.asset_data.iloc[-test_start_index:]
+
+            initial_price = self.financial_asset.asset_data[close_column].iloc[-1, -1]
+            self._validate_sim_inputs(initial_price, 0, 0, time_horizon, n_simulations)
+
+            # One standardized Brownian Motion matrix, shared by every forecast; unseeded runs
+            # record fresh entropy first, so their draws can be cached and reproduced too
+            if seed is None:
+                seed = self._create_rng(None, sampler).seed
+            time_grid = calc_time_grid(calc_num_steps(time_horizon, self.step_granularity))
+            brownian = self._get_brownian(self.brownian_cache, seed, n_simulations, time_grid, antithetic, sampler, dtype)
+
+            table, backtest_summaries = run_method_comparison(
+                initial_price=initial_price,
+                expected_returns=expected_returns,
+                his_vol=calc_volatility(self.financial_asset.asset_data.copy(), standev_window),
+                time_grid=time_grid,
+                brownian=brownian,
+                backtest_price=asset_test[close_column].iloc[0, 0],
+                backtest_returns=backtest_returns,
+                backtest_vol=calc_volatility(asset_train.copy(), standev_window),
+                actual=asset_test[close_column],
+                memory_budget=self.memory_budget
+                )
+
+            # Overlay every method's backtest on the testing data
+            self._comparison_figure = method_comparison_vis(backtest_summaries, asset_test[close_column])
+
+            # Keep a row for every method requested, with the reason any was left out
+            table = table.reindex(list(exp_ret_flags))
+            table['skipped'] = [skipped.get(exp_ret_flag) for exp_ret_flag in table.index]
+
+        # Notify observers if an exception occurred, then raise it to the caller
+        except Exception as e:
+            # If no exception message has been set, use generalized message
+            if self.error_message == None:
+                self.error_message = f'An exception occurred: {e}'
+
+            self.notify()
+            raise
+
+        self.notify()
+
+        return table
+
+    def search_windows(
+            self,
+            asset_symbol: str,
+            period: str,
+            exp_ret_flag: str,
+            standev_windows: list,
+            returns_windows: list = (150,),
+            time_horizon: int = 12,
+            search: str = 'grid',
+            n_trials: int = None,
+            metric: str = 'crps',
+            patience: int = None,
+            origin_step: int = 21,
+            n_simulations: int = 1000,
+            market_symbol: str = None,
+            rfr_symbol: str = None,
+            seed: int = None,
+            analytic: bool = False,
+            antithetic: bool = False,
+            sampler: str = 'pseudo',
+            dtype: type = np.float64,
+            n_threads: int = None,
+            results_path: str = None
+            ) -> WindowSearchResult:
+        """
+        Searches for the volatility window (standev_window) and returns window 
+        (returns_window) whose forecasts score best in a walk-forward backtest, as run 
+        by run_walk_forward. The asset data is loaded once and its running sums of 
+        returns calculated once (see RollingMoments), so each trial's rolling inputs 
+        cost one vectorized subtraction; every trial forecasts from the same origins with 
+        the same random draws. Trials run in parallel, and the search can stop early 
+        once the best score stops improving.
+
+        Parameters:
+            asset_symbol - a ticker symbol for a financial asset (e.g., 'AAPL')
+            period - the period of historical asset, market, and risk-free rate, data
+                used in the calculations
+            exp_ret_flag - a string holding the returns calculation method used to
+                predict future asset returns (e.g., 'Simple Average Returns'); methods 
+                other than the average methods have no returns window, and only 
+                standev_window is searched
+            standev_windows - a list of candidate numbers of days used to calculate the 
+                rolling standard deviation of asset prices
+            returns_windows - a list of candidate numbers of days used to calculate 
+                average or weighted average returns
+            time_horizon - the future period forecasted from each origin (in months); 
+                forecasts drift and spread over its length in years, the units of the 
+                expected returns, to the price time_horizon months after the origin
+            search - 'grid' to try every combination of windows, or 'random' to try 
+                n_trials combinations drawn without replacement
+            n_trials - the number of combinations tried by a random search
+            metric - the walk-forward score minimized: 'crps', 'pinball' or 'coverage' 
+                (see calc_search_score)
+            patience - the number of trials without improvement after which the search 
+                stops; every candidate is tried if None
+            origin_step - the number of trading days between consecutive origins
+            n_simulations - the number of simulations shared by every origin and trial
+            market_symbol - a ticker symbol for a market index (e.g., '^GSPC')
+            rfr_symbol - a ticker symbol for a 'risk-free' asset (e.g, '^IRX')
+            seed - an integer seed for the random draws and the candidates of a random 
+                search; fresh entropy is used if None
+            analytic - if True, terminal prices are forecast in closed form, with no 
+                random draws
+            antithetic - if True, simulations are generated in antithetic pairs (Z, -Z)
+            sampler - 'pseudo' for pseudo-random draws or 'sobol' for quasi-random 
+                Sobol' draws assembled with a Brownian bridge
+            dtype - the floating point type of the simulated paths: np.float64 or np.float32
+            n_threads - the number of trials run at once; defaults to default_thread_count()
+            results_path - the path of a JSON file the best windows are recorded in, by 
+                ticker symbol and returns method (see save_best_windows); nothing is 
+                recorded if None
+
+        Returns: A WindowSearchResult with every trial's windows and scores, and the best 
+            windows. This method calls self.notify() to notify observers of the search, 
+            or of any error message before the error is raised
+        """
+        # Run as protected code, so observers see the outcome of every run
+        try:
+            dtype = self._validate_dtype(dtype)
+
+            # Verify the candidate windows
+            for name, values in (('standev_windows', standev_windows), ('returns_windows', returns_windows)):
+                if not isinstance(values, (list, tuple)) or len(values) == 0:
+                    self.error_message = f'Error encountered in window search: "{name}" must be a non-empty list, not {values}'
+                    raise TypeError
+                for window in values:
+                    if not isinstance(window, (int, np.integer)) or isinstance(window, bool) or window <= 1:
+                        self.error_message = f'Error encountered in window search: "{name}" must hold integers greater than 1, not {window}'
+                        raise ValueError
+            if exp_ret_flag not in EXP_RETURN_METHODS:
+                self.error_message = f'Error encountered in window search: returns method must be among {list(EXP_RETURN_METHODS)}, not {exp_ret_flag}'
+                raise ValueError
+            if not isinstance(origin_step, int) or isinstance(origin_step, bool) or origin_step <= 0:
+                self.error_message = f'Error encountered in window search: "origin_step" must be a positive integer, not {origin_step}'
+                raise ValueError
+
+            # Populating primary data fields for the calculations
+            self.populate_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag)
+
+            # Get correct close column label
+            close_column = price_col_checker(self.financial_asset.asset_data)
+            prices = self.financial_asset.asset_data[close_column].iloc[:, 0]
+
+            # Running sums of returns, shared by every trial
+            moments = RollingMoments(prices)
+            has_returns_window = exp_ret_flag in ('Simple Average Returns', 'Exponential Weighted Average Returns')
+
+            # Origins with a full window of every candidate before them, so that every trial 
+            # is scored on the same forecasts
+            horizon_steps = calc_num_steps(time_horizon)
+            min_history = max(max(standev_windows) + 1, max(returns_windows) if has_returns_window else 0)
+            origins = calc_walk_forward_origins(prices.size, horizon_steps, origin_step, min_history)
+            if origins.size == 0:
+                self.error_message = 'Error encountered in window search: Chosen time period must be longer than the investment horizon plus the longest window.'
+                raise ValueError
+
+            # Methods without a returns window have the same expected returns in every trial
+            expected_returns = None
+            if not has_returns_window:
+                expected_returns = np.array([
+                    calc_exp_returns(
+                        financial_asset=self.financial_asset,
+                        market_index=self.market_index,
+                        risk_free_sec=self.risk_free_sec,
+                        end_index=origin
+                        )
+                    for origin in origins
+                    ])
+
+                # Drop origins without enough history for their expected returns
+                has_inputs = ~np.isnan(expected_returns)
+                if not has_inputs.any():
+                    self.error_message = 'Error encountered in window search: Chosen time period is too short to calculate expected returns before any origin.'
+                    raise ValueError
+                origins, expected_returns = origins[has_inputs], expected_returns[has_inputs]
+
+            self._validate_sim_inputs(float(prices.iloc[origins[0]]), 0, 0, time_horizon, n_simulations)
+
+            rng = None if analytic else self._create_rng(seed, sampler)
+
+            try:
+                result = run_window_search(
+                    moments=moments,
+                    exp_ret_flag=exp_ret_flag,
+                    standev_windows=list(standev_windows),
+                    returns_windows=list(returns_windows),
+                    origins=origins,
+                    horizon_steps=horizon_steps,
+                    time_grid=calc_time_grid(calc_num_steps(time_horizon, self.step_granularity)),
+                    expected_returns=expected_returns,
+                    search=search,
+                    n_trials=n_trials,
+                    metric=metric,
+                    patience=patience,
+                    n_simulations=n_simulations,
+                    rng=rng,
+                    analytic=analytic,
+                    n_threads=n_threads,
+                    antithetic=antithetic,
+                    dtype=dtype,
+                    memory_budget=self.memory_budget,
+                    seed=seed if rng is None else rng.seed,
+                    horizon_time=calc_horizon_time(time_horizon)
+                    )
+            except ValueError as error:
+                self.error_message = f'Error encountered in window search: {error}'
+                raise ValueError
+
+            # Record the best windows for later runs
+            if results_path is not None:
+                save_best_windows(results_path, asset_symbol, result)
+
+        # Notify observers if an exception occurred, then raise it to the caller
+        except Exception as e:
+            # If no exception message has been set, use generalized message
+            if self.error_message == None:
+                self.error_message = f'An exception occurred: {e}'
+
+            self.notify()
+            raise
+
+        self.notify()
+
+        return result
+
+    def plan_simulation(
+            self, 
+            n_simulations: int, 
+            time_horizon: int, 
+            dtype: type = np.float64, 
+            outputs: tuple = ('bands',),
+            expected_returns: float = None,
+            his_vol: float = None
+            ) -> SimulationPlan:
+        """
+        Chooses how a simulation is run within the memory_budget property: holding every 
+        path in memory, streaming paths in chunks, sampling terminal prices only, or 
+        writing paths to disk. The plan is kept in the simulation_plan property.
+
+        Parameters:
+            n_simulations - the number of simulations to be run
+            time_horizon - the future period to be forecasted (in months)
+            dtype - the floating point type of the simulated paths
+            outputs - the outputs needed, a subset of SIM_OUTPUTS: 'bands', 'paths' 
+                and/or 'terminal'
+            expected_returns - the expected returns of the asset, if known
+            his_vol - the volatility of the asset; if known, the memory of the quantile 
+                sketch that streams bands is counted in the plan
+
+        Returns: A SimulationPlan with the chosen strategy and estimated memory use
+        """
+        dtype = self._validate_dtype(dtype)
+
+        # Log-prices over the unit time grid have standard deviation his_vol at the end
+        # of the horizon, and drift by calc_drift
+        log_drift = 0.0
+        if his_vol is not None and expected_returns is not None:
+            log_drift = calc_drift(expected_returns, his_vol)
+
+        self._simulation_plan = plan_simulation(
+            n_simulations=n_simulations,
+            num_steps=calc_num_steps(time_horizon, self.step_granularity),
+            dtype=dtype,
+            outputs=outputs,
+            memory_budget=self.memory_budget,
+            log_std=his_vol,
+            log_drift=log_drift
+            )
+
+        return self._simulation_plan
+
+    def _get_brownian(self,
+            brownian_cache: BrownianCache,
+            seed: int,
+            n_simulations: int,
+            time_grid: np.ndarray,
+            antithetic: bool,
+            sampler: str,
+            dtype: np.dtype
+            ) -> np.ndarray:
+        """
+        Returns the standardized Brownian Motion paths of a seeded run from brownian_cache, 
+        drawing and caching them if they are not cached. Matrices that do not fit in the 
+        memory budget beside a run's arrays are drawn but not cached (see 
+        _fits_brownian_cache).
+        """
+        # Creating the source of random draws validates the sampler and records the seed
+        rng = self._create_rng(seed, sampler)
+
+        key = self._brownian_key(seed, n_simulations, time_grid, antithetic, sampler, dtype)
+
+        brownian = brownian_cache.get(key)
+        if brownian is None:
+            brownian = np.empty((n_simulations, time_grid.size), dtype=dtype)
+            random_normal = rng.standard_normal(
+                0, n_simulations, time_grid.size - 1, out=brownian[:, 1:], antithetic=antithetic, dtype=dtype)
+            calc_brownian_paths(time_grid, random_normal, out=brownian)
+
+            if self._fits_brownian_cache(n_simulations, time_grid.size, dtype):
+                brownian_cache.put(key, brownian)
+
+        return brownian
+
+    def _brownian_key(
+            self, 
+            seed: int, 
+            n_simulations: int, 
+            time_grid: np.ndarray, 
+            antithetic: bool, 
+            sampler: str, 
+            dtype: np.dtype
+            ) -> tuple:
+        """Returns the brownian_cache key of a seeded run: everything that changes its draws"""
+        return (
+            seed, n_simulations, time_grid.size, sampler, 
+            self.bit_generator if sampler == 'pseudo' else None, antithetic, np.dtype(dtype).name
+            )
+
+    def _fits_brownian_cache(self, n_simulations: int, num_steps: int, dtype: type) -> bool:
+        """
+        Returns whether a cached Brownian Motion matrix fits in the memory budget beside 
+        the arrays of a run that holds every path, which is planned without it.
+        """
+        plan = plan_simulation(n_simulations, num_steps, dtype, ('paths',), self.memory_budget)
+
+        return plan.strategy == 'full' and \
+            plan.estimated_bytes + estimate_path_bytes(n_simulations, num_steps, dtype) <= self.memory_budget
+
+    def _create_rng(self, seed: int = None, sampler: str = 'pseudo') -> SimulationRNG:
+        """
+        Creates the source of random draws for a simulation run using the selected 
+        sampler and bit generator, and records its seed so that the run can be reproduced.
+        """
+        match sampler:
+            case 'pseudo':
+                rng = SimulationRNG(seed=seed, bit_generator=self.bit_generator)
+            case 'sobol':
+                rng = SobolRNG(seed=seed)
+            case _:
+                self.error_message = f'Error encountered in Monte Carlo simulation: "sampler" must be \'pseudo\' or \'sobol\', not {sampler}'
+                raise ValueError
+        self._seed = rng.seed
+
+        return rng
+
+    def _validate_sim_inputs(self,
+            initial_price: float,
+            expected_returns: float,
+            his_vol: float,
+            time_horizon: int,
+            n_simulations: int
+            ) -> None:
+        """
+        Verifies that Monte Carlo simulation arguments are of the correct type and
+        within the expected range. Sets the error message and raises a TypeError or
+        ValueError if they are not.
+        """
         # Verify arguments are of the correct type
         if not isinstance(initial_price, Number):
             self.error_message = f'Error encountered in Monte Carlo simulation: "initial_price" must be a number, not {type(initial_price)}'
@@ -365,39 +1898,24 @@ class Simulator(Subject):
             self.error_message = f'Error encountered in Monte Carlo simulation: "n_simulations" must be greater than zero, not {n_simulations}'
             raise ValueError
 
-        # Set the number of trading days to match the time_horizon
-        num_steps = round(time_horizon / (MONTHS_PER_YEAR/ANNUAL_TRADING_DAYS))
-
-        # The proportion of the time horizon each step represents (dt) 
-        # Used to scale results as distance from day zero increases
-        step_size = 1/num_steps
-
-        # Calculating the stochastic drift: The change in the average value
-        # of a random process
-        drift = expected_returns - 0.5 * his_vol**2
-
-        # Get random normal distribution with the right scale and dimensions
-        random_normal = np.random.normal(
-            scale=np.sqrt(step_size),
-            size=(n_simulations, num_steps)
-            )
-
-        # Take the cumulative sum of the normal distribution to simulate Brownian Motion
-        brownian_motion = np.cumsum(random_normal, axis=1)
+    def _validate_dtype(self, dtype: type) -> np.dtype:
+        """
+        Verifies that a simulation's floating point type is one of SIM_DTYPES. Sets the 
+        error message and raises a ValueError if it is not.
 
-        # Populate time step data; does not start at index=0 because that is filled in
-        # later with the initial price of the asset
-        time_step = np.linspace(step_size, step_size, num_steps)
-        time_steps = np.broadcast_to(time_step, (n_simulations, num_steps))
+        Returns: The floating point type as an np.dtype
+        """
+        # np.dtype raises a TypeError for values that are not types at all
+        try:
+            dtype = np.dtype(dtype)
+        except TypeError:
+            pass
 
-        # Calculate simulation results
-        prices = initial_price * np.exp(drift * time_steps + his_vol * brownian_motion)
+        if not isinstance(dtype, np.dtype) or dtype.name not in SIM_DTYPES:
+            self.error_message = f'Error encountered in Monte Carlo simulation: "dtype" must be one of {list(SIM_DTYPES)}, not {dtype}'
+            raise ValueError
 
-        # Insert initial price as the first value
-        prices[0,:] = initial_price
-
-        # Transpose data for visualizations
-        return prices.transpose()
+        return dtype
 
     @property
     def risk_free_sec(self) -> RiskFreeSecurity:
@@ -419,10 +1937,69 @@ class Simulator(Subject):
     def sim_figure(self) -> Figure:
         return self._sim_figure
 
+    @property
+    def comparison_figure(self) -> Figure:
+        return self._comparison_figure
+
     @property
     def error_message(self) -> str:
         return self._error_message
 
+    @property
+    def bit_generator(self) -> str:
+        return self._bit_generator
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def kernel_backend(self) -> str:
+        return self._kernel_backend
+
+    @property
+    def step_granularity(self) -> str | int:
+        """The simulation time step size: 'daily', 'weekly', 'monthly' or a number of trading days"""
+        return self._step_granularity
+
+    @property
+    def memory_budget(self) -> int:
+        """The most memory a simulation's arrays should use, in bytes"""
+        return self._memory_budget
+
+    @property
+    def simulation_plan(self) -> SimulationPlan:
+        """The plan of the most recent simulation: its strategy and estimated memory use"""
+        return self._simulation_plan
+
+    @property
+    def simulation_result(self) -> SimulationResult:
+        """The output of the most recent run_simulation, with its cached statistics"""
+        return self._simulation_result
+
+    @property
+    def workspace(self) -> SimulationWorkspace:
+        """The reusable buffers of run_simulation; call workspace.release() to free them"""
+        return self._workspace
+
+    @property
+    def brownian_cache(self) -> BrownianCache:
+        """The Brownian Motion reused by seeded reruns of run_simulation; see BrownianCache"""
+        return self._brownian_cache
+
+    @property
+    def variance_report(self) -> VarianceReductionReport:
+        return self._variance_report
+
+    @property
+    def convergence_report(self) -> ConvergenceReport:
+        return self._convergence_report
+
+    @property
+    def forecast_scores(self) -> ForecastScores:
+        """The scores of the latest backtest's forecasts against the observed prices"""
+        return self._forecast_scores
+
     @risk_free_sec.setter
     def risk_free_sec(self, risk_free_sec: RiskFreeSecurity) -> None:
         self._risk_free_sec = risk_free_sec
@@ -438,3 +2015,30 @@ class Simulator(Subject):
     @error_message.setter
     def error_message(self, error_message: str) -> None:
         self._error_message = error_message
+
+    @bit_generator.setter
+    def bit_generator(self, bit_generator: str) -> None:
+        if bit_generator not in BIT_GENERATORS:
+            raise ValueError(f'Bit generator must be one of {list(BIT_GENERATORS.keys())}, not {bit_generator}')
+        self._bit_generator = bit_generator
+
+    @step_granularity.setter
+    def step_granularity(self, step_granularity: str | int) -> None:
+        # Verify the step size is a known granularity or a positive number of trading days
+        calc_days_per_step(step_granularity)
+        self._step_granularity = step_granularity
+
+    @memory_budget.setter
+    def memory_budget(self, memory_budget: int) -> None:
+        if not isinstance(memory_budget, int) or isinstance(memory_budget, bool) or memory_budget <= 0:
+            raise ValueError(f'"memory_budget" must be a positive integer, not {memory_budget}')
+        self._memory_budget = memory_budget
+
+        # Cached Brownian Motion is held beside a run's own arrays, within half the budget
+        self._brownian_cache.max_bytes = memory_budget // 2
+
+    @kernel_backend.setter
+    def kernel_backend(self, kernel_backend: str) -> None:
+        # Verify the backend exists and its packages are installed
+        get_backend(kernel_backend)
+        self._kernel_backend = kernel_backend
@@ -3,10 +3,18 @@ from matplotlib.figure import Figure
 import numpy as np
 import pandas as pd
 
-from monte_carlo_simulator.const import ANNUAL_TRADING_DAYS, MONTHS_PER_YEAR
+from monte_carlo_simulator.const import BACKTEST_PLOT_PATHS, STEP_AXIS_LABELS
+from monte_carlo_simulator.service.engine.band_summary import BandSummary
+from monte_carlo_simulator.service.engine.path_kernel import calc_days_per_step
+from monte_carlo_simulator.service.engine.path_store import PathStore
+from monte_carlo_simulator.service.engine.simulation_result import SimulationResult
 
 
-def monte_carlo_sim_vis(sim_data: np.ndarray, time_horizon: int = 12) -> Figure:
+def monte_carlo_sim_vis(
+        sim_data: np.ndarray | BandSummary | SimulationResult, 
+        time_horizon: int = 12, 
+        step_granularity: str | int = 'daily'
+        ) -> Figure:
     """
     Visualizes monte carlo simulation results.
     Produces two plots, one mapping each simulation in a line plot with 
@@ -15,7 +23,10 @@ def monte_carlo_sim_vis(sim_data: np.ndarray, time_horizon: int = 12) -> Figure:
     Assumes normallly distributed data.
 
     Parameters: 
-        sim_data - a numpy array of forward-looking simulation output.
+        sim_data - a numpy array of forward-looking simulation output, a BandSummary 
+            of the output (the mean and band percentile prices at each time step, from 
+            a kernel backend or the streaming simulation engines), or a SimulationResult, 
+            whose cached band summary is charted.
         test_sim_data - a numpy array of backward-looking simulation output
             for comparison with actual results, replicating the investment time
             horizon.
@@ -23,15 +34,15 @@ def monte_carlo_sim_vis(sim_data: np.ndarray, time_horizon: int = 12) -> Figure:
             as far as the chosen investment time horizon.
         time_horizon - an integer indicating how far out the simulation 
             attempts to forecast.
+        step_granularity - the size of the simulation's time steps: 'daily', 'weekly', 
+            'monthly' or a number of trading days; sets the time axis units.
 
     Returns: A Figure object with two plots: plot1 displays the simulated
         paths, and plot2 displays mean and percentile data.
     """
-    global ANNUAL_TRADING_DAYS # The number of trading days in a year
-    
-    # Verify sim_data is a numpy array
-    if not isinstance(sim_data, np.ndarray):
-        raise TypeError(f'"sim_data" parameter must be an numpy.ndarray, not {type(sim_data)}')
+    # Verify sim_data is a numpy array, or a summary or result of simulation output
+    if not isinstance(sim_data, (np.ndarray, BandSummary, SimulationResult)):
+        raise TypeError(f'"sim_data" parameter must be a numpy.ndarray, BandSummary or SimulationResult, not {type(sim_data)}')
    
     # Verify time_horizon is an integer
     elif not isinstance(time_horizon, int) or isinstance(time_horizon, bool):
@@ -41,27 +52,38 @@ def monte_carlo_sim_vis(sim_data: np.ndarray, time_horizon: int = 12) -> Figure:
     elif time_horizon <= 0:
         raise ValueError(f'"time_horizon" parameter must be positive, not {time_horizon}')
 
+    # Number of trading days per time step; raises a ValueError for unknown step sizes
+    days_per_step = calc_days_per_step(step_granularity)
+
+    # Summarize full simulation output; streamed output is already summarized
+    if isinstance(sim_data, np.ndarray):
+        sim_data = BandSummary.from_paths(sim_data)
+
+    # Chart the result's summary, calculated once and shared with other consumers
+    elif isinstance(sim_data, SimulationResult):
+        sim_data = sim_data.band_summary
+
     # Set visualization variables
-    mean_prices = sim_data.mean(axis=1) # Mean of future price simulation
-    one_std_below_mean = np.percentile(sim_data, 15.8665, axis=1) # -1 standard deviation below the mean
-    one_std_above_mean = np.percentile(sim_data, 84.134, axis=1) # +1 standard deviation above the mean
-    two_std_below_mean = np.percentile(sim_data, 2.275, axis=1) # -2 standard deviations below the mean
-    two_std_above_mean = np.percentile(sim_data, 97.725, axis=1) # +2 standard deviations above the mean
+    mean_prices = sim_data.mean # Mean of future price simulation
+    one_std_below_mean = sim_data.percentiles[15.8665] # -1 standard deviation below the mean
+    one_std_above_mean = sim_data.percentiles[84.134] # +1 standard deviation above the mean
+    two_std_below_mean = sim_data.percentiles[2.275] # -2 standard deviations below the mean
+    two_std_above_mean = sim_data.percentiles[97.725] # +2 standard deviations above the mean
 
     fig = Figure(figsize=(7, 4), facecolor='#1E1E1E') # Create figure object
     axs1 = fig.add_subplot(111) # Add subplot
 
     # Create Plot: Future Price prediction
-    axs1.plot(mean_prices, label='Mean', color='#F3773E')
+    axs1.plot(sim_data.steps, mean_prices, label='Mean', color='#F3773E')
     axs1.fill_between(
-        range(round(time_horizon / (MONTHS_PER_YEAR/ANNUAL_TRADING_DAYS))),
+        sim_data.steps,
         one_std_below_mean,
         one_std_above_mean,
         color='#57C8FF',
         label='One Standard Deviation'
     )
     axs1.fill_between(
-        range(round(time_horizon / (MONTHS_PER_YEAR/ANNUAL_TRADING_DAYS))),
+        sim_data.steps,
         two_std_below_mean,
         two_std_above_mean,
         color='#0080BA',
@@ -73,9 +95,12 @@ def monte_carlo_sim_vis(sim_data: np.ndarray, time_horizon: int = 12) -> Figure:
         color='white')
 
     # Set axis tick spacing, color, and labels for the plot
-    axs1.set_xlabel('Trading Days', color='white')
+    axs1.set_xlabel(
+        STEP_AXIS_LABELS.get(step_granularity, f'Time Steps ({days_per_step} Trading Days)'), 
+        color='white')
     axs1.set_ylabel('Price in USD', color='white')
-    axs1.set_xlim(-3, len(sim_data))
+    # Margins of 3 trading days before and 1 after the simulated steps
+    axs1.set_xlim(-3 / days_per_step, sim_data.steps[-1] + 1 / days_per_step)
     axs1.set_ylim(two_std_below_mean.min() - 5, two_std_above_mean.max() + 5)
     axs1.tick_params(axis='x', colors='white')
     axs1.tick_params(axis='y', colors='white')
@@ -98,7 +123,10 @@ def backtest_vis(train_sim: np.ndarray, test_data: pd.DataFrame) -> Figure:
 
     Parameters: 
         train_sim - a numpy.ndarray of simulated price paths based on 
-            training data.
+            training data, one row per time step, or a PathStore of paths on disk, of 
+            which a sample of BACKTEST_PLOT_PATHS paths is charted. Paths with coarser 
+            time steps than test_data are charted at the dates the same proportion of 
+            the way through the testing period.
         test_data - a pandas.DataFrame of actual prices to compare against
             the predicted prices produced by the training data.
     
@@ -107,9 +135,13 @@ def backtest_vis(train_sim: np.ndarray, test_data: pd.DataFrame) -> Figure:
     # Verify asset_data is a DataFrame
     if not isinstance(test_data, pd.DataFrame):
         raise TypeError(f'"test_data" parameter must be a DataFrame, not {type(test_data)}')
-    # Verify train_sim is a numpy array
-    if not isinstance(train_sim, np.ndarray):
-        raise TypeError(f'"train_sim" parameter must be an numpy.ndarray, not {type(train_sim)}')
+    # Verify train_sim is a numpy array or a store of paths on disk
+    if not isinstance(train_sim, (np.ndarray, PathStore)):
+        raise TypeError(f'"train_sim" parameter must be an numpy.ndarray or PathStore, not {type(train_sim)}')
+
+    # Read only a sample of the paths on disk into memory to chart
+    if isinstance(train_sim, PathStore):
+        train_sim = train_sim.sample(BACKTEST_PLOT_PATHS)
 
     # Create a Matplotlib Figure and add a subplot
     fig = Figure(figsize=(7, 4), facecolor='#1E1E1E')
@@ -122,9 +154,14 @@ def backtest_vis(train_sim: np.ndarray, test_data: pd.DataFrame) -> Figure:
 
     # Use the testing data index for the y-axis values
     plot_index = test_data.index
+
+    # Each time step of the simulation spans the same proportion of the testing period
+    sim_index = plot_index
+    if train_sim.shape[0] != plot_index.size:
+        sim_index = plot_index[np.round(np.linspace(0, plot_index.size - 1, train_sim.shape[0])).astype(int)]
     
     # Chart price path lines on the figure object
-    axs1.plot(plot_index, train_sim, alpha=0.2)
+    axs1.plot(sim_index, train_sim, alpha=0.2)
 
     # Create double-line for actual prices with contrasting colors to stand out 
     # against the multi-colored price paths
@@ -151,3 +188,69 @@ def backtest_vis(train_sim: np.ndarray, test_data: pd.DataFrame) -> Figure:
     axs1.grid(color='#3E3E3E', linestyle='--')
         
     return fig
+
+def method_comparison_vis(backtest_summaries: dict, test_data: pd.DataFrame) -> Figure:
+    """
+    Overlays the backtest forecasts of several expected returns methods on the actual
+    prices observed over the testing period: each method's mean price and its widest
+    confidence band.
+
+    Parameters: 
+        backtest_summaries - a dictionary mapping each expected returns method to a 
+            BandSummary of its backtest paths, as returned by run_method_comparison
+        test_data - a pandas.DataFrame of actual prices to compare against
+
+    Returns: a Figure object displaying the methods' forecasts vs. the test prices.
+    """
+    # Verify test_data is a DataFrame
+    if not isinstance(test_data, pd.DataFrame):
+        raise TypeError(f'"test_data" parameter must be a DataFrame, not {type(test_data)}')
+
+    # Create a Matplotlib Figure and add a subplot
+    fig = Figure(figsize=(7, 4), facecolor='#1E1E1E')
+    axs1 = fig.add_subplot(111)
+
+    # Use the testing data index for the y-axis values
+    plot_index = test_data.index
+
+    for exp_ret_flag, summary in backtest_summaries.items():
+        # Each time step of the simulation spans the same proportion of the testing period
+        sim_index = plot_index
+        if summary.num_steps != plot_index.size:
+            sim_index = plot_index[np.round(np.linspace(0, plot_index.size - 1, summary.num_steps)).astype(int)]
+
+        # Chart the mean and shade the widest band in the same color
+        mean_line, = axs1.plot(sim_index, summary.mean, label=exp_ret_flag, linewidth=1.5)
+        axs1.fill_between(
+            sim_index,
+            summary.percentiles[min(summary.percentiles)],
+            summary.percentiles[max(summary.percentiles)],
+            color=mean_line.get_color(),
+            alpha=0.15
+            )
+
+    # Create double-line for actual prices with contrasting colors to stand out 
+    # against the forecasts
+    axs1.plot(plot_index, test_data, color='#000000', linewidth=3)
+    axs1.plot(plot_index, test_data, color='#F3F3F3', label='Actual Prices', linewidth=2)
+    axs1.set_title('Expected Returns Methods vs. Actual Price', color='white')
+
+    # Setup legend, adjust colors and size for graph for the plot
+    legend = axs1.legend(loc='upper left', fontsize='small')
+    for text in legend.get_texts():
+        text.set_color('white')
+
+    legend.get_frame().set_facecolor('#3E3E3E')
+
+    # Set axis tick spacing, color, and labels for the plot
+    axs1.set_xlabel('Trading Days', color='white')
+    axs1.set_ylabel('Price in USD', color='white')
+    axs1.set_xlim(plot_index[0] - pd.DateOffset(days=7), plot_index[-1])
+    axs1.tick_params(axis='x', colors='white')
+    axs1.tick_params(axis='y', colors='white')
+
+    # Set color, grid color and style for the plot
+    axs1.set_facecolor('#2E2E2E')
+    axs1.grid(color='#3E3E3E', linestyle='--')
+
+    return fig
@@ -2,6 +2,7 @@
 import unittest
 from unittest.mock import MagicMock, PropertyMock
 import tkinter as tk
+import numpy as np
 
 from monte_carlo_simulator.gui.frames.assumptions_frame_obs import AssumptionsFrame
 from monte_carlo_simulator.gui.frames.sim_frame import SimFrame
@@ -9,6 +10,7 @@ from monte_carlo_simulator.model.financial_asset import FinancialAsset
 from monte_carlo_simulator.model.market_index import MarketIndex
 from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
 from monte_carlo_simulator.service.simulator_subj import Simulator
+from monte_carlo_simulator.service.engine import ConvergenceReport, ForecastScores, SimulationResult
 
 class TestAssumptionsFrame(unittest.TestCase):
 
@@ -285,5 +287,72 @@ class TestAssumptionsFrame(unittest.TestCase):
         self.assertEqual(self.assumptions_frame.rfr_label.cget('text'), '')
 
 
+    def test_update_convergence_label(self):
+        # Set return value to an adaptive run's convergence report
+        type(self.mock_simulator).convergence_report = PropertyMock(
+            return_value=ConvergenceReport(n_paths=4000, standard_errors={'mean': 0.004}, tolerance=0.005, converged=True))
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(
+            self.assumptions_frame.convergence_label.cget('text'), 'Simulations used: 4000 (standard error:  0.400%)')
+
+    def test_update_convergence_label_cleared(self):
+        # Set return value for a run without adaptive simulation
+        type(self.mock_simulator).convergence_report = PropertyMock(return_value=None)
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(self.assumptions_frame.convergence_label.cget('text'), '')
+
+    def test_update_terminal_stats_label(self):
+        # Set return value to a result that kept every path
+        paths = np.array([[100.0, 100.0, 100.0, 100.0], [90.0, 110.0, 120.0, 130.0]])
+        type(self.mock_simulator).simulation_result = PropertyMock(
+            return_value=SimulationResult(initial_price=100.0, paths=paths))
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(
+            self.assumptions_frame.terminal_stats_label.cget('text'), 
+            'Expected terminal price:  112.50 (probability of loss:  25.00%)')
+
+    def test_update_terminal_stats_label_cleared(self):
+        # Set return value for a run without a result
+        type(self.mock_simulator).simulation_result = PropertyMock(return_value=None)
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(self.assumptions_frame.terminal_stats_label.cget('text'), '')
+
+    def test_update_forecast_scores_label(self):
+        # Set return value to the scores of a backtest
+        scores = ForecastScores(
+            coverage={68.2675: np.array([True, False]), 95.45: np.array([True, True])},
+            pinball={50: np.array([0.5, 1.0])},
+            crps=np.array([1.0, 2.0]))
+        type(self.mock_simulator).forecast_scores = PropertyMock(return_value=scores)
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(
+            self.assumptions_frame.forecast_scores_label.cget('text'),
+            'Backtest coverage: 68.27% band: 50.0%, 95.45% band: 100.0% (CRPS: 1.500)')
+
+    def test_update_forecast_scores_label_cleared(self):
+        # Set return value for a simulator without a backtest
+        type(self.mock_simulator).forecast_scores = PropertyMock(return_value=None)
+
+        # Call update() to set labels
+        self.assumptions_frame.update(self.mock_simulator)
+
+        self.assertEqual(self.assumptions_frame.forecast_scores_label.cget('text'), '')
+
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -304,6 +304,18 @@ class TestAssetReturnsCalculator(unittest.TestCase):
 
         self.assertAlmostEqual(expected_result, result)
 
+    def test_rolling_exp_returns_match_exp_returns(self):
+        simple_returns = calc_rolling_exp_returns(self.asset_data, 'Simple Average Returns', 30)
+        weighted_returns = calc_rolling_exp_returns(self.asset_data, 'Exponential Weighted Average Returns', 30)
+
+        for end in (30, 200, len(self.asset_data)):
+            self.assertAlmostEqual(simple_returns.iloc[end - 1], average_returns(self.asset_data.iloc[:end], 30))
+            self.assertAlmostEqual(weighted_returns.iloc[end - 1], exponential_weighted_average(self.asset_data.iloc[:end], 30))
+
+    def test_rolling_exp_returns_method_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_rolling_exp_returns(self.asset_data, 'Capital Asset Pricing Model')
+
 
 class TestBetaCalculator(unittest.TestCase):
 
@@ -256,6 +256,55 @@ class TestMarketCalculator(unittest.TestCase):
         result = calc_daily_market_returns(self.test_asset_data)
         self.assertIsInstance(result, np.float64)
 
+    def test_historic_volatilities_match_volatility(self):
+        windows = [2, 30, 60, 250]
+        result = calc_volatilities(self.test_asset_data, windows)
+        expected = [calc_volatility(self.test_asset_data.copy(), window) for window in windows]
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_historic_volatilities_window_longer_than_data(self):
+        result = calc_volatilities(self.test_asset_data, [len(self.test_asset_data) + 10])
+        expected = calc_volatility(self.test_asset_data.copy(), len(self.test_asset_data) + 10)
+
+        np.testing.assert_array_equal(np.isnan(result), np.isnan(expected))
+
+    def test_historic_volatilities_does_not_modify_data(self):
+        asset_data = self.test_asset_data.copy()
+        expected = asset_data.copy()
+        calc_volatilities(asset_data, [30])
+
+        pd.testing.assert_frame_equal(asset_data, expected)
+
+    def test_historic_volatilities_invalid_window_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_volatilities(self.test_asset_data, ['30'])
+
+    def test_historic_volatilities_invalid_window_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_volatilities(self.test_asset_data, [30, -30])
+
+    def test_historic_volatilities_invalid_data_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_volatilities('DataFrame', [30])
+
+    def test_rolling_volatility_matches_volatility(self):
+        result = calc_rolling_volatility(self.test_asset_data, 30)
+
+        for end in (31, 200, len(self.test_asset_data)):
+            self.assertAlmostEqual(result.iloc[end - 1], calc_volatility(self.test_asset_data.iloc[:end].copy(), 30))
+
+    def test_rolling_volatility_does_not_modify_data(self):
+        asset_data = self.test_asset_data.copy()
+        expected = asset_data.copy()
+        calc_rolling_volatility(asset_data, 30)
+
+        pd.testing.assert_frame_equal(asset_data, expected)
+
+    def test_rolling_volatility_invalid_window_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_rolling_volatility(self.test_asset_data, -30)
+
 
 if __name__ == '__main__':
     unittest.main()
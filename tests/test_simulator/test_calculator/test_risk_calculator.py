@@ -0,0 +1,51 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.calculator.risk_calculator import *
+
+
+class TestRiskCalculator(unittest.TestCase):
+
+    initial_price = 100.0
+    terminal_prices = np.array([80.0, 90.0, 100.0, 110.0, 120.0, 130.0, 140.0, 150.0])
+
+    # -----------------------------------------------------------------------------
+    # calc_terminal_stats tests
+    # -----------------------------------------------------------------------------
+
+    def test_calc_terminal_stats_expected_price(self):
+        result = calc_terminal_stats(self.terminal_prices, self.initial_price)
+        self.assertAlmostEqual(result['expected_price'], self.terminal_prices.mean())
+
+    def test_calc_terminal_stats_percentiles(self):
+        result = calc_terminal_stats(self.terminal_prices, self.initial_price, percentiles=(5, 50))
+        self.assertAlmostEqual(result['percentiles'][50], np.percentile(self.terminal_prices, 50))
+        self.assertAlmostEqual(result['percentiles'][5], np.percentile(self.terminal_prices, 5))
+
+    def test_calc_terminal_stats_prob_loss(self):
+        result = calc_terminal_stats(self.terminal_prices, self.initial_price)
+        self.assertAlmostEqual(result['prob_loss'], 0.25)
+
+    def test_calc_terminal_stats_full_sim_data_uses_last_step(self):
+        sim_data = np.vstack([np.full(8, self.initial_price), self.terminal_prices])
+        result = calc_terminal_stats(sim_data, self.initial_price)
+        self.assertAlmostEqual(result['expected_price'], self.terminal_prices.mean())
+
+    def test_calc_terminal_stats_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_terminal_stats([80.0, 90.0], self.initial_price)
+
+    # -----------------------------------------------------------------------------
+    # calc_prob_loss tests
+    # -----------------------------------------------------------------------------
+
+    def test_calc_prob_loss_no_loss(self):
+        self.assertEqual(calc_prob_loss(self.terminal_prices, 50.0), 0.0)
+
+    def test_calc_prob_loss_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_prob_loss(self.terminal_prices, '100')
+
+
+if __name__ == '__main__':
+    unittest.main()
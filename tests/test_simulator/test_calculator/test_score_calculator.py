@@ -0,0 +1,70 @@
+import unittest
+import numpy as np
+from scipy.stats import norm
+
+from monte_carlo_simulator.service.calculator.score_calculator import *
+
+
+class TestScoreCalculator(unittest.TestCase):
+
+    samples = np.exp(np.random.default_rng(6).normal(0.05, 0.2, (3, 400)))
+    observed = np.array([0.8, 1.05, 1.6])
+
+    def test_calc_band_coverage(self):
+        result = calc_band_coverage(np.array([1.0, 1.0, 1.0]), np.array([2.0, 2.0, 2.0]), np.array([0.5, 1.0, 2.5]))
+
+        np.testing.assert_array_equal(result, [False, True, False])
+
+    def test_calc_pit(self):
+        result = calc_pit(self.samples, self.observed)
+        expected = [np.mean(self.samples[i] <= self.observed[i]) for i in range(3)]
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_calc_pit_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_pit([1.0, 2.0], 1.5)
+
+    def test_calc_pit_histogram(self):
+        pit = np.array([0.05, 0.15, 0.15, 0.95, np.nan])
+        result = calc_pit_histogram(pit, n_bins=10)
+
+        self.assertEqual(result.size, 10)
+        self.assertAlmostEqual(result.sum(), 1.0)
+        self.assertAlmostEqual(result[1], 0.5)
+
+    def test_calc_pinball_loss(self):
+        quantile = np.array([100.0, 100.0])
+        result = calc_pinball_loss(quantile, np.array([110.0, 90.0]), 90)
+
+        # Observations above the 90th percentile cost 0.9 per unit, below it 0.1
+        np.testing.assert_allclose(result, [9.0, 1.0])
+
+    def test_calc_crps_matches_pairwise_definition(self):
+        result = calc_crps(self.samples, self.observed)
+        expected = [
+            np.abs(x - y).mean() - 0.5 * np.abs(x[:, np.newaxis] - x[np.newaxis, :]).mean()
+            for x, y in zip(self.samples, self.observed)
+            ]
+
+        np.testing.assert_allclose(result, expected)
+
+    def test_calc_crps_sorted_samples(self):
+        result = calc_crps(np.sort(self.samples, axis=1), self.observed, is_sorted=True)
+
+        np.testing.assert_allclose(result, calc_crps(self.samples, self.observed))
+
+    def test_calc_crps_single_sample_is_absolute_error(self):
+        result = calc_crps(np.array([[3.0]]), np.array([1.0]))
+
+        np.testing.assert_allclose(result, [2.0])
+
+    def test_calc_lognormal_crps_close_to_simulated(self):
+        samples = np.exp(norm.ppf((np.arange(20000) + 0.5) / 20000) * 0.2 + 0.05)
+        result = calc_lognormal_crps(0.05, 0.2, self.observed)
+        expected = calc_crps(np.tile(samples, (3, 1)), self.observed, is_sorted=True)
+
+        np.testing.assert_allclose(result, expected, rtol=1e-3)
+
+if __name__ == '__main__':
+    unittest.main()
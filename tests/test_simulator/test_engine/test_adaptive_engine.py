@@ -0,0 +1,79 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine import *
+
+
+class TestAdaptiveEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(3))
+
+    def run_sim(self, tolerance, max_simulations=20000, batch_size=500, seed=1):
+        return run_adaptive_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            tolerance=tolerance, max_simulations=max_simulations, batch_size=batch_size, 
+            rng=SimulationRNG(seed))
+
+    def test_run_adaptive_simulation_return_types(self):
+        summary, report = self.run_sim(tolerance=0.01)
+        self.assertIsInstance(summary, BandSummary)
+        self.assertIsInstance(report, ConvergenceReport)
+        self.assertEqual(summary.n_paths, report.n_paths)
+
+    def test_run_adaptive_simulation_converges(self):
+        _, report = self.run_sim(tolerance=0.01)
+        self.assertTrue(report.converged)
+        self.assertLessEqual(report.max_error, 0.01)
+        self.assertEqual(set(report.standard_errors.keys()), {'mean', *BAND_PERCENTILES})
+
+    def test_run_adaptive_simulation_stops_at_cap(self):
+        _, report = self.run_sim(tolerance=1e-6, max_simulations=1200)
+        self.assertFalse(report.converged)
+        self.assertEqual(report.n_paths, 1200)
+        self.assertGreater(report.max_error, 1e-6)
+
+    def test_run_adaptive_simulation_tighter_tolerance_uses_more_paths(self):
+        _, loose = self.run_sim(tolerance=0.01)
+        _, tight = self.run_sim(tolerance=0.004)
+        self.assertGreater(tight.n_paths, loose.n_paths)
+
+    def test_run_adaptive_simulation_matches_chunked(self):
+        # The adaptive run draws the same paths as a chunked run of the same length
+        summary, report = self.run_sim(tolerance=0.01)
+        chunked = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=report.n_paths, chunk_size=500, rng=SimulationRNG(1))
+        np.testing.assert_allclose(summary.mean, chunked.mean)
+
+    def test_run_adaptive_simulation_correlated_paths_value_error(self):
+        # Standard errors assume independent paths
+        with self.assertRaises(ValueError):
+            run_adaptive_simulation(
+                self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+                rng=SimulationRNG(1), antithetic=True)
+        with self.assertRaises(ValueError):
+            run_adaptive_simulation(
+                self.initial_price, self.expected_returns, self.his_vol, self.time_grid, rng=SobolRNG(1))
+
+    def test_running_summary_standard_errors(self):
+        rng = np.random.default_rng(4)
+        prices = np.exp(rng.normal(0, 0.2, size=(4000, 3)))
+        running_summary = RunningBandSummary(1, 3)
+        running_summary.update(np.log(prices), prices)
+
+        errors = running_summary.standard_errors()
+        expected_mean_error = prices.std(axis=0, ddof=1) / np.sqrt(4000) / prices.mean(axis=0)
+        np.testing.assert_allclose(errors['mean'], expected_mean_error)
+        self.assertTrue(np.all(errors[97.725] > errors[84.134]))
+
+    def test_running_summary_standard_errors_value_error(self):
+        with self.assertRaises(ValueError):
+            RunningBandSummary(1, 3).standard_errors()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine import *
+
+
+class TestAnalyticBands(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(12))
+
+    bands = calc_analytic_bands(initial_price, expected_returns, his_vol, time_grid)
+
+    def test_calc_analytic_bands_return_type(self):
+        self.assertIsInstance(self.bands, BandSummary)
+
+    def test_calc_analytic_bands_shape(self):
+        self.assertEqual(self.bands.num_steps, 252)
+        self.assertEqual(sorted(self.bands.percentiles.keys()), sorted(BAND_PERCENTILES))
+
+    def test_calc_analytic_bands_n_paths_is_none(self):
+        self.assertIsNone(self.bands.n_paths)
+
+    def test_calc_analytic_bands_start_at_initial_price(self):
+        self.assertAlmostEqual(self.bands.mean[0], self.initial_price)
+        for band in self.bands.percentiles.values():
+            self.assertAlmostEqual(band[0], self.initial_price)
+
+    def test_calc_analytic_bands_terminal_mean(self):
+        self.assertAlmostEqual(self.bands.mean[-1], self.initial_price * np.exp(self.expected_returns))
+
+    def test_calc_analytic_bands_ordered(self):
+        lower = self.bands.percentiles[2.275]
+        upper = self.bands.percentiles[97.725]
+        self.assertTrue(np.all(lower <= self.bands.percentiles[15.8665]))
+        self.assertTrue(np.all(self.bands.percentiles[84.134] <= upper))
+
+    def test_calc_analytic_bands_zero_volatility(self):
+        bands = calc_analytic_bands(self.initial_price, self.expected_returns, 0, self.time_grid)
+        np.testing.assert_allclose(bands.percentiles[2.275], bands.mean)
+
+    def test_simulated_bands_match_analytic_reference(self):
+        simulated = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=20000, rng=SimulationRNG(seed=0))
+        errors = compare_bands(simulated, self.bands)
+
+        for error in errors.values():
+            self.assertLess(error, 0.02)
+
+    def test_compare_bands_value_error(self):
+        shorter = calc_analytic_bands(self.initial_price, self.expected_returns, self.his_vol, calc_time_grid(21))
+        with self.assertRaises(ValueError):
+            compare_bands(shorter, self.bands)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine import *
+
+
+class TestKernelBackends(unittest.TestCase):
+
+    time_grid = calc_time_grid(60)
+    random_normal = np.random.default_rng(1).standard_normal((300, 59))
+
+    def reference(self):
+        return KernelBackend().price_paths(182.96, 0.07, 0.1842, self.time_grid, self.random_normal)
+
+    def check_backend(self, name):
+        backend = get_backend(name)
+        prices = backend.price_paths(182.96, 0.07, 0.1842, self.time_grid, self.random_normal)
+        np.testing.assert_allclose(prices, self.reference(), rtol=1e-12)
+
+        summary = backend.band_summary(prices.transpose())
+        reference = BandSummary.from_paths(self.reference().transpose())
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(summary.percentiles[q], reference.percentiles[q], rtol=1e-12)
+
+    def test_numpy_backend_matches_path_kernel(self):
+        expected = calc_price_paths(182.96, calc_log_paths(0.07, 0.1842, self.time_grid, self.random_normal))
+        np.testing.assert_array_equal(self.reference(), expected)
+
+    def test_numpy_backend_band_summary(self):
+        self.check_backend('numpy')
+
+    @unittest.skipUnless('numexpr' in available_backends(), 'numexpr is not installed')
+    def test_numexpr_backend_matches_numpy(self):
+        self.check_backend('numexpr')
+
+    @unittest.skipUnless('numba' in available_backends(), 'numba is not installed')
+    def test_numba_backend_matches_numpy(self):
+        self.check_backend('numba')
+
+    def test_available_backends_includes_numpy(self):
+        self.assertIn('numpy', available_backends())
+
+    def test_get_backend_auto(self):
+        self.assertEqual(get_backend('auto').name, available_backends()[0])
+
+    def test_get_backend_value_error(self):
+        with self.assertRaises(ValueError):
+            get_backend('cupy')
+
+    def test_benchmark_backends(self):
+        timings = benchmark_backends(n_simulations=50, num_steps=10, repeats=1, backends=['numpy'])
+        self.assertEqual(list(timings.keys()), ['numpy'])
+        self.assertGreater(timings['numpy'], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,123 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine import *
+
+
+class TestBrownianCache(unittest.TestCase):
+
+    time_grid = calc_time_grid(calc_num_steps(1))
+
+    def brownian(self, seed: int) -> np.ndarray:
+        random_normal = SimulationRNG(seed).standard_normal(0, 10, self.time_grid.size - 1)
+        return calc_brownian_paths(self.time_grid, random_normal)
+
+    def test_get_missing_key(self):
+        cache = BrownianCache()
+
+        self.assertIsNone(cache.get((1, 10, 21)))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.hits, 0)
+
+    def test_put_and_get(self):
+        cache = BrownianCache()
+        brownian = self.brownian(1)
+        cache.put((1, 10, 21), brownian)
+
+        self.assertIs(cache.get((1, 10, 21)), brownian)
+        self.assertEqual(cache.hits, 1)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, brownian.nbytes)
+
+    def test_cached_matrix_read_only(self):
+        cache = BrownianCache()
+        cache.put((1, 10, 21), self.brownian(1))
+
+        with self.assertRaises(ValueError):
+            cache.get((1, 10, 21))[0, 0] = 1
+
+    def test_least_recently_used_evicted(self):
+        cache = BrownianCache(max_entries=2)
+        cache.put((1,), self.brownian(1))
+        cache.put((2,), self.brownian(2))
+
+        # Using the first matrix makes the second the least recently used
+        cache.get((1,))
+        cache.put((3,), self.brownian(3))
+
+        self.assertIn((1,), cache)
+        self.assertNotIn((2,), cache)
+        self.assertIn((3,), cache)
+
+    def test_lower_max_entries_evicts(self):
+        cache = BrownianCache(max_entries=3)
+        for seed in range(3):
+            cache.put((seed,), self.brownian(seed))
+        cache.max_entries = 1
+
+        self.assertEqual(len(cache), 1)
+        self.assertIn((2,), cache)
+
+    def test_max_bytes_evicts_least_recently_used(self):
+        nbytes = self.brownian(1).nbytes
+        cache = BrownianCache(max_bytes=2 * nbytes)
+        for seed in range(3):
+            cache.put((seed,), self.brownian(seed))
+
+        self.assertEqual(len(cache), 2)
+        self.assertNotIn((0,), cache)
+        self.assertEqual(cache.nbytes, 2 * nbytes)
+
+        cache.max_bytes = nbytes
+        self.assertEqual(len(cache), 1)
+        self.assertIn((2,), cache)
+
+    def test_matrix_over_max_bytes_not_cached(self):
+        cache = BrownianCache(max_bytes=10)
+        cache.put((1,), self.brownian(1))
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.nbytes, 0)
+
+    def test_put_same_key_replaces(self):
+        cache = BrownianCache()
+        cache.put((1,), self.brownian(1))
+        cache.put((1,), self.brownian(2))
+
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.nbytes, self.brownian(2).nbytes)
+
+    def test_max_bytes_value_error(self):
+        for max_bytes in (-1, 1.5, True):
+            with self.assertRaises(ValueError):
+                BrownianCache(max_bytes=max_bytes)
+
+    def test_zero_max_entries_disables_cache(self):
+        cache = BrownianCache(max_entries=0)
+        cache.put((1,), self.brownian(1))
+
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = BrownianCache()
+        cache.put((1,), self.brownian(1))
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+
+    def test_max_entries_value_error(self):
+        for max_entries in (-1, 1.5, True, None):
+            with self.assertRaises(ValueError):
+                BrownianCache(max_entries=max_entries)
+
+    def test_log_paths_from_brownian_match_log_paths(self):
+        random_normal = SimulationRNG(4).standard_normal(0, 10, self.time_grid.size - 1)
+        brownian = calc_brownian_paths(self.time_grid, random_normal)
+
+        np.testing.assert_array_equal(
+            calc_log_paths_from_brownian(0.05, 0.2, self.time_grid, brownian),
+            calc_log_paths(0.05, 0.2, self.time_grid, random_normal))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine import *
+
+
+class TestCheckpointEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(12))
+    checkpoint_steps = [20, 62, 125, 251]
+
+    def full_paths(self, n_simulations: int, seed: int) -> np.ndarray:
+        # The same paths generated whole, one row per path
+        drift = self.expected_returns - 0.5 * self.his_vol**2
+        random_normal = SimulationRNG(seed).standard_normal(0, n_simulations, self.time_grid.size - 1)
+        return calc_price_paths(self.initial_price, calc_log_paths(drift, self.his_vol, self.time_grid, random_normal))
+
+    def test_run_checkpoint_simulation_return_type(self):
+        table, summary = run_checkpoint_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+            self.checkpoint_steps, n_simulations=250, chunk_size=100, rng=SimulationRNG(3))
+
+        self.assertIsInstance(table, pd.DataFrame)
+        self.assertIsInstance(summary, BandSummary)
+
+    def test_run_checkpoint_simulation_table_layout(self):
+        table, _ = run_checkpoint_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+            self.checkpoint_steps, n_simulations=250, chunk_size=100, rng=SimulationRNG(3))
+
+        self.assertEqual(table.index.tolist(), self.checkpoint_steps)
+        self.assertEqual(table.index.name, 'step')
+        self.assertEqual(table.columns.tolist(), ['mean', *BAND_PERCENTILES, 'prob_loss'])
+
+    def test_run_checkpoint_simulation_matches_full_paths(self):
+        prices = self.full_paths(500, seed=8)[:, self.checkpoint_steps]
+        table, _ = run_checkpoint_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+            self.checkpoint_steps, n_simulations=500, chunk_size=120, rng=SimulationRNG(8))
+
+        np.testing.assert_allclose(table['mean'], prices.mean(axis=0))
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(table[q], np.percentile(prices, q, axis=0))
+        np.testing.assert_allclose(table['prob_loss'], (prices < self.initial_price).mean(axis=0))
+
+    def test_run_checkpoint_simulation_plot_steps(self):
+        plot_steps = calc_plot_steps(self.time_grid.size, 20, self.checkpoint_steps)
+        _, summary = run_checkpoint_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+            self.checkpoint_steps, n_simulations=500, chunk_size=120, rng=SimulationRNG(8), plot_steps=plot_steps)
+
+        np.testing.assert_array_equal(summary.steps, plot_steps)
+        self.assertEqual(summary.mean.shape, plot_steps.shape)
+        np.testing.assert_allclose(summary.mean, self.full_paths(500, seed=8)[:, plot_steps].mean(axis=0))
+
+    def test_run_checkpoint_simulation_every_step_by_default(self):
+        _, summary = run_checkpoint_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+            self.checkpoint_steps, n_simulations=250, chunk_size=100, rng=SimulationRNG(3))
+
+        np.testing.assert_array_equal(summary.steps, np.arange(self.time_grid.size))
+
+    def test_run_checkpoint_simulation_step_value_error(self):
+        with self.assertRaises(ValueError):
+            run_checkpoint_simulation(
+                self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+                [20, self.time_grid.size], n_simulations=250)
+
+    def test_run_checkpoint_simulation_empty_value_error(self):
+        with self.assertRaises(ValueError):
+            run_checkpoint_simulation(
+                self.initial_price, self.expected_returns, self.his_vol, self.time_grid,
+                [], n_simulations=250)
+
+    def test_calc_plot_steps(self):
+        result = calc_plot_steps(252, 11, include=[20, 62])
+
+        self.assertEqual(result[0], 0)
+        self.assertEqual(result[-1], 251)
+        self.assertIn(20, result)
+        self.assertIn(62, result)
+        self.assertTrue(np.all(np.diff(result) > 0))
+
+    def test_calc_plot_steps_more_points_than_steps(self):
+        np.testing.assert_array_equal(calc_plot_steps(10, 50), np.arange(10))
+
+    def test_calc_plot_steps_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_plot_steps(252, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,161 @@
+import gc
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import numpy as np
+from matplotlib.figure import Figure
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, SKETCH_RELATIVE_ACCURACY
+from monte_carlo_simulator.service.engine import *
+from monte_carlo_simulator.service.util.data_visualizer import monte_carlo_sim_vis
+
+
+class TestChunkedEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(12))
+
+    def test_run_chunked_simulation_return_type(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=250, chunk_size=100)
+
+        self.assertIsInstance(result, BandSummary)
+
+    def test_run_chunked_simulation_shape(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=250, chunk_size=100)
+
+        self.assertEqual(result.mean.shape, (252,))
+        self.assertEqual(sorted(result.percentiles.keys()), sorted(BAND_PERCENTILES))
+        self.assertEqual(result.n_paths, 250)
+
+    def test_run_chunked_simulation_starts_at_initial_price(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=250, chunk_size=100)
+
+        self.assertAlmostEqual(result.mean[0], self.initial_price)
+        for band in result.percentiles.values():
+            self.assertAlmostEqual(band[0], self.initial_price)
+
+    def test_run_chunked_simulation_mean_matches_expected_returns(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=20000, chunk_size=3000)
+
+        # Expected Geometric Brownian Motion price at the end of the time horizon
+        expected_mean = self.initial_price * np.exp(self.expected_returns)
+        self.assertAlmostEqual(result.mean[-1] / expected_mean, 1, delta=0.01)
+
+    def test_running_summary_merge_matches_single_update(self):
+        log_paths = np.random.normal(size=(300, 20)).cumsum(axis=1)
+        prices = self.initial_price * np.exp(log_paths)
+
+        single = RunningBandSummary(self.initial_price, 20)
+        single.update(log_paths, prices)
+
+        merged = RunningBandSummary(self.initial_price, 20)
+        for chunk in range(0, 300, 70):
+            part = RunningBandSummary(self.initial_price, 20)
+            part.update(log_paths[chunk:chunk + 70], prices[chunk:chunk + 70])
+            merged.merge(part)
+
+        single_summary = single.finalize()
+        merged_summary = merged.finalize()
+        np.testing.assert_allclose(merged_summary.mean, single_summary.mean)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(merged_summary.percentiles[q], single_summary.percentiles[q])
+
+    def test_run_chunked_simulation_bands_match_full_paths(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=2500, chunk_size=1000, rng=SimulationRNG(seed=9))
+
+        random_normal = SimulationRNG(seed=9).standard_normal(0, 2500, self.time_grid.size - 1)
+        drift = self.expected_returns - 0.5 * self.his_vol**2
+        expected = BandSummary.from_paths(
+            calc_price_paths(self.initial_price, calc_log_paths(drift, self.his_vol, self.time_grid, random_normal)).transpose())
+
+        np.testing.assert_allclose(result.mean, expected.mean)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(result.percentiles[q], expected.percentiles[q], rtol=SKETCH_RELATIVE_ACCURACY)
+
+    def test_running_summary_empty_value_error(self):
+        with self.assertRaises(ValueError):
+            RunningBandSummary(self.initial_price, 20).finalize()
+
+    def test_monte_carlo_sim_vis_accepts_band_summary(self):
+        result = run_chunked_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=250, chunk_size=100)
+
+        self.assertIsInstance(monte_carlo_sim_vis(result, 12), Figure)
+
+
+    def test_run_out_of_core_simulation_matches_in_memory(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+
+        result = run_out_of_core_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, n_simulations=250, 
+            filename=os.path.join(directory.name, 'paths.npy'), chunk_size=100, rng=SimulationRNG(seed=5))
+        self.addCleanup(result._mmap.close)
+
+        random_normal = SimulationRNG(seed=5).standard_normal(0, 250, self.time_grid.size - 1)
+        drift = self.expected_returns - 0.5 * self.his_vol**2
+        expected = calc_price_paths(self.initial_price, calc_log_paths(drift, self.his_vol, self.time_grid, random_normal))
+
+        self.assertIsInstance(result, np.memmap)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+        np.testing.assert_array_equal(np.load(result.filename, mmap_mode='r'), result)
+
+    def test_run_out_of_core_simulation_removes_temporary_file(self):
+        result = run_out_of_core_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, n_simulations=250, chunk_size=100)
+        filename = result.filename
+        view = result.transpose()
+        del result
+        gc.collect()
+
+        # The file is kept while any view of the paths is in use
+        self.assertTrue(os.path.exists(filename))
+        del view
+        gc.collect()
+
+        self.assertFalse(os.path.exists(filename))
+
+    def test_run_out_of_core_simulation_closes_map_before_removing(self):
+        result = run_out_of_core_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, n_simulations=250, chunk_size=100)
+        filename, file_map = result.filename, result._mmap
+        remove = os.remove
+
+        # An open file cannot be deleted on every platform
+        def remove_closed(path):
+            self.assertTrue(file_map.closed)
+            remove(path)
+
+        with patch('os.remove', side_effect=remove_closed) as removed:
+            del result
+            gc.collect()
+
+        removed.assert_called_once_with(filename)
+        self.assertFalse(os.path.exists(filename))
+
+    def test_run_out_of_core_simulation_warns_when_not_removed(self):
+        result = run_out_of_core_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, n_simulations=250, chunk_size=100)
+        filename = result.filename
+        self.addCleanup(os.remove, filename)
+
+        with patch('os.remove', side_effect=PermissionError('in use')), self.assertWarns(RuntimeWarning):
+            del result
+            gc.collect()
+
+if __name__ == '__main__':
+    unittest.main()
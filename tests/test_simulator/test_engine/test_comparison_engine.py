@@ -0,0 +1,63 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_terminal_stats
+from monte_carlo_simulator.service.engine import *
+
+
+class TestComparisonEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = {'Simple Average Returns': 0.09, 'Capital Asset Pricing Model': 0.12}
+    backtest_returns = {'Simple Average Returns': 0.07, 'Capital Asset Pricing Model': 0.1}
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(3))
+    brownian = calc_brownian_paths(time_grid, SimulationRNG(seed=4).standard_normal(0, 500, time_grid.size - 1))
+    actual = pd.DataFrame(
+        {'Close': 170 * np.exp(np.linspace(0, 0.05, time_grid.size))},
+        index=pd.date_range('2024-01-01', periods=time_grid.size, freq='B'))
+
+    def run_comparison(self, **kwargs) -> tuple[pd.DataFrame, dict]:
+        return run_method_comparison(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, self.brownian, **kwargs)
+
+    def simulate(self, initial_price: float, expected_returns: float, his_vol: float) -> np.ndarray:
+        drift = expected_returns - 0.5 * his_vol**2
+        return calc_price_paths(
+            initial_price, calc_log_paths_from_brownian(drift, his_vol, self.time_grid, self.brownian)).transpose()
+
+    def test_run_method_comparison_forecasts(self):
+        table, backtest_summaries = self.run_comparison()
+
+        self.assertEqual(table.index.tolist(), list(self.expected_returns))
+        self.assertEqual(table.index.name, 'exp_ret_flag')
+        self.assertEqual(backtest_summaries, {})
+        for exp_ret_flag, returns in self.expected_returns.items():
+            expected = calc_terminal_stats(self.simulate(self.initial_price, returns, self.his_vol), self.initial_price)
+
+            self.assertAlmostEqual(table.loc[exp_ret_flag, 'expected_price'], expected['expected_price'])
+            for q in BAND_PERCENTILES:
+                self.assertAlmostEqual(table.loc[exp_ret_flag, q], expected['percentiles'][q])
+
+    def test_run_method_comparison_backtest_scores(self):
+        table, backtest_summaries = self.run_comparison(
+            backtest_price=170.0, backtest_returns=self.backtest_returns, backtest_vol=0.2, actual=self.actual)
+
+        for exp_ret_flag, returns in self.backtest_returns.items():
+            paths = self.simulate(170.0, returns, 0.2)
+            scores = score_forecast(paths, self.actual)
+
+            self.assertAlmostEqual(table.loc[exp_ret_flag, 'crps'], scores.mean_crps)
+            self.assertAlmostEqual(table.loc[exp_ret_flag, 'coverage_95.45'], scores.coverage_rates[95.45])
+            np.testing.assert_allclose(backtest_summaries[exp_ret_flag].mean, paths.mean(axis=1))
+
+    def test_run_method_comparison_does_not_modify_brownian(self):
+        brownian = self.brownian.copy()
+        self.run_comparison()
+
+        np.testing.assert_array_equal(self.brownian, brownian)
+
+if __name__ == '__main__':
+    unittest.main()
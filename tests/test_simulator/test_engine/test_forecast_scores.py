@@ -0,0 +1,77 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_crps, calc_pinball_loss
+from monte_carlo_simulator.service.engine import *
+
+
+class TestForecastScores(unittest.TestCase):
+
+    time_grid = calc_time_grid(calc_num_steps(3))
+    random_normal = SimulationRNG(seed=3).standard_normal(0, 500, time_grid.size - 1)
+    paths = calc_price_paths(100, calc_log_paths(0.07, 0.2, time_grid, random_normal)).transpose()
+    actual = pd.Series(100 * np.exp(np.linspace(0, 0.1, time_grid.size)))
+
+    def test_calc_band_pairs(self):
+        self.assertEqual(calc_band_pairs(BAND_PERCENTILES), [(15.8665, 84.134), (2.275, 97.725)])
+
+    def test_score_forecast_matches_calculators(self):
+        scores = score_forecast(self.paths, self.actual, memory_budget=500 * 8 * 7)
+        actual = self.actual.to_numpy()
+
+        self.assertEqual(scores.n_forecasts, self.time_grid.size)
+        np.testing.assert_allclose(scores.crps, calc_crps(self.paths, actual))
+        np.testing.assert_allclose(scores.pit, (self.paths <= actual[:, np.newaxis]).mean(axis=1))
+        np.testing.assert_allclose(
+            scores.pinball[2.275], calc_pinball_loss(np.percentile(self.paths, 2.275, axis=1), actual, 2.275))
+
+        lower, upper = np.percentile(self.paths, [2.275, 97.725], axis=1)
+        np.testing.assert_array_equal(scores.coverage[95.45], (actual >= lower) & (actual <= upper))
+
+    def test_score_forecast_simulation_result_without_paths(self):
+        result = SimulationResult(initial_price=100, summary=BandSummary.from_paths(self.paths))
+        scores = score_forecast(result, self.actual)
+        expected = score_forecast(self.paths, self.actual)
+
+        self.assertIsNone(scores.pit)
+        self.assertIsNone(scores.mean_crps)
+        self.assertIsNone(scores.pit_histogram)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(scores.pinball[q], expected.pinball[q])
+
+    def test_score_forecast_coarse_steps(self):
+        # Weekly paths are scored against the daily prices at the same proportion of the period
+        weekly_paths = self.paths[::5]
+        scores = score_forecast(weekly_paths, self.actual)
+        actual = self.actual.to_numpy()[np.round(np.linspace(0, self.actual.size - 1, weekly_paths.shape[0])).astype(int)]
+
+        np.testing.assert_allclose(scores.crps, calc_crps(weekly_paths, actual))
+
+    def test_score_forecast_type_error(self):
+        with self.assertRaises(TypeError):
+            score_forecast(self.paths.tolist(), self.actual)
+
+    def test_summary(self):
+        summary = score_forecast(self.paths, self.actual).summary
+
+        self.assertEqual(sorted(summary['coverage']), [68.2675, 95.45])
+        self.assertEqual(sorted(summary['pinball']), sorted(BAND_PERCENTILES))
+        self.assertAlmostEqual(sum(summary['pit_histogram']), 1.0)
+        self.assertGreater(summary['crps'], 0)
+
+    def test_score_walk_forward(self):
+        table = run_walk_forward(
+            np.array([100.0, 120.0, 95.0]), np.array([110.0, 100.0, 96.0]), np.array([0.09, 0.02, -0.05]),
+            np.array([0.18, 0.25, 0.1]), self.time_grid, n_simulations=1000, rng=SimulationRNG(1))
+        scores = score_walk_forward(table)
+
+        self.assertEqual(scores.n_forecasts, 3)
+        np.testing.assert_array_equal(scores.pit, table['pit'])
+        np.testing.assert_array_equal(scores.crps, table['crps'])
+        np.testing.assert_array_equal(
+            scores.coverage[68.2675], (table['actual_price'] >= table[15.8665]) & (table['actual_price'] <= table[84.134]))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,68 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine import QuantileSketch, SimulationPlan, estimate_path_bytes, plan_simulation
+
+
+class TestMemoryPlanner(unittest.TestCase):
+
+    def test_estimate_path_bytes(self):
+        self.assertEqual(estimate_path_bytes(1000, 252), 1000 * 252 * 8)
+        self.assertEqual(estimate_path_bytes(1000, 252, np.float32), 1000 * 252 * 4)
+
+    def test_full_when_paths_fit(self):
+        plan = plan_simulation(1000, 252, outputs=('bands', 'paths'), memory_budget=2**30)
+
+        self.assertIsInstance(plan, SimulationPlan)
+        self.assertEqual(plan.strategy, 'full')
+        self.assertLessEqual(plan.estimated_bytes, plan.memory_budget)
+        self.assertIsNone(plan.chunk_size)
+
+    def test_chunked_when_bands_do_not_fit(self):
+        plan = plan_simulation(100000, 252, outputs=('bands',), memory_budget=10 * 2**20)
+
+        self.assertEqual(plan.strategy, 'chunked')
+        self.assertLessEqual(plan.estimated_bytes, plan.memory_budget)
+        self.assertGreater(plan.chunk_size, 0)
+        self.assertLess(plan.chunk_size, 100000)
+
+    def test_chunked_reserves_quantile_sketch(self):
+        plan = plan_simulation(100000, 252, outputs=('bands',), memory_budget=10 * 2**20)
+        sketch_plan = plan_simulation(100000, 252, outputs=('bands',), memory_budget=10 * 2**20, log_std=0.18)
+
+        self.assertLess(sketch_plan.chunk_size, plan.chunk_size)
+        self.assertLessEqual(sketch_plan.estimated_bytes, sketch_plan.memory_budget)
+        self.assertGreaterEqual(
+            sketch_plan.estimated_bytes - sketch_plan.chunk_size * 4 * 252 * 8,
+            QuantileSketch.estimate_nbytes(252, 100000, 0.18))
+
+    def test_out_of_core_when_paths_do_not_fit(self):
+        plan = plan_simulation(100000, 252, outputs=('paths',), memory_budget=10 * 2**20)
+
+        self.assertEqual(plan.strategy, 'out_of_core')
+        self.assertLessEqual(plan.estimated_bytes, plan.memory_budget)
+        self.assertEqual(plan.disk_bytes, estimate_path_bytes(100000, 252))
+
+    def test_terminal_only(self):
+        plan = plan_simulation(10**7, 252, outputs=('terminal',), memory_budget=2**30)
+
+        self.assertEqual(plan.strategy, 'terminal')
+        self.assertEqual(plan.estimated_bytes, 2 * 10**7 * 8)
+
+    def test_float32_fits_more_paths(self):
+        budget = 2 * estimate_path_bytes(3000, 252, np.float32)
+
+        self.assertEqual(plan_simulation(3000, 252, np.float32, memory_budget=budget).strategy, 'full')
+        self.assertEqual(plan_simulation(3000, 252, np.float64, memory_budget=budget).strategy, 'chunked')
+
+    def test_outputs_value_error(self):
+        with self.assertRaises(ValueError):
+            plan_simulation(1000, 252, outputs=('histogram',))
+
+    def test_memory_budget_value_error(self):
+        with self.assertRaises(ValueError):
+            plan_simulation(1000, 252, memory_budget=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine import *
+
+
+class TestParallelEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(3))
+
+    def run_sim(self, seed, **kwargs):
+        return run_parallel_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=1050, rng=SimulationRNG(seed), block_size=200, **kwargs)
+
+    def test_run_parallel_simulation_return_type(self):
+        self.assertIsInstance(self.run_sim(seed=1, n_workers=2), BandSummary)
+
+    def test_run_parallel_simulation_n_paths(self):
+        self.assertEqual(self.run_sim(seed=1, n_workers=2).n_paths, 1050)
+
+    def test_run_parallel_simulation_reproducible_across_worker_counts(self):
+        one_worker = self.run_sim(seed=7, n_workers=1)
+        three_workers = self.run_sim(seed=7, n_workers=3)
+
+        np.testing.assert_array_equal(one_worker.mean, three_workers.mean)
+        for q in one_worker.percentiles:
+            np.testing.assert_array_equal(one_worker.percentiles[q], three_workers.percentiles[q])
+
+    def test_run_parallel_simulation_paths_reproducible_across_worker_counts(self):
+        one_worker = self.run_sim(seed=7, n_workers=1, return_paths=True)
+        two_workers = self.run_sim(seed=7, n_workers=2, return_paths=True)
+
+        self.assertEqual(one_worker.shape, (self.time_grid.size, 1050))
+        np.testing.assert_array_equal(one_worker, two_workers)
+
+    def test_run_parallel_simulation_different_seeds(self):
+        self.assertFalse(np.array_equal(
+            self.run_sim(seed=1, n_workers=2).mean, 
+            self.run_sim(seed=2, n_workers=2).mean
+            ))
+
+    def test_run_parallel_simulation_summary_matches_paths(self):
+        paths = self.run_sim(seed=3, n_workers=2, return_paths=True)
+        summary = self.run_sim(seed=3, n_workers=2)
+
+        np.testing.assert_allclose(summary.mean, paths.mean(axis=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine import *
+
+
+class TestStepGranularity(unittest.TestCase):
+
+    def test_calc_days_per_step(self):
+        self.assertEqual(calc_days_per_step('daily'), 1)
+        self.assertEqual(calc_days_per_step('weekly'), 5)
+        self.assertEqual(calc_days_per_step('monthly'), 21)
+        self.assertEqual(calc_days_per_step(10), 10)
+
+    def test_calc_days_per_step_value_error(self):
+        for step_granularity in ('hourly', 0, -5, 2.5, True, None):
+            with self.assertRaises(ValueError):
+                calc_days_per_step(step_granularity)
+
+    def test_calc_num_steps_daily_unchanged(self):
+        self.assertEqual(calc_num_steps(12), 252)
+        self.assertEqual(calc_num_steps(12, 'daily'), 252)
+        self.assertEqual(calc_num_steps(1, 'daily'), 21)
+
+    def test_calc_num_steps_coarse(self):
+        self.assertEqual(calc_num_steps(12, 'weekly'), 51)
+        self.assertEqual(calc_num_steps(12, 'monthly'), 13)
+        self.assertEqual(calc_num_steps(360, 'monthly'), 361)
+        self.assertEqual(calc_num_steps(12, 10), 26)
+
+    def test_calc_num_steps_at_least_one_step(self):
+        self.assertEqual(calc_num_steps(1, 'monthly'), 2)
+        self.assertEqual(calc_num_steps(1, 250), 2)
+
+    def test_coarse_grid_ends_at_horizon(self):
+        time_grid = calc_time_grid(calc_num_steps(12, 'weekly'))
+
+        self.assertEqual(time_grid[0], 0)
+        self.assertEqual(time_grid[-1], 1)
+
+    def test_calc_drift(self):
+        self.assertAlmostEqual(calc_drift(0.1, 0.2), 0.08)
+
+        # Arrays of inputs are calculated elementwise
+        np.testing.assert_allclose(calc_drift(np.array([0.1, 0.05]), np.array([0.2, 0.3])), [0.08, 0.005])
+
+
+if __name__ == '__main__':
+    unittest.main()
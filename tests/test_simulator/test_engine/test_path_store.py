@@ -0,0 +1,89 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.engine import *
+
+
+class TestPathStore(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(3))
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.filename = os.path.join(directory.name, 'paths.npy')
+
+        paths = run_out_of_core_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, n_simulations=300,
+            filename=self.filename, chunk_size=120, rng=SimulationRNG(seed=4))
+        self.expected = np.array(paths)
+        paths._mmap.close()
+
+        # A budget of a few time steps, so statistics are streamed in several blocks
+        self.store = PathStore(self.filename, memory_budget=300 * 8 * 5)
+        self.addCleanup(self.store.close)
+
+    def test_header(self):
+        self.assertEqual(self.store.shape, (300, self.time_grid.size))
+        self.assertEqual(self.store.n_paths, 300)
+        self.assertEqual(self.store.num_steps, self.time_grid.size)
+        self.assertEqual(self.store.dtype, np.float64)
+        self.assertEqual(self.store.nbytes, self.expected.nbytes)
+
+    def test_maps_file_lazily(self):
+        self.assertIsNone(self.store._paths)
+
+        self.assertIsInstance(self.store.paths, np.memmap)
+        self.assertFalse(self.store.paths.flags.writeable)
+
+    def test_statistics_match_in_memory(self):
+        np.testing.assert_allclose(self.store.mean(), self.expected.mean(axis=0))
+        np.testing.assert_allclose(self.store.std(), self.expected.std(axis=0, ddof=1))
+        np.testing.assert_array_equal(self.store.terminal_prices(), self.expected[:, -1])
+
+        percentiles = self.store.percentiles((5, 50))
+        np.testing.assert_allclose(percentiles[5], np.percentile(self.expected, 5, axis=0))
+        np.testing.assert_allclose(percentiles[50], np.percentile(self.expected, 50, axis=0))
+
+    def test_band_summary_matches_from_paths(self):
+        summary = self.store.band_summary()
+        expected = BandSummary.from_paths(self.expected.transpose())
+
+        self.assertEqual(summary.n_paths, 300)
+        np.testing.assert_allclose(summary.mean, expected.mean)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(summary.percentiles[q], expected.percentiles[q])
+
+    def test_sample(self):
+        sample = self.store.sample(40, seed=1)
+
+        self.assertEqual(sample.shape, (self.time_grid.size, 40))
+        np.testing.assert_array_equal(sample, self.store.sample(40, seed=1))
+        # Every sampled path is one of the stored paths
+        self.assertTrue(np.isin(sample[-1], self.expected[:, -1]).all())
+
+    def test_sample_every_path(self):
+        np.testing.assert_array_equal(self.store.sample(1000), self.expected.transpose())
+
+    def test_simulation_result_streams_from_store(self):
+        result = SimulationResult(initial_price=self.initial_price, paths=self.store)
+        expected = SimulationResult(initial_price=self.initial_price, paths=self.expected.transpose())
+
+        self.assertIs(result.path_store, self.store)
+        self.assertEqual((result.num_steps, result.n_paths), (self.time_grid.size, 300))
+        np.testing.assert_allclose(result.band_summary.mean, expected.band_summary.mean)
+        np.testing.assert_allclose(result.standard_errors, expected.standard_errors)
+        self.assertEqual(result.terminal_stats, expected.terminal_stats)
+
+    def test_memory_budget_value_error(self):
+        with self.assertRaises(ValueError):
+            PathStore(self.filename, memory_budget=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import pickle
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine.qmc import SobolRNG, calc_bridge_increments, MAX_SOBOL_DIMENSIONS
+from monte_carlo_simulator.service.engine.rng import SimulationRNG
+from monte_carlo_simulator.service.engine.path_kernel import calc_time_grid, calc_log_paths
+
+
+class TestSobolRNG(unittest.TestCase):
+
+    def test_standard_normal_shape(self):
+        result = SobolRNG(seed=1).standard_normal(0, 64, 10)
+        self.assertEqual(result.shape, (64, 10))
+
+    def test_standard_normal_reproducible(self):
+        first = SobolRNG(seed=1).standard_normal(0, 64, 10)
+        second = SobolRNG(seed=1).standard_normal(0, 64, 10)
+        np.testing.assert_array_equal(first, second)
+
+    def test_standard_normal_different_seeds(self):
+        first = SobolRNG(seed=1).standard_normal(0, 64, 10)
+        second = SobolRNG(seed=2).standard_normal(0, 64, 10)
+        self.assertFalse(np.array_equal(first, second))
+
+    def test_standard_normal_path_range_regenerated(self):
+        rng = SobolRNG(seed=3)
+        all_paths = rng.standard_normal(0, 100, 8)
+
+        # Any range of paths matches the same points of the full sequence
+        np.testing.assert_allclose(rng.standard_normal(13, 77, 8), all_paths[13:77])
+
+    def test_standard_normal_antithetic(self):
+        result = SobolRNG(seed=3).standard_normal(0, 64, 8, antithetic=True)
+        np.testing.assert_array_equal(result[1::2], -result[0::2])
+
+    def test_standard_normal_no_increments(self):
+        self.assertEqual(SobolRNG(seed=1).standard_normal(0, 10, 0).shape, (10, 0))
+
+    def test_standard_normal_too_many_dimensions(self):
+        with self.assertRaises(ValueError):
+            SobolRNG(seed=1).standard_normal(0, 2, MAX_SOBOL_DIMENSIONS + 1)
+
+    def test_pickle_drops_engines(self):
+        rng = SobolRNG(seed=1)
+        draws = rng.standard_normal(0, 16, 4)
+
+        # Engines are rebuilt after unpickling, giving the same draws
+        restored = pickle.loads(pickle.dumps(rng))
+        self.assertEqual(restored._engines, {})
+        np.testing.assert_array_equal(restored.standard_normal(0, 16, 4), draws)
+
+    def test_bit_generator(self):
+        self.assertEqual(SobolRNG(seed=1).bit_generator, 'Sobol')
+
+    def test_terminal_mean_error_lower_than_pseudo(self):
+        time_grid = calc_time_grid(64)
+
+        def terminal_error(rng):
+            normals = rng.standard_normal(0, 1024, 63)
+            terminal = np.exp(calc_log_paths(-0.02, 0.2, time_grid, normals)[:, -1])
+            return abs(terminal.mean() - np.exp(0))
+
+        # Averaged over seeds, quasi-random terminal means are far more accurate
+        sobol_error = np.mean([terminal_error(SobolRNG(seed=seed)) for seed in range(5)])
+        pseudo_error = np.mean([terminal_error(SimulationRNG(seed=seed)) for seed in range(5)])
+        self.assertLess(sobol_error, pseudo_error)
+
+
+class TestCalcBridgeIncrements(unittest.TestCase):
+
+    def test_terminal_value_from_first_dimension(self):
+        bridge_normal = np.random.default_rng(1).standard_normal((5, 9))
+        increments = calc_bridge_increments(bridge_normal)
+
+        # The sum of the increments is the end point, set by the first dimension
+        np.testing.assert_allclose(increments.sum(axis=1), 3 * bridge_normal[:, 0])
+
+    def test_increments_standard_normal(self):
+        bridge_normal = np.random.default_rng(2).standard_normal((200000, 7))
+        increments = calc_bridge_increments(bridge_normal)
+
+        # Bridged increments are independent standard normals
+        np.testing.assert_allclose(increments.mean(axis=0), 0, atol=0.01)
+        np.testing.assert_allclose(np.cov(increments, rowvar=False), np.eye(7), atol=0.02)
+
+    def test_single_increment(self):
+        bridge_normal = np.array([[0.5], [-1.0]])
+        np.testing.assert_array_equal(calc_bridge_increments(bridge_normal), bridge_normal)
+
+
+if __name__ == '__main__':
+    unittest.main()
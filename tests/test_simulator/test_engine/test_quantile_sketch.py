@@ -0,0 +1,86 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES, SKETCH_RELATIVE_ACCURACY
+from monte_carlo_simulator.service.engine import QuantileSketch
+
+
+class TestQuantileSketch(unittest.TestCase):
+
+    prices = 100 * np.exp(np.random.default_rng(3).standard_normal((2000, 30)).cumsum(axis=1) * 0.05)
+
+    def test_quantiles_within_relative_accuracy(self):
+        sketch = QuantileSketch(30)
+        sketch.update(self.prices)
+
+        estimates = sketch.quantiles(BAND_PERCENTILES + (0, 50, 100))
+        for q, estimate in estimates.items():
+            np.testing.assert_allclose(estimate, np.percentile(self.prices, q, axis=0), rtol=SKETCH_RELATIVE_ACCURACY)
+
+    def test_merge_matches_single_update(self):
+        single = QuantileSketch(30)
+        single.update(self.prices)
+
+        merged = QuantileSketch(30)
+        for chunk in range(0, 2000, 300):
+            part = QuantileSketch(30)
+            part.update(self.prices[chunk:chunk + 300], log_prices=np.log(self.prices[chunk:chunk + 300]))
+            merged.merge(part)
+
+        self.assertEqual(merged.count, 2000)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_array_equal(merged.quantiles()[q], single.quantiles()[q])
+
+    def test_constant_prices_exact(self):
+        sketch = QuantileSketch(2)
+        sketch.update(np.full((10, 2), 182.96))
+
+        for estimate in sketch.quantiles().values():
+            np.testing.assert_array_equal(estimate, 182.96)
+
+    def test_zero_prices_counted_without_logarithms(self):
+        prices = self.prices.copy()
+        prices[:500] = 0
+
+        sketch = QuantileSketch(30)
+        with np.errstate(all='raise'):
+            sketch.update(prices[:1000])
+            sketch.update(prices[1000:])
+
+        estimates = sketch.quantiles(BAND_PERCENTILES + (0, 50))
+        for q, estimate in estimates.items():
+            np.testing.assert_allclose(estimate, np.percentile(prices, q, axis=0), rtol=SKETCH_RELATIVE_ACCURACY)
+
+    def test_all_zero_prices(self):
+        sketch = QuantileSketch(3)
+        with np.errstate(all='raise'):
+            sketch.update(np.zeros((10, 3)))
+        sketch.merge(QuantileSketch(3))
+
+        for estimate in sketch.quantiles().values():
+            np.testing.assert_array_equal(estimate, 0)
+
+    def test_estimate_nbytes_covers_sketch(self):
+        sketch = QuantileSketch(30)
+        sketch.update(self.prices)
+
+        # Log-prices are a random walk with steps of standard deviation 0.05
+        estimate = QuantileSketch.estimate_nbytes(30, 2000, log_std=0.05 * np.sqrt(30))
+        self.assertGreaterEqual(estimate, sketch.nbytes)
+        self.assertLess(estimate, 4 * sketch.nbytes)
+
+    def test_empty_value_error(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(30).quantiles()
+
+    def test_relative_accuracy_value_error(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(30, relative_accuracy=0)
+
+    def test_merge_accuracy_value_error(self):
+        with self.assertRaises(ValueError):
+            QuantileSketch(30).merge(QuantileSketch(30, relative_accuracy=0.01))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine.rng import SimulationRNG, BIT_GENERATORS
+
+
+class TestSimulationRNG(unittest.TestCase):
+
+    def test_standard_normal_shape(self):
+        result = SimulationRNG(seed=1, block_size=10).standard_normal(0, 25, 4)
+        self.assertEqual(result.shape, (25, 4))
+
+    def test_standard_normal_reproducible(self):
+        first = SimulationRNG(seed=1).standard_normal(0, 50, 4)
+        second = SimulationRNG(seed=1).standard_normal(0, 50, 4)
+        np.testing.assert_array_equal(first, second)
+
+    def test_standard_normal_different_seeds(self):
+        first = SimulationRNG(seed=1).standard_normal(0, 50, 4)
+        second = SimulationRNG(seed=2).standard_normal(0, 50, 4)
+        self.assertFalse(np.array_equal(first, second))
+
+    def test_standard_normal_path_range_regenerated(self):
+        rng = SimulationRNG(seed=3, block_size=10)
+        all_paths = rng.standard_normal(0, 45, 6)
+
+        # Any range of paths, including ranges crossing blocks, matches the full draw
+        np.testing.assert_array_equal(rng.standard_normal(13, 37, 6), all_paths[13:37])
+        np.testing.assert_array_equal(rng.standard_normal(40, 45, 6), all_paths[40:45])
+
+    def test_standard_normal_independent_of_chunking(self):
+        rng = SimulationRNG(seed=3, block_size=10)
+        chunks = [rng.standard_normal(start, min(start + 7, 30), 5) for start in range(0, 30, 7)]
+        np.testing.assert_array_equal(np.concatenate(chunks), rng.standard_normal(0, 30, 5))
+
+    def test_standard_normal_fills_out(self):
+        out = np.empty((20, 3))
+        result = SimulationRNG(seed=1, block_size=10).standard_normal(0, 20, 3, out=out)
+        self.assertIs(result, out)
+
+    def test_seed_reproduces_unseeded_run(self):
+        rng = SimulationRNG()
+        np.testing.assert_array_equal(
+            rng.standard_normal(0, 10, 3), 
+            SimulationRNG(seed=rng.seed).standard_normal(0, 10, 3)
+            )
+
+    def test_standard_normal_antithetic_pairs(self):
+        result = SimulationRNG(seed=4, block_size=10).standard_normal(0, 31, 5, antithetic=True)
+
+        self.assertEqual(result.shape, (31, 5))
+        np.testing.assert_array_equal(result[1::2], -result[0:30:2])
+
+    def test_standard_normal_antithetic_path_range_regenerated(self):
+        rng = SimulationRNG(seed=4, block_size=10)
+        all_paths = rng.standard_normal(0, 45, 6, antithetic=True)
+
+        np.testing.assert_array_equal(rng.standard_normal(13, 38, 6, antithetic=True), all_paths[13:38])
+
+    def test_all_bit_generators(self):
+        for bit_generator in BIT_GENERATORS:
+            result = SimulationRNG(seed=1, bit_generator=bit_generator).standard_normal(0, 10, 3)
+            self.assertEqual(result.shape, (10, 3))
+
+    def test_bit_generator_value_error(self):
+        with self.assertRaises(ValueError):
+            SimulationRNG(bit_generator='RANDU')
+
+    def test_block_size_value_error(self):
+        with self.assertRaises(ValueError):
+            SimulationRNG(block_size=0)
+
+    def test_standard_normal_float32_matches_float64(self):
+        rng = SimulationRNG(seed=3, block_size=10)
+        result = rng.standard_normal(5, 27, 4, dtype=np.float32)
+
+        # Single-precision draws are the rounded double-precision draws
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_array_equal(result, rng.standard_normal(5, 27, 4).astype(np.float32))
+
+if __name__ == '__main__':
+    unittest.main()
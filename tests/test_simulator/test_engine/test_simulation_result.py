@@ -0,0 +1,80 @@
+import os
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_terminal_stats
+from monte_carlo_simulator.service.engine import BandSummary, SimulationResult, calc_data_fingerprint
+
+
+class TestSimulationResult(unittest.TestCase):
+
+    paths = 100 * np.exp(np.random.default_rng(2).standard_normal((400, 30)).cumsum(axis=1) * 0.02).transpose()
+
+    def setUp(self):
+        self.result = SimulationResult(initial_price=100, paths=self.paths, seed=7, parameters={'his_vol': 0.2})
+
+    def test_statistics_match_paths(self):
+        expected = BandSummary.from_paths(self.paths)
+
+        np.testing.assert_allclose(self.result.mean, expected.mean)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(self.result.band_summary.percentiles[q], expected.percentiles[q])
+        self.assertEqual(self.result.terminal_stats, calc_terminal_stats(self.paths, 100))
+
+    def test_statistics_cached(self):
+        self.assertIs(self.result.band_summary, self.result.band_summary)
+        self.assertIs(self.result.quantiles((50,))[50], self.result.quantiles((50, 2.275))[50])
+
+    def test_standard_errors(self):
+        expected = self.paths.std(axis=1, ddof=1) / np.sqrt(400) / self.paths.mean(axis=1)
+        np.testing.assert_allclose(self.result.standard_errors, expected)
+
+    def test_release_paths_keeps_cached_statistics(self):
+        band_summary = self.result.band_summary
+        self.result.release_paths()
+
+        self.assertFalse(self.result.has_paths)
+        self.assertIs(self.result.band_summary, band_summary)
+        with self.assertRaises(ValueError):
+            self.result.terminal_stats
+
+    def test_summary_only(self):
+        summary = BandSummary.from_paths(self.paths)
+        result = SimulationResult(initial_price=100, summary=summary)
+
+        self.assertIs(result.band_summary, summary)
+        self.assertEqual(result.n_paths, 400)
+        self.assertEqual(result.num_steps, 30)
+        with self.assertRaises(ValueError):
+            result.quantiles((50,))
+
+    def test_metadata(self):
+        self.assertEqual(self.result.seed, 7)
+        self.assertEqual(self.result.parameters, {'his_vol': 0.2})
+        self.assertIsNone(self.result.data_fingerprint)
+
+    def test_no_paths_or_summary_value_error(self):
+        with self.assertRaises(ValueError):
+            SimulationResult(initial_price=100)
+
+
+class TestCalcDataFingerprint(unittest.TestCase):
+
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+
+    def test_fingerprint_identifies_data(self):
+        fingerprint = calc_data_fingerprint(self.asset_data)
+
+        self.assertEqual(fingerprint, calc_data_fingerprint(self.asset_data.copy()))
+        self.assertNotEqual(fingerprint, calc_data_fingerprint(self.asset_data.iloc[:-1]))
+
+    def test_fingerprint_type_error(self):
+        with self.assertRaises(TypeError):
+            calc_data_fingerprint(self.asset_data.values)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_terminal_stats
+from monte_carlo_simulator.service.engine import *
+
+
+class TestSweepEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = {'Simple Average Returns': 0.09, 'Capital Asset Pricing Model': 0.12}
+    his_vols = {10: 0.08, 30: 0.1842, 60: 0.25}
+    time_grids = {3: calc_time_grid(calc_num_steps(3)), 12: calc_time_grid(calc_num_steps(12))}
+
+    def run_sweep(self, **kwargs) -> pd.DataFrame:
+        return run_parameter_sweep(
+            self.initial_price, self.expected_returns, self.his_vols,
+            **{'time_grids': self.time_grids, 'n_simulations': 1000, 'rng': SimulationRNG(9), **kwargs})
+
+    def test_run_parameter_sweep_layout(self):
+        table = self.run_sweep()
+
+        self.assertIsInstance(table, pd.DataFrame)
+        self.assertEqual(len(table), 2 * 3 * 2)
+        self.assertEqual(
+            table.columns.tolist(),
+            ['time_horizon', 'exp_ret_flag', 'standev_window', 'expected_returns', 'his_vol',
+             'expected_price', *BAND_PERCENTILES, 'prob_loss'])
+        self.assertEqual(sorted(table['time_horizon'].unique()), [3, 12])
+
+    def test_run_parameter_sweep_matches_simulated_paths(self):
+        table = self.run_sweep()
+        row = table.query('time_horizon == 12 and standev_window == 30 and exp_ret_flag == "Simple Average Returns"').iloc[0]
+
+        # The same terminal prices sampled one combination at a time
+        random_normal = SimulationRNG(9).standard_normal(0, 1000, 1)[:, 0]
+        prices = calc_terminal_prices(
+            self.initial_price, 0.09 - 0.5 * 0.1842**2, 0.1842, self.time_grids[12][-1], random_normal)
+        expected = calc_terminal_stats(prices, self.initial_price)
+
+        self.assertAlmostEqual(row['expected_price'], expected['expected_price'])
+        for q in BAND_PERCENTILES:
+            self.assertAlmostEqual(row[q], expected['percentiles'][q])
+        self.assertAlmostEqual(row['prob_loss'], expected['prob_loss'])
+
+    def test_run_parameter_sweep_sobol_matches_simulated_paths(self):
+        table = self.run_sweep(rng=SobolRNG(9))
+        row = table.query('time_horizon == 12 and standev_window == 10 and exp_ret_flag == "Simple Average Returns"').iloc[0]
+
+        # Sobol' terminal values come from the end of whole paths; a 12 month horizon is one year
+        time_grid = self.time_grids[12]
+        random_normal = SobolRNG(9).standard_normal(0, 1000, time_grid.size - 1)
+        paths = calc_price_paths(
+            self.initial_price, calc_log_paths(0.09 - 0.5 * 0.08**2, 0.08, time_grid, random_normal))
+
+        self.assertAlmostEqual(row['expected_price'], paths[:, -1].mean())
+
+    def test_run_parameter_sweep_bands_widen_with_horizon(self):
+        time_grids = {time_horizon: calc_time_grid(calc_num_steps(time_horizon)) for time_horizon in (1, 12, 360)}
+        table = self.run_sweep(time_grids=time_grids).query('standev_window == 30 and exp_ret_flag == "Simple Average Returns"')
+
+        # Longer horizons drift further and spread wider from the same draws
+        widths = (table[BAND_PERCENTILES[-1]] - table[BAND_PERCENTILES[0]]).to_numpy()
+        self.assertTrue((np.diff(widths) > 0).all())
+        self.assertTrue((np.diff(table['expected_price'].to_numpy()) > 0).all())
+        self.assertAlmostEqual(table['expected_price'].iloc[0], self.initial_price * np.exp(0.09 / 12), delta=0.5)
+
+    def test_draw_terminal_brownian(self):
+        time_grid = self.time_grids[3]
+
+        # Pseudo-random values are drawn directly, Sobol' values from whole paths
+        np.testing.assert_array_equal(
+            draw_terminal_brownian(time_grid, 100, SimulationRNG(2)), SimulationRNG(2).standard_normal(0, 100, 1)[:, 0])
+        np.testing.assert_allclose(
+            draw_terminal_brownian(time_grid, 64, SobolRNG(2)),
+            calc_brownian_paths(time_grid, SobolRNG(2).standard_normal(0, 64, time_grid.size - 1))[:, -1])
+
+    def test_run_parameter_sweep_batches_match(self):
+        # A budget of a single pair's terminal prices forces one batch per pair
+        pd.testing.assert_frame_equal(self.run_sweep(memory_budget=8000), self.run_sweep())
+
+    def test_calc_sweep_terminal_stats_batch_within_budget(self):
+        terminal_brownian = SimulationRNG(2).standard_normal(0, 500, 1)[:, 0]
+        memory_budget = 3 * (2 * terminal_brownian.nbytes + terminal_brownian.size)
+
+        with patch.object(np, 'percentile', wraps=np.percentile) as percentile:
+            calc_sweep_terminal_stats(
+                self.initial_price, np.full(10, 0.09), np.full(10, 0.2), terminal_brownian, memory_budget=memory_budget)
+
+        # Each batch's prices, their percentile copy and loss mask fit in the budget
+        batch_sizes = [call.args[0].shape[0] for call in percentile.call_args_list]
+        self.assertEqual(batch_sizes, [3, 3, 3, 1])
+
+    def test_calc_sweep_terminal_stats_common_random_numbers(self):
+        terminal_brownian = SimulationRNG(2).standard_normal(0, 500, 1)[:, 0]
+        stats = calc_sweep_terminal_stats(
+            self.initial_price, np.array([0.09, 0.09, 0.12]), np.array([0.2, 0.2, 0.2]), terminal_brownian)
+
+        # Identical inputs give identical results, and higher returns shift every percentile up
+        self.assertEqual(stats['expected_price'][0], stats['expected_price'][1])
+        for q in BAND_PERCENTILES:
+            self.assertLess(stats[q][1], stats[q][2])
+
+    def test_calc_sweep_terminal_stats_zero_volatility(self):
+        terminal_brownian = SimulationRNG(2).standard_normal(0, 500, 1)[:, 0]
+        stats = calc_sweep_terminal_stats(self.initial_price, np.array([0.05]), np.array([0.0]), terminal_brownian)
+
+        self.assertAlmostEqual(stats['expected_price'][0], self.initial_price * np.exp(0.05))
+        self.assertEqual(stats['prob_loss'][0], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import unittest
+from unittest.mock import patch
+import numpy as np
+
+from monte_carlo_simulator.const import GIL_THREAD_LIMIT
+from monte_carlo_simulator.service.engine import *
+
+
+class TestThreadEngine(unittest.TestCase):
+
+    initial_price = 182.96
+    expected_returns = 0.09
+    his_vol = 0.1842
+    time_grid = calc_time_grid(calc_num_steps(3))
+
+    def run_sim(self, rng, **kwargs):
+        return run_threaded_simulation(
+            self.initial_price, self.expected_returns, self.his_vol, self.time_grid, 
+            n_simulations=1050, rng=rng, block_size=200, **kwargs)
+
+    def single_threaded_paths(self, rng, **kwargs):
+        random_normal = rng.standard_normal(0, 1050, self.time_grid.size - 1, **kwargs)
+        log_paths = calc_log_paths(self.expected_returns - 0.5 * self.his_vol**2, self.his_vol, self.time_grid, random_normal)
+        return calc_price_paths(self.initial_price, log_paths)
+
+    def test_run_threaded_simulation_shape(self):
+        result = self.run_sim(SimulationRNG(1), n_threads=2)
+
+        self.assertEqual(result.shape, (1050, self.time_grid.size))
+        np.testing.assert_array_equal(result[:, 0], self.initial_price)
+
+    def test_run_threaded_simulation_matches_single_thread(self):
+        np.testing.assert_array_equal(self.run_sim(SimulationRNG(7), n_threads=3), self.single_threaded_paths(SimulationRNG(7)))
+
+    def test_run_threaded_simulation_reproducible_across_thread_counts(self):
+        for antithetic in (False, True):
+            one_thread = self.run_sim(SimulationRNG(7), n_threads=1, antithetic=antithetic)
+            four_threads = self.run_sim(SimulationRNG(7), n_threads=4, antithetic=antithetic)
+            np.testing.assert_array_equal(one_thread, four_threads)
+
+    def test_run_threaded_simulation_sobol(self):
+        np.testing.assert_array_equal(self.run_sim(SobolRNG(3), n_threads=3), self.single_threaded_paths(SobolRNG(3)))
+
+    def test_run_threaded_simulation_more_threads_than_blocks(self):
+        np.testing.assert_array_equal(self.run_sim(SimulationRNG(7), n_threads=16), self.single_threaded_paths(SimulationRNG(7)))
+
+    def test_run_threaded_simulation_into_out(self):
+        out = np.empty((1050, self.time_grid.size), dtype=np.float32)
+        result = self.run_sim(SimulationRNG(7), n_threads=2, dtype=np.float32, out=out)
+
+        self.assertIs(result, out)
+        np.testing.assert_allclose(result, self.single_threaded_paths(SimulationRNG(7)), rtol=1e-4)
+
+    def test_run_threaded_simulation_thread_error_raised(self):
+        with self.assertRaises(ValueError):
+            self.run_sim(SimulationRNG(7), n_threads=2, out=np.empty((1050, 3)))
+
+    def test_default_thread_count_with_gil(self):
+        with patch('monte_carlo_simulator.service.engine.thread_engine.is_gil_enabled', return_value=True), \
+                patch('os.cpu_count', return_value=64):
+            self.assertEqual(default_thread_count(), GIL_THREAD_LIMIT)
+
+    def test_default_thread_count_free_threaded(self):
+        with patch('monte_carlo_simulator.service.engine.thread_engine.is_gil_enabled', return_value=False), \
+                patch('os.cpu_count', return_value=64):
+            self.assertEqual(default_thread_count(), 64)
+
+    def test_is_gil_enabled(self):
+        with patch('sys._is_gil_enabled', create=True, return_value=False):
+            self.assertFalse(is_gil_enabled())
+
+
+if __name__ == '__main__':
+    unittest.main()
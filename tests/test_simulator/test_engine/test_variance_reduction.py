@@ -0,0 +1,89 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine.variance_reduction import moment_match, control_variate_adjust, \
+    simulate_reduced_variance, VarianceReductionReport
+from monte_carlo_simulator.service.engine.path_kernel import calc_time_grid, calc_log_paths
+
+
+class TestMomentMatch(unittest.TestCase):
+
+    def test_moments_matched(self):
+        random_normal = np.random.default_rng(1).standard_normal((500, 6))
+        result = moment_match(random_normal)
+
+        self.assertIs(result, random_normal)
+        np.testing.assert_allclose(result.mean(axis=0), 0, atol=1e-12)
+        np.testing.assert_allclose(result.std(axis=0), 1)
+
+    def test_single_path_unchanged(self):
+        random_normal = np.array([[0.3, -1.2]])
+        np.testing.assert_array_equal(moment_match(random_normal.copy()), random_normal)
+
+    def test_constant_column_centred(self):
+        random_normal = np.ones((4, 2))
+        np.testing.assert_array_equal(moment_match(random_normal), 0)
+
+
+class TestControlVariateAdjust(unittest.TestCase):
+
+    def test_shift_preserves_spread(self):
+        time_grid = calc_time_grid(20)
+        random_normal = np.random.default_rng(2).standard_normal((300, 19))
+        brownian_motion = calc_log_paths(0, 1, time_grid, random_normal)
+        prices = 100 * np.exp(0.2 * brownian_motion)
+
+        adjusted = control_variate_adjust(prices.copy(), brownian_motion)
+
+        # Each time step is shifted by a constant, keeping the distribution's shape
+        np.testing.assert_allclose(np.std(adjusted, axis=0), np.std(prices, axis=0))
+        np.testing.assert_allclose(adjusted[:, 0], prices[:, 0])
+
+
+class TestSimulateReducedVariance(unittest.TestCase):
+
+    def setUp(self):
+        self.time_grid = calc_time_grid(50)
+        self.exact_mean = 100 * np.exp(0.08)
+
+    def simulate(self, method, seed=1, n_paths=200):
+        random_normal = np.random.default_rng(seed).standard_normal((n_paths, 49))
+        return simulate_reduced_variance(100, 0.08, 0.3, self.time_grid, random_normal, method)
+
+    def test_output_shape_and_report(self):
+        prices, report = self.simulate('both')
+
+        self.assertEqual(prices.shape, (200, 50))
+        self.assertIsInstance(report, VarianceReductionReport)
+        self.assertEqual(report.method, 'both')
+        self.assertEqual(report.n_paths, 200)
+        self.assertGreater(report.variance_ratio, 1)
+
+    def test_variance_ratio_per_method(self):
+        _, report = self.simulate('control_variate')
+        self.assertGreater(report.variance_ratio, 1)
+
+        # Moment matching alone has no control variate to estimate the reduction from
+        _, report = self.simulate('moment_matching')
+        self.assertIsNone(report.variance_ratio)
+
+    def test_initial_price_unchanged(self):
+        for method in ('moment_matching', 'control_variate', 'both'):
+            prices, _ = self.simulate(method)
+            np.testing.assert_allclose(prices[:, 0], 100)
+
+    def test_terminal_mean_error_reduced(self):
+        # Averaged over seeds, corrected terminal means are closer to the exact mean
+        for method in ('moment_matching', 'control_variate', 'both'):
+            reports = [self.simulate(method, seed=seed)[1] for seed in range(10)]
+            before = np.mean([report.mean_error_before for report in reports])
+            after = np.mean([report.mean_error_after for report in reports])
+            self.assertLess(after, before / 2, msg=method)
+
+    def test_invalid_method(self):
+        with self.assertRaises(ValueError):
+            self.simulate('importance_sampling')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_crps, calc_terminal_stats
+from monte_carlo_simulator.service.engine import *
+
+
+class TestWalkForwardEngine(unittest.TestCase):
+
+    initial_prices = np.array([100.0, 120.0, 95.0, 180.0])
+    actual_prices = np.array([110.0, 100.0, 96.0, 260.0])
+    expected_returns = np.array([0.09, 0.02, -0.05, 0.12])
+    his_vols = np.array([0.18, 0.25, 0.1, 0.3])
+    time_grid = calc_time_grid(calc_num_steps(3))
+
+    def run_backtest(self, **kwargs) -> pd.DataFrame:
+        return run_walk_forward(
+            self.initial_prices, self.actual_prices, self.expected_returns, self.his_vols, self.time_grid,
+            n_simulations=2000, **kwargs)
+
+    def test_calc_walk_forward_origins(self):
+        origins = calc_walk_forward_origins(n_prices=100, horizon_steps=20, origin_step=15, min_history=31)
+
+        np.testing.assert_array_equal(origins, [35, 50, 65, 80])
+
+    def test_calc_walk_forward_origins_value_error(self):
+        with self.assertRaises(ValueError):
+            calc_walk_forward_origins(n_prices=100, horizon_steps=20, origin_step=0, min_history=31)
+
+    def test_run_walk_forward_layout(self):
+        origins = pd.date_range('2020-01-31', periods=4, freq='ME', name='origin')
+        table = self.run_backtest(rng=SimulationRNG(2), origins=origins)
+
+        self.assertTrue(table.index.equals(origins))
+        self.assertEqual(
+            table.columns.tolist(),
+            ['initial_price', 'expected_returns', 'his_vol', 'actual_price',
+             'expected_price', *BAND_PERCENTILES, 'prob_loss', 'pit', 'crps'])
+
+    def test_run_walk_forward_matches_terminal_prices(self):
+        table = self.run_backtest(rng=SimulationRNG(2), n_threads=3)
+
+        # The shared draws sampled for one origin at a time
+        random_normal = SimulationRNG(2).standard_normal(0, 2000, 1)[:, 0]
+        for i, row in enumerate(table.itertuples()):
+            drift = self.expected_returns[i] - 0.5 * self.his_vols[i]**2
+            prices = calc_terminal_prices(self.initial_prices[i], drift, self.his_vols[i], 1.0, random_normal)
+            expected = calc_terminal_stats(prices, self.initial_prices[i])
+
+            self.assertAlmostEqual(row.expected_price, expected['expected_price'])
+            for q in BAND_PERCENTILES:
+                self.assertAlmostEqual(table[q].iloc[i], expected['percentiles'][q])
+            self.assertAlmostEqual(row.prob_loss, expected['prob_loss'])
+            self.assertAlmostEqual(row.pit, np.mean(prices <= self.actual_prices[i]))
+            self.assertAlmostEqual(row.crps, calc_crps(prices, self.actual_prices[i]))
+
+    def test_run_walk_forward_shared_draws(self):
+        sorted_brownian = np.sort(draw_terminal_brownian(self.time_grid, 2000, SobolRNG(6)))
+
+        pd.testing.assert_frame_equal(
+            self.run_backtest(sorted_brownian=sorted_brownian), self.run_backtest(rng=SobolRNG(6)))
+
+    def test_run_walk_forward_threads_match(self):
+        expected = self.run_backtest(rng=SimulationRNG(5), n_threads=1)
+
+        for n_threads in (2, 4, 8):
+            pd.testing.assert_frame_equal(self.run_backtest(rng=SimulationRNG(5), n_threads=n_threads), expected)
+
+    def test_run_walk_forward_analytic_close_to_simulated(self):
+        analytic = self.run_backtest(analytic=True)
+        simulated = run_walk_forward(
+            self.initial_prices, self.actual_prices, self.expected_returns, self.his_vols, self.time_grid,
+            n_simulations=100000, rng=SimulationRNG(3))
+
+        for column in ('expected_price', *BAND_PERCENTILES, 'prob_loss', 'pit', 'crps'):
+            np.testing.assert_allclose(analytic[column], simulated[column], rtol=0.02, atol=0.01)
+
+    def test_run_walk_forward_horizon_time(self):
+        quarter = self.run_backtest(rng=SimulationRNG(4), horizon_time=0.25)
+        analytic = self.run_backtest(analytic=True, horizon_time=0.25)
+
+        # A quarter-year horizon drifts and spreads a quarter as far in variance as a year
+        np.testing.assert_allclose(
+            analytic['expected_price'], self.initial_prices * np.exp(self.expected_returns * 0.25))
+        for column in ('expected_price', *BAND_PERCENTILES, 'prob_loss', 'pit'):
+            np.testing.assert_allclose(quarter[column], analytic[column], rtol=0.03, atol=0.03)
+
+        year = self.run_backtest(rng=SimulationRNG(4))
+        widths = quarter[BAND_PERCENTILES[-1]] - quarter[BAND_PERCENTILES[0]]
+        self.assertTrue((widths < year[BAND_PERCENTILES[-1]] - year[BAND_PERCENTILES[0]]).all())
+
+    def test_run_walk_forward_pit_missing_inputs(self):
+        table = run_walk_forward(
+            self.initial_prices, self.actual_prices, self.expected_returns, np.array([0.18, np.nan, 0.1, 0.3]),
+            self.time_grid, n_simulations=100, rng=SimulationRNG(1))
+
+        self.assertTrue(np.isnan(table['pit'].iloc[1]))
+        self.assertFalse(table['pit'].drop(table.index[1]).isna().any())
+
+if __name__ == '__main__':
+    unittest.main()
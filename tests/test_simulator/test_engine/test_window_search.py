@@ -0,0 +1,153 @@
+import json
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+
+from monte_carlo_simulator.const import WINDOW_SEARCH_METRICS
+from monte_carlo_simulator.service.calculator import calc_rolling_exp_returns, calc_rolling_volatility
+from monte_carlo_simulator.service.engine import *
+
+
+class TestRollingMoments(unittest.TestCase):
+
+    # Read in stored data for testing
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+    moments = RollingMoments(asset_data['Close'].iloc[:, 0])
+
+    def test_volatility_matches_rolling_volatility(self):
+        for standev_window in (2, 30, 252):
+            np.testing.assert_allclose(
+                self.moments.volatility(standev_window),
+                calc_rolling_volatility(self.asset_data, standev_window).to_numpy(), rtol=1e-9, atol=1e-10)
+
+    def test_expected_returns_match_rolling_exp_returns(self):
+        for exp_ret_flag in ('Simple Average Returns', 'Exponential Weighted Average Returns'):
+            for returns_window in (20, 150):
+                np.testing.assert_allclose(
+                    self.moments.expected_returns(exp_ret_flag, returns_window),
+                    calc_rolling_exp_returns(self.asset_data, exp_ret_flag, returns_window).to_numpy(),
+                    rtol=1e-9, atol=1e-15)
+
+    def test_window_longer_than_data(self):
+        self.assertTrue(np.isnan(self.moments.volatility(self.moments.n_prices)).all())
+
+    def test_window_errors(self):
+        with self.assertRaises(TypeError):
+            self.moments.volatility(30.0)
+        with self.assertRaises(ValueError):
+            self.moments.volatility(0)
+        with self.assertRaises(ValueError):
+            self.moments.expected_returns('Capital Asset Pricing Model', 150)
+
+
+class TestWindowSearch(unittest.TestCase):
+
+    rng = np.random.default_rng(6)
+    prices = 100 * np.exp(np.cumsum(rng.normal(0.0004, 0.015, 700)))
+    moments = RollingMoments(prices)
+    horizon_steps = calc_num_steps(3)
+    time_grid = calc_time_grid(horizon_steps)
+    origins = calc_walk_forward_origins(prices.size, horizon_steps, origin_step=21, min_history=121)
+
+    def run_search(self, **kwargs) -> WindowSearchResult:
+        options = {'rng': SimulationRNG(3), 'n_simulations': 500, 'n_threads': 2, **kwargs}
+        return run_window_search(
+            self.moments, 'Simple Average Returns', [10, 30, 60, 120], [20, 60, 120],
+            self.origins, self.horizon_steps, self.time_grid, **options)
+
+    def test_calc_window_candidates(self):
+        self.assertEqual(calc_window_candidates([10, 30], [20, 60]), [(10, 20), (10, 60), (30, 20), (30, 60)])
+
+        candidates = calc_window_candidates([10, 30], [20, 60], search='random', n_trials=3, seed=1)
+        self.assertEqual(len(set(candidates)), 3)
+        self.assertEqual(candidates, calc_window_candidates([10, 30], [20, 60], search='random', n_trials=3, seed=1))
+
+        with self.assertRaises(ValueError):
+            calc_window_candidates([10, 30], search='bayesian')
+
+    def test_trial_matches_walk_forward(self):
+        result = self.run_search()
+        trial = result.trials.set_index(['standev_window', 'returns_window']).loc[(30, 60)]
+
+        table = run_walk_forward(
+            self.prices[self.origins], self.prices[self.origins + self.horizon_steps - 1],
+            self.moments.expected_returns('Simple Average Returns', 60)[self.origins - 1],
+            self.moments.volatility(30)[self.origins - 1], self.time_grid, n_simulations=500, rng=SimulationRNG(3))
+        scores = score_walk_forward(table)
+
+        self.assertAlmostEqual(trial['score'], scores.mean_crps)
+        self.assertAlmostEqual(trial['crps'], scores.mean_crps)
+        self.assertAlmostEqual(trial['coverage_95.45'], scores.coverage_rates[95.45])
+
+    def test_best_windows(self):
+        result = self.run_search()
+
+        self.assertEqual(result.n_trials, 12)
+        self.assertFalse(result.stopped_early)
+        self.assertEqual(result.best_score, result.trials['score'].min())
+        best = result.trials.loc[result.trials['score'].idxmin()]
+        self.assertEqual(
+            result.best_windows,
+            {'standev_window': best['standev_window'], 'returns_window': best['returns_window']})
+
+    def test_threads_match(self):
+        pd.testing.assert_frame_equal(self.run_search(n_threads=1).trials, self.run_search(n_threads=4).trials)
+
+    def test_sobol_threads_match(self):
+        # Trials share draws taken before any thread runs, so Sobol' engines are never shared
+        expected = self.run_search(rng=SobolRNG(3), n_threads=1).trials
+
+        for n_threads in (4, 8):
+            pd.testing.assert_frame_equal(self.run_search(rng=SobolRNG(3), n_threads=n_threads).trials, expected)
+
+    def test_horizon_time(self):
+        quarter = self.run_search(horizon_time=0.25, analytic=True)
+        year = self.run_search(analytic=True)
+
+        self.assertFalse(np.allclose(quarter.trials['crps'], year.trials['crps']))
+
+    def test_metrics(self):
+        for metric in WINDOW_SEARCH_METRICS:
+            result = self.run_search(metric=metric, analytic=True)
+            self.assertTrue((result.trials['score'] >= 0).all())
+
+        with self.assertRaises(ValueError):
+            self.run_search(metric='rmse')
+
+    def test_patience_stops_early(self):
+        result = self.run_search(patience=1, n_threads=1)
+        scores = result.trials['score'].to_numpy()
+
+        # The search stops at the first trial that does not improve on the best score
+        self.assertTrue(result.stopped_early)
+        self.assertLess(result.n_trials, 12)
+        self.assertTrue((np.diff(scores[:-1]) < 0).all())
+        self.assertGreaterEqual(scores[-1], scores[:-1].min())
+
+    def test_expected_returns_without_returns_window(self):
+        result = self.run_search(expected_returns=np.full(self.origins.size, 0.08))
+
+        self.assertEqual(result.n_trials, 4)
+        self.assertIsNone(result.best_windows['returns_window'])
+
+    def test_save_and_load_best_windows(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'windows.json')
+
+        self.assertIsNone(load_best_windows(path, 'AAPL'))
+
+        result = self.run_search(analytic=True)
+        save_best_windows(path, 'AAPL', result)
+        save_best_windows(path, 'MSFT', result)
+
+        record = load_best_windows(path, 'AAPL', 'Simple Average Returns')
+        self.assertEqual(record, json.loads(json.dumps(result.to_dict())))
+        self.assertEqual(list(load_best_windows(path, 'MSFT')), ['Simple Average Returns'])
+        self.assertFalse(os.path.exists(f'{path}.tmp'))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+
+from monte_carlo_simulator.service.engine import SimulationWorkspace, SimulationRNG, calc_time_grid, \
+    calc_log_paths, calc_price_paths
+
+
+class TestSimulationWorkspace(unittest.TestCase):
+
+    def setUp(self):
+        self.workspace = SimulationWorkspace()
+
+    def test_buffer_reused_for_same_shape(self):
+        first = self.workspace.buffer('paths', (20, 5))
+        second = self.workspace.buffer('paths', (20, 5))
+
+        self.assertIs(first, second)
+        self.assertEqual(self.workspace.nbytes, 20 * 5 * 8)
+
+    def test_buffer_replaced_for_new_shape_or_type(self):
+        first = self.workspace.buffer('paths', (20, 5))
+        resized = self.workspace.buffer('paths', (30, 5))
+        retyped = self.workspace.buffer('paths', (30, 5), np.float32)
+
+        self.assertIsNot(first, resized)
+        self.assertEqual(retyped.dtype, np.float32)
+        self.assertEqual(self.workspace.nbytes, retyped.nbytes)
+
+    def test_release(self):
+        self.workspace.buffer('paths', (20, 5))
+        self.workspace.release()
+
+        self.assertEqual(self.workspace.nbytes, 0)
+
+    def test_paths_built_in_place(self):
+        time_grid = calc_time_grid(12)
+        rng = SimulationRNG(seed=3, block_size=7)
+        expected = calc_price_paths(100, calc_log_paths(0.05, 0.2, time_grid, rng.standard_normal(0, 25, 11)))
+
+        paths = self.workspace.buffer('paths', (25, 12))
+        random_normal = rng.standard_normal(0, 25, 11, out=paths[:, 1:])
+        prices = calc_price_paths(100, calc_log_paths(0.05, 0.2, time_grid, random_normal, out=paths), out=paths)
+
+        self.assertIs(prices, paths)
+        np.testing.assert_allclose(prices, expected, rtol=1e-12)
+
+
+if __name__ == '__main__':
+    unittest.main()
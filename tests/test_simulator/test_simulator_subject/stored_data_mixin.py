@@ -0,0 +1,38 @@
+import os
+from unittest.mock import Mock, patch
+import pandas as pd
+
+from monte_carlo_simulator.data_fetcher.market_data_fetcher import MarketDataFetcher
+from monte_carlo_simulator.model.market_index import MarketIndex
+from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
+from monte_carlo_simulator.model.stock import Stock
+from monte_carlo_simulator.service.simulator_subj import Simulator
+
+
+class StoredDataMixin:
+    """
+    Sets up a Simulator of a Stock whose data is read from the stored asset data
+    instead of fetched. Mixed into unittest.TestCase classes.
+    """
+
+    # Read in stored data for testing
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+    asset_data.index = pd.to_datetime(asset_data.index)
+
+    def setUp(self):
+        self.stock = Stock()
+        self.simulator = Simulator(
+            market_data_fetcher=Mock(spec=MarketDataFetcher),
+            financial_asset=self.stock,
+            market_index=Mock(spec=MarketIndex),
+            risk_free_sec=Mock(spec=RiskFreeSecurity)
+            )
+
+        patch.object(self.simulator, 'populate_data', side_effect=self.load_stored_data).start()
+        self.addCleanup(patch.stopall)
+
+    def load_stored_data(self, asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag):
+        """Stands in for Simulator.populate_data; use the stored asset data instead of fetching it"""
+        self.stock.asset_data = self.asset_data.copy()
+        self.stock.exp_ret_flag = exp_ret_flag
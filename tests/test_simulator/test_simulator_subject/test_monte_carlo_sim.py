@@ -1,7 +1,10 @@
 
 
+import gc
+import os
+import tempfile
 import unittest
-from unittest.mock import Mock
+from unittest.mock import Mock, patch
 import pandas as pd
 import numpy as np
 
@@ -12,6 +15,8 @@ from monte_carlo_simulator.model.market_index import MarketIndex
 from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
 from monte_carlo_simulator.model.stock import Stock
 from monte_carlo_simulator.service.simulator_subj import Simulator
+from monte_carlo_simulator.service.engine import BandSummary, PathStore, SimulationPlan, available_backends, get_backend, \
+    run_threaded_simulation
 
 
 class TestMonteCarloSimulator(unittest.TestCase):
@@ -235,5 +240,734 @@ class TestMonteCarloSimulator(unittest.TestCase):
         # converted to trading days: There are 252 trading days in each year. 
         self.assertEqual(result.size, 100*ANNUAL_TRADING_DAYS)
 
+    def test_monte_carlo_sim_first_step_is_initial_price(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100
+        )
+        # Every simulated path starts at the initial price
+        np.testing.assert_allclose(result[0], self.initial_price)
+
+    def test_monte_carlo_sim_chunked_matches_full_simulation(self):
+        # Chunks draw from the same random streams as the full simulation
+        full_result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=5000,
+            seed=42
+        )
+        chunked_result = self.simulator.monte_carlo_sim_chunked(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=5000,
+            chunk_size=700,
+            seed=42
+        )
+
+        np.testing.assert_allclose(chunked_result.mean, full_result.mean(axis=1))
+        for q, band in chunked_result.percentiles.items():
+            np.testing.assert_allclose(band, np.percentile(full_result, q, axis=1), rtol=0.02)
+
+    def test_monte_carlo_sim_chunked_zero_initial_price(self):
+        with np.errstate(all='raise'):
+            result = self.simulator.monte_carlo_sim_chunked(
+                initial_price=0,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=3,
+                n_simulations=500,
+                chunk_size=200,
+                seed=42
+            )
+
+        np.testing.assert_array_equal(result.mean, 0)
+        for band in result.percentiles.values():
+            np.testing.assert_array_equal(band, 0)
+
+    def test_monte_carlo_sim_chunked_chunk_size_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_chunked(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                n_simulations=100,
+                chunk_size=0
+            )
+    def test_monte_carlo_sim_parallel_returns_paths(self):
+        result = self.simulator.monte_carlo_sim_parallel(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            seed=0,
+            n_workers=2,
+            block_size=30,
+            return_paths=True
+        )
+        self.assertEqual(result.shape, (ANNUAL_TRADING_DAYS, 100))
+
+    def test_monte_carlo_sim_parallel_n_workers_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_parallel(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                n_simulations=100,
+                n_workers=0
+            )
+    def test_monte_carlo_sim_seed_reproducible(self):
+        results = [self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            seed=11
+        ) for _ in range(2)]
+
+        np.testing.assert_array_equal(results[0], results[1])
+
+    def test_monte_carlo_sim_stores_seed(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100
+        )
+        # Rerunning with the stored seed reproduces the unseeded run
+        rerun = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            seed=self.simulator.seed
+        )
+        np.testing.assert_array_equal(result, rerun)
+
+    def test_bit_generator_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.bit_generator = 'RANDU'
+
+    def test_monte_carlo_sim_philox_bit_generator(self):
+        self.simulator.bit_generator = 'Philox'
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            seed=11
+        )
+        self.assertEqual(result.shape, (ANNUAL_TRADING_DAYS, 100))
+    def test_monte_carlo_sim_terminal_only_shape(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            terminal_only=True
+        )
+        self.assertEqual(result.shape, (100,))
+
+    def test_monte_carlo_sim_terminal_only_matches_full_simulation(self):
+        full_result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=20000,
+            seed=5
+        )
+        terminal_result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=20000,
+            seed=5,
+            terminal_only=True
+        )
+        # Both sample the same log-normal distribution of terminal prices
+        self.assertAlmostEqual(terminal_result.mean() / full_result[-1].mean(), 1, delta=0.01)
+        self.assertAlmostEqual(
+            np.log(terminal_result).std() / np.log(full_result[-1]).std(), 1, delta=0.03)
+    def test_analytic_bands_shape(self):
+        result = self.simulator.analytic_bands(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12
+        )
+        self.assertEqual(result.num_steps, ANNUAL_TRADING_DAYS)
+
+    def test_analytic_bands_his_vol_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.analytic_bands(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=-1,
+                time_horizon=12
+            )
+    def test_monte_carlo_sim_antithetic_shape(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=101,
+            antithetic=True
+        )
+        self.assertEqual(result.shape, (ANNUAL_TRADING_DAYS, 101))
+
+    def test_monte_carlo_sim_antithetic_pairs_mirror_log_returns(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            antithetic=True
+        )
+        # Paired paths deviate from the drift by equal and opposite amounts
+        log_returns = np.log(result / self.initial_price)
+        drift_path = (log_returns[:, 0::2] + log_returns[:, 1::2]) / 2
+        np.testing.assert_allclose(drift_path - drift_path[:, [0]], 0, atol=1e-12)
+
+    def test_monte_carlo_sim_antithetic_terminal_mean(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=10000,
+            seed=2,
+            terminal_only=True,
+            antithetic=True
+        )
+        expected_mean = self.initial_price * np.exp(self.capm_returns)
+        self.assertAlmostEqual(result.mean() / expected_mean, 1, delta=0.01)
+
+    def test_monte_carlo_sim_sobol_shape(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=128,
+            seed=1,
+            sampler='sobol'
+        )
+        self.assertEqual(result.shape, (ANNUAL_TRADING_DAYS, 128))
+        self.assertTrue(np.all(result[0] == self.initial_price))
+
+    def test_monte_carlo_sim_sobol_reproducible(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=64,
+            seed=4,
+            sampler='sobol'
+        )
+        np.testing.assert_array_equal(
+            self.simulator.monte_carlo_sim(**kwargs), self.simulator.monte_carlo_sim(**kwargs))
+
+    def test_monte_carlo_sim_chunked_sobol_matches_full(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=256,
+            seed=4,
+            sampler='sobol'
+        )
+        full = BandSummary.from_paths(self.simulator.monte_carlo_sim(**kwargs))
+        chunked = self.simulator.monte_carlo_sim_chunked(chunk_size=100, **kwargs)
+        np.testing.assert_allclose(chunked.mean, full.mean)
+
+    def test_monte_carlo_sim_sampler_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                n_simulations=10,
+                sampler='halton'
+            )
+
+    def test_monte_carlo_sim_variance_reduction_report(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=200,
+            seed=3,
+            variance_reduction='both'
+        )
+        self.assertEqual(result.shape, (ANNUAL_TRADING_DAYS, 200))
+        self.assertEqual(self.simulator.variance_report.method, 'both')
+        self.assertLessEqual(
+            self.simulator.variance_report.mean_error_after, 
+            self.simulator.variance_report.mean_error_before
+        )
+
+    def test_monte_carlo_sim_variance_reduction_terminal_only(self):
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=500,
+            seed=3,
+            terminal_only=True,
+            variance_reduction='moment_matching'
+        )
+        expected_mean = self.initial_price * np.exp(self.capm_returns)
+        self.assertEqual(result.shape, (500,))
+        self.assertAlmostEqual(result.mean() / expected_mean, 1, delta=0.005)
+
+    def test_monte_carlo_sim_no_variance_reduction_clears_report(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=1,
+            n_simulations=10
+        )
+        self.simulator.monte_carlo_sim(variance_reduction='control_variate', **kwargs)
+        self.simulator.monte_carlo_sim(**kwargs)
+        self.assertIsNone(self.simulator.variance_report)
+
+    def test_monte_carlo_sim_variance_reduction_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                n_simulations=10,
+                variance_reduction='stratified'
+            )
+
+    def test_monte_carlo_sim_adaptive_report(self):
+        result = self.simulator.monte_carlo_sim_adaptive(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            tolerance=0.01,
+            max_simulations=20000,
+            batch_size=1000,
+            seed=5
+        )
+        report = self.simulator.convergence_report
+        self.assertEqual(result.num_steps, ANNUAL_TRADING_DAYS)
+        self.assertEqual(result.n_paths, report.n_paths)
+        self.assertTrue(report.converged)
+        self.assertLessEqual(report.max_error, 0.01)
+
+    def test_monte_carlo_sim_adaptive_tolerance_type_error(self):
+        with self.assertRaises(TypeError):
+            self.simulator.monte_carlo_sim_adaptive(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                tolerance='0.01'
+            )
+
+    def test_monte_carlo_sim_adaptive_tolerance_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_adaptive(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                tolerance=0
+            )
+
+    def test_monte_carlo_sim_adaptive_batch_size_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_adaptive(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                batch_size=-5
+            )
+
+    def test_monte_carlo_sim_adaptive_correlated_paths_value_error(self):
+        for options in ({'antithetic': True}, {'sampler': 'sobol'}):
+            self.simulator.error_message = None
+            with self.assertRaises(ValueError):
+                self.simulator.monte_carlo_sim_adaptive(
+                    initial_price=self.initial_price,
+                    expected_returns=self.capm_returns,
+                    his_vol=self.his_vol,
+                    time_horizon=12,
+                    tolerance=0.01,
+                    **options
+                )
+            self.assertIsNotNone(self.simulator.error_message)
+
+    def test_monte_carlo_sim_kernel_backends_match(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=50,
+            seed=6
+        )
+        expected = self.simulator.monte_carlo_sim(**kwargs)
+        for backend in available_backends():
+            self.simulator.kernel_backend = backend
+            np.testing.assert_allclose(self.simulator.monte_carlo_sim(**kwargs), expected, rtol=1e-12)
+
+    def test_monte_carlo_sim_workspace_matches(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=50,
+            seed=6
+        )
+        expected = self.simulator.monte_carlo_sim(**kwargs)
+        for antithetic in (False, True):
+            for backend in available_backends():
+                self.simulator.kernel_backend = backend
+                result = self.simulator.monte_carlo_sim(workspace=self.simulator.workspace, antithetic=antithetic, **kwargs)
+                np.testing.assert_allclose(result, self.simulator.monte_carlo_sim(antithetic=antithetic, **kwargs), rtol=1e-12)
+        np.testing.assert_allclose(self.simulator.monte_carlo_sim(workspace=self.simulator.workspace, **kwargs), expected, rtol=1e-12)
+
+    def test_monte_carlo_sim_workspace_reused(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=50
+        )
+        first = self.simulator.monte_carlo_sim(workspace=self.simulator.workspace, **kwargs)
+        second = self.simulator.monte_carlo_sim(workspace=self.simulator.workspace, **kwargs)
+
+        self.assertTrue(np.shares_memory(first, second))
+        self.assertEqual(self.simulator.workspace.nbytes, second.nbytes)
+
+    def test_monte_carlo_sim_records_plan(self):
+        self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=50
+        )
+
+        self.assertIsInstance(self.simulator.simulation_plan, SimulationPlan)
+        self.assertEqual(self.simulator.simulation_plan.strategy, 'full')
+        self.assertEqual(self.simulator.simulation_plan.estimated_bytes, 2 * 50 * 63 * 8)
+
+    def test_monte_carlo_sim_terminal_only_plan(self):
+        self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=50,
+            terminal_only=True
+        )
+
+        self.assertEqual(self.simulator.simulation_plan.strategy, 'terminal')
+
+    def test_monte_carlo_sim_out_of_core_over_budget(self):
+        kwargs = dict(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=3,
+            n_simulations=500,
+            seed=8
+        )
+        expected = self.simulator.monte_carlo_sim(**kwargs)
+
+        self.simulator.memory_budget = 100000
+        result = self.simulator.monte_carlo_sim(**kwargs)
+
+        self.assertEqual(self.simulator.simulation_plan.strategy, 'out_of_core')
+        self.assertIsInstance(result.base, np.memmap)
+        np.testing.assert_allclose(result, expected, rtol=1e-12)
+
+    def test_monte_carlo_sim_out_of_core_removes_temporary_files(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.simulator.memory_budget = 10000
+
+        # Temporary files are created in the test's directory
+        with patch('tempfile.tempdir', directory.name):
+            for seed in range(3):
+                result = self.simulator.monte_carlo_sim(
+                    initial_price=self.initial_price,
+                    expected_returns=self.capm_returns,
+                    his_vol=self.his_vol,
+                    time_horizon=3,
+                    n_simulations=500,
+                    seed=seed
+                )
+                self.assertEqual(len(os.listdir(directory.name)), 1)
+                del result
+                gc.collect()
+
+        self.assertEqual(os.listdir(directory.name), [])
+
+    def test_monte_carlo_sim_out_of_core_variance_reduction_memory_error(self):
+        self.simulator.memory_budget = 100000
+        with self.assertRaises(MemoryError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=3,
+                n_simulations=500,
+                variance_reduction='both'
+            )
+
+    def test_plan_simulation_chunks_bands_over_budget(self):
+        self.simulator.memory_budget = 100000
+        plan = self.simulator.plan_simulation(n_simulations=500, time_horizon=3)
+
+        self.assertIs(plan, self.simulator.simulation_plan)
+        self.assertEqual(plan.strategy, 'chunked')
+
+    def test_memory_budget_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.memory_budget = -1
+
+    def test_monte_carlo_sim_step_granularity_shape(self):
+        self.simulator.step_granularity = 'weekly'
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=12,
+            n_simulations=100,
+            seed=2
+            )
+
+        self.assertEqual(result.shape, (51, 100))
+
+    def test_monte_carlo_sim_step_granularity_terminal_distribution(self):
+        # Coarse steps sample the same terminal distribution as daily steps
+        terminal_prices = {}
+        for step_granularity in ('daily', 'monthly'):
+            self.simulator.step_granularity = step_granularity
+            terminal_prices[step_granularity] = self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price,
+                expected_returns=self.capm_returns,
+                his_vol=self.his_vol,
+                time_horizon=12,
+                n_simulations=20000,
+                seed=4
+                )[-1]
+
+        expected_mean = self.initial_price * np.exp(self.capm_returns)
+        for prices in terminal_prices.values():
+            self.assertAlmostEqual(prices.mean() / expected_mean, 1, delta=0.01)
+        for q in (2.275, 50, 97.725):
+            self.assertAlmostEqual(
+                np.percentile(terminal_prices['monthly'], q) / np.percentile(terminal_prices['daily'], q), 1, delta=0.02)
+
+    def test_monte_carlo_sim_chunked_step_granularity(self):
+        self.simulator.step_granularity = 'monthly'
+        result = self.simulator.monte_carlo_sim_chunked(
+            initial_price=self.initial_price,
+            expected_returns=self.capm_returns,
+            his_vol=self.his_vol,
+            time_horizon=24,
+            n_simulations=500,
+            chunk_size=200,
+            seed=2
+            )
+
+        self.assertEqual(result.num_steps, 25)
+
+    def test_monte_carlo_sim_brownian_cache_matches_uncached(self):
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, seed=6)
+        expected = self.simulator.monte_carlo_sim(**inputs)
+
+        # The first run draws and caches the Brownian Motion, the second rescales it
+        for _ in range(2):
+            result = self.simulator.monte_carlo_sim(brownian_cache=self.simulator.brownian_cache, **inputs)
+            np.testing.assert_array_equal(result, expected)
+
+        self.assertEqual(self.simulator.brownian_cache.misses, 1)
+        self.assertEqual(self.simulator.brownian_cache.hits, 1)
+        self.assertEqual(self.simulator.seed, 6)
+
+    def test_monte_carlo_sim_brownian_cache_common_random_numbers(self):
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, 
+            time_horizon=12, n_simulations=500, seed=6, brownian_cache=self.simulator.brownian_cache)
+        low_vol = self.simulator.monte_carlo_sim(his_vol=0.1, **inputs)
+        high_vol = self.simulator.monte_carlo_sim(his_vol=0.3, **inputs)
+        time_grid = np.linspace(0, 1, 252)[:, np.newaxis]
+
+        # Both runs rescale the same Brownian Motion
+        brownian_low = (np.log(low_vol / self.initial_price) - (self.capm_returns - 0.5 * 0.1**2) * time_grid) / 0.1
+        brownian_high = (np.log(high_vol / self.initial_price) - (self.capm_returns - 0.5 * 0.3**2) * time_grid) / 0.3
+        np.testing.assert_allclose(brownian_low, brownian_high, atol=1e-9)
+        self.assertEqual(self.simulator.brownian_cache.hits, 1)
+
+    def test_monte_carlo_sim_brownian_cache_keyed_by_draws(self):
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, brownian_cache=self.simulator.brownian_cache)
+        self.simulator.monte_carlo_sim(seed=6, **inputs)
+        self.simulator.monte_carlo_sim(seed=7, **inputs)
+        self.simulator.monte_carlo_sim(seed=6, antithetic=True, **inputs)
+        self.simulator.monte_carlo_sim(seed=6, dtype=np.float32, **inputs)
+
+        self.assertEqual(self.simulator.brownian_cache.hits, 0)
+        self.assertEqual(len(self.simulator.brownian_cache), 4)
+
+    def test_monte_carlo_sim_brownian_cache_unseeded(self):
+        self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, brownian_cache=self.simulator.brownian_cache)
+
+        self.assertEqual(len(self.simulator.brownian_cache), 0)
+
+    def test_monte_carlo_sim_brownian_cache_within_memory_budget(self):
+        # Room for one 500 x 252 matrix in half the budget, but not two
+        self.simulator.memory_budget = 3100000
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, brownian_cache=self.simulator.brownian_cache)
+        self.simulator.monte_carlo_sim(seed=6, **inputs)
+        self.simulator.monte_carlo_sim(seed=7, **inputs)
+
+        self.assertEqual(self.simulator.brownian_cache.max_bytes, 1550000)
+        self.assertEqual(len(self.simulator.brownian_cache), 1)
+        self.assertLessEqual(self.simulator.brownian_cache.nbytes, self.simulator.brownian_cache.max_bytes)
+
+    def test_monte_carlo_sim_brownian_cache_beside_full_run(self):
+        # A full run of one 500 x 252 matrix holds two, so a cached third does not fit
+        self.simulator.memory_budget = 3000000
+        self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, seed=6, brownian_cache=self.simulator.brownian_cache)
+
+        self.assertEqual(len(self.simulator.brownian_cache), 0)
+
+    def test_monte_carlo_sim_brownian_cache_miss_uses_threads_and_backend(self):
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, seed=6, brownian_cache=self.simulator.brownian_cache)
+
+        with patch('monte_carlo_simulator.service.simulator_subj.run_threaded_simulation', 
+                wraps=run_threaded_simulation) as threaded:
+            self.simulator.monte_carlo_sim(n_threads=2, **inputs)
+        threaded.assert_called_once()
+
+        backend = Mock(wraps=get_backend('numpy'))
+        with patch('monte_carlo_simulator.service.simulator_subj.get_backend', return_value=backend):
+            expected = self.simulator.monte_carlo_sim(**inputs)
+        backend.price_paths.assert_called_once()
+
+        # The unthreaded miss cached its draws, which the next run rescales
+        np.testing.assert_allclose(self.simulator.monte_carlo_sim(**inputs), expected, rtol=1e-12)
+        self.assertEqual(self.simulator.brownian_cache.hits, 1)
+
+    def test_monte_carlo_sim_threaded_matches_single_thread(self):
+        inputs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=2500, seed=6)
+        expected = self.simulator.monte_carlo_sim(**inputs)
+
+        for n_threads in (0, 1, 3):
+            np.testing.assert_array_equal(self.simulator.monte_carlo_sim(n_threads=n_threads, **inputs), expected)
+
+    def test_monte_carlo_sim_threaded_in_workspace(self):
+        workspace = self.simulator.workspace
+        result = self.simulator.monte_carlo_sim(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=12, n_simulations=500, seed=6, workspace=workspace, n_threads=2)
+
+        self.assertTrue(np.shares_memory(result, workspace.buffer('paths', (500, 252))))
+
+    def test_monte_carlo_sim_path_file_matches_in_memory(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        kwargs = dict(
+            initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+            time_horizon=3, n_simulations=500, seed=8)
+        expected = self.simulator.monte_carlo_sim(**kwargs)
+
+        self.simulator.memory_budget = 100000
+        store = self.simulator.monte_carlo_sim(path_file=os.path.join(directory.name, 'paths.npy'), **kwargs)
+        self.addCleanup(store.close)
+
+        self.assertIsInstance(store, PathStore)
+        np.testing.assert_allclose(store.paths.transpose(), expected, rtol=1e-12)
+        np.testing.assert_allclose(store.mean(), expected.mean(axis=1))
+
+    def test_monte_carlo_sim_path_file_variance_reduction_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+                time_horizon=3, path_file='paths.npy', variance_reduction='both')
+
+    def test_monte_carlo_sim_n_threads_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+                time_horizon=12, n_threads=-1)
+
+    def test_monte_carlo_sim_n_threads_full_paths_value_error(self):
+        routes = ({'terminal_only': True}, {'variance_reduction': 'both'}, {'path_file': 'paths.npy'})
+        for route in routes:
+            with self.assertRaises(ValueError, msg=route):
+                self.simulator.monte_carlo_sim(
+                    initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+                    time_horizon=12, n_threads=2, **route)
+
+            self.assertIn('"n_threads"', self.simulator.error_message)
+
+    def test_monte_carlo_sim_n_threads_over_budget_memory_error(self):
+        self.simulator.memory_budget = 10000
+        with self.assertRaises(MemoryError):
+            self.simulator.monte_carlo_sim(
+                initial_price=self.initial_price, expected_returns=self.capm_returns, his_vol=self.his_vol, 
+                time_horizon=12, n_simulations=500, n_threads=2)
+
+    def test_step_granularity_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.step_granularity = 'hourly'
+
+        self.assertEqual(self.simulator.step_granularity, 'daily')
+
+    def test_kernel_backend_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.kernel_backend = 'cupy'
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
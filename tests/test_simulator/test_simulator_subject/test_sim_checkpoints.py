@@ -0,0 +1,83 @@
+import os
+import unittest
+from unittest.mock import Mock
+import pandas as pd
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.data_fetcher.market_data_fetcher import MarketDataFetcher
+from monte_carlo_simulator.model.market_index import MarketIndex
+from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
+from monte_carlo_simulator.model.stock import Stock
+from monte_carlo_simulator.service.calculator import average_returns, calc_volatility
+from monte_carlo_simulator.service.engine import BandSummary
+from monte_carlo_simulator.service.simulator_subj import Simulator
+
+
+class TestSimulationCheckpoints(unittest.TestCase):
+
+    # Read in stored data for testing
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+
+    def setUp(self):
+        # Create a new "blank" simulator_subject for each test
+        self.simulator = Simulator(
+            market_data_fetcher=Mock(spec=MarketDataFetcher),
+            financial_asset=Mock(spec=Stock),
+            market_index=Mock(spec=MarketIndex),
+            risk_free_sec=Mock(spec=RiskFreeSecurity)
+            )
+
+        # Simulation inputs calculated from the stored asset data
+        self.sim_inputs = dict(
+            initial_price=self.asset_data['Close'].iloc[-1, -1],
+            expected_returns=average_returns(self.asset_data),
+            his_vol=calc_volatility(self.asset_data),
+            time_horizon=12,
+            n_simulations=1000,
+            seed=5
+            )
+
+    def test_monte_carlo_sim_checkpoints_table(self):
+        table, summary = self.simulator.monte_carlo_sim_checkpoints(checkpoints=[1, 6, 12], **self.sim_inputs)
+
+        self.assertEqual(table.index.tolist(), [1, 6, 12])
+        self.assertEqual(table.index.name, 'horizon_months')
+        self.assertEqual(table['step'].tolist(), [20, 125, 251])
+        self.assertIsInstance(summary, BandSummary)
+
+    def test_monte_carlo_sim_checkpoints_matches_monte_carlo_sim(self):
+        table, _ = self.simulator.monte_carlo_sim_checkpoints(checkpoints=[3, 12], chunk_size=300, **self.sim_inputs)
+        paths = self.simulator.monte_carlo_sim(**self.sim_inputs)
+
+        for horizon, row in table.iterrows():
+            prices = paths[int(row['step'])]
+            self.assertAlmostEqual(row['mean'], prices.mean())
+            for q in BAND_PERCENTILES:
+                self.assertAlmostEqual(row[q], np.percentile(prices, q))
+
+    def test_monte_carlo_sim_checkpoints_plot_points(self):
+        _, summary = self.simulator.monte_carlo_sim_checkpoints(checkpoints=[1, 12], plot_points=30, **self.sim_inputs)
+
+        self.assertLessEqual(summary.num_steps, 31)
+        self.assertIn(20, summary.steps)
+        self.assertEqual(summary.steps[-1], 251)
+
+    def test_monte_carlo_sim_checkpoints_type_error(self):
+        with self.assertRaises(TypeError):
+            self.simulator.monte_carlo_sim_checkpoints(checkpoints=6, **self.sim_inputs)
+
+        with self.assertRaises(TypeError):
+            self.simulator.monte_carlo_sim_checkpoints(checkpoints=[1.5], **self.sim_inputs)
+
+    def test_monte_carlo_sim_checkpoints_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_checkpoints(checkpoints=[6, 24], **self.sim_inputs)
+
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim_checkpoints(checkpoints=[6], plot_points=1, **self.sim_inputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
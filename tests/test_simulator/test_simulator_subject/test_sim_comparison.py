@@ -0,0 +1,128 @@
+import unittest
+from unittest.mock import Mock, patch
+import pandas as pd
+import numpy as np
+from matplotlib.figure import Figure
+
+from monte_carlo_simulator.service.calculator import calc_exp_returns
+
+from stored_data_mixin import StoredDataMixin
+
+
+class TestReturnMethodComparison(StoredDataMixin, unittest.TestCase):
+
+    # Expected returns of each method, over the whole period and the training data
+    method_returns = {'Simple Average Returns': (0.08, 0.05), 'Exponential Weighted Average Returns': (0.11, 0.04)}
+
+    def setUp(self):
+        super().setUp()
+
+        def calc_exp_returns(financial_asset, end_index=-1, **kwargs):
+            return self.method_returns[financial_asset.exp_ret_flag][end_index != -1]
+
+        self.calc_exp_returns = patch(
+            'monte_carlo_simulator.service.simulator_subj.calc_exp_returns', side_effect=calc_exp_returns).start()
+
+    def load_stored_data(self, asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag):
+        super().load_stored_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag)
+
+        # The asset pays no dividends, so none are fetched
+        if exp_ret_flag == 'Dividend Discount Model':
+            self.stock.his_div = None
+
+    def compare(self, **kwargs) -> pd.DataFrame:
+        return self.simulator.compare_return_methods('AAPL', '5y', time_horizon=3, n_simulations=500, **kwargs)
+
+    def test_compare_return_methods_rows(self):
+        table = self.compare(exp_ret_flags=list(self.method_returns), seed=2)
+
+        self.assertEqual(table.index.tolist(), list(self.method_returns))
+        self.assertEqual(table['expected_returns'].tolist(), [0.08, 0.11])
+        self.assertEqual(table['backtest_returns'].tolist(), [0.05, 0.04])
+        self.assertEqual(self.calc_exp_returns.call_count, 4)
+        self.assertIsInstance(self.simulator.comparison_figure, Figure)
+
+    def test_compare_return_methods_shares_draws(self):
+        table = self.compare(exp_ret_flags=list(self.method_returns), seed=2)
+
+        # Methods differ only through their drift, so prices scale with e^(returns)
+        ratio = table['expected_price'].iloc[1] / table['expected_price'].iloc[0]
+        self.assertAlmostEqual(ratio, np.exp(0.11 - 0.08))
+        self.assertEqual(len(self.simulator.brownian_cache), 1)
+
+    def test_compare_return_methods_over_budget_not_cached(self):
+        self.simulator.memory_budget = 100000
+        self.compare(exp_ret_flags=list(self.method_returns), seed=2)
+
+        self.assertEqual(len(self.simulator.brownian_cache), 0)
+
+    def test_compare_return_methods_reproducible(self):
+        table = self.compare(exp_ret_flags=list(self.method_returns))
+
+        pd.testing.assert_frame_equal(self.compare(exp_ret_flags=list(self.method_returns), seed=self.simulator.seed), table)
+
+    def test_compare_return_methods_skips_inapplicable(self):
+        table = self.compare(
+            exp_ret_flags=['Dividend Discount Model', 'Capital Asset Pricing Model', 'Simple Average Returns'], seed=2)
+
+        # Every method has a row, and those left out say why
+        self.assertEqual(
+            table.index.tolist(), ['Dividend Discount Model', 'Capital Asset Pricing Model', 'Simple Average Returns'])
+        self.assertIn('dividend', table.loc['Dividend Discount Model', 'skipped'])
+        self.assertIn('"market_symbol"', table.loc['Capital Asset Pricing Model', 'skipped'])
+        self.assertIsNone(table.loc['Simple Average Returns', 'skipped'])
+        self.assertTrue(np.isnan(table.loc['Dividend Discount Model', 'expected_price']))
+        self.assertEqual(table.loc['Simple Average Returns', 'expected_returns'], 0.08)
+
+    def test_compare_return_methods_dividend_discount_model(self):
+        # Quarterly dividends over the whole period, with the real returns calculation
+        dates = pd.date_range(self.asset_data.index[0], self.asset_data.index[-1], freq='QE')
+        dividends = pd.Series(np.linspace(0.2, 0.26, dates.size), index=dates)
+
+        def populate_data(asset_symbol, market_symbol, rfr_symbol, period, exp_ret_flag):
+            self.stock.asset_data = self.asset_data
+            self.stock.exp_ret_flag = exp_ret_flag
+            self.stock.his_div = dividends
+
+        self.simulator.populate_data.side_effect = populate_data
+        self.calc_exp_returns.side_effect = calc_exp_returns
+
+        table = self.compare(exp_ret_flags=['Dividend Discount Model'], seed=2)
+
+        self.assertIsNone(table.loc['Dividend Discount Model', 'skipped'])
+        self.assertGreater(table.loc['Dividend Discount Model', 'expected_returns'], 0)
+
+    def test_compare_return_methods_raises_other_errors(self):
+        self.simulator.populate_data.side_effect = ConnectionError('Network unreachable')
+
+        with self.assertRaises(ConnectionError):
+            self.compare(exp_ret_flags=['Dividend Discount Model', 'Simple Average Returns'])
+
+    def test_compare_return_methods_restores_exp_ret_flag(self):
+        self.stock.exp_ret_flag = 'Exponential Weighted Average Returns'
+        self.compare(exp_ret_flags=['Simple Average Returns', 'Dividend Discount Model'], seed=2)
+
+        self.assertEqual(self.stock.exp_ret_flag, 'Exponential Weighted Average Returns')
+
+    def test_compare_return_methods_notifies_observers(self):
+        observer = Mock()
+        self.simulator.attach(observer)
+        self.compare(exp_ret_flags=list(self.method_returns), seed=2)
+
+        # Observers see the comparison_figure of the run
+        observer.update.assert_called_once_with(self.simulator)
+
+        with self.assertRaises(ValueError):
+            self.compare(exp_ret_flags=['Momentum'])
+        self.assertEqual(observer.update.call_count, 2)
+
+    def test_compare_return_methods_none_applicable_value_error(self):
+        with self.assertRaises(ValueError):
+            self.compare(exp_ret_flags=['Dividend Discount Model'])
+
+    def test_compare_return_methods_method_value_error(self):
+        with self.assertRaises(ValueError):
+            self.compare(exp_ret_flags=['Momentum'])
+
+if __name__ == '__main__':
+    unittest.main()
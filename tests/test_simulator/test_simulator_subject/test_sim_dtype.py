@@ -0,0 +1,93 @@
+import os
+import unittest
+from unittest.mock import Mock
+import pandas as pd
+import numpy as np
+
+from monte_carlo_simulator.const import FLOAT32_RTOL, BAND_PERCENTILES
+from monte_carlo_simulator.data_fetcher.market_data_fetcher import MarketDataFetcher
+from monte_carlo_simulator.model.market_index import MarketIndex
+from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
+from monte_carlo_simulator.model.stock import Stock
+from monte_carlo_simulator.service.calculator import average_returns, calc_volatility, calc_terminal_stats
+from monte_carlo_simulator.service.engine import BandSummary
+from monte_carlo_simulator.service.simulator_subj import Simulator
+
+
+class TestSimulationDtype(unittest.TestCase):
+
+    # Read in stored data for testing
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+
+    def setUp(self):
+        # Create a new "blank" simulator_subject for each test
+        self.simulator = Simulator(
+            market_data_fetcher=Mock(spec=MarketDataFetcher),
+            financial_asset=Mock(spec=Stock),
+            market_index=Mock(spec=MarketIndex),
+            risk_free_sec=Mock(spec=RiskFreeSecurity)
+            )
+
+        # Simulation inputs calculated from the stored asset data
+        self.sim_inputs = dict(
+            initial_price=self.asset_data['Close'].iloc[-1, -1],
+            expected_returns=average_returns(self.asset_data),
+            his_vol=calc_volatility(self.asset_data),
+            time_horizon=12,
+            n_simulations=2000,
+            seed=11
+            )
+
+    def test_monte_carlo_sim_float32_output(self):
+        result = self.simulator.monte_carlo_sim(dtype=np.float32, **self.sim_inputs)
+        expected = self.simulator.monte_carlo_sim(**self.sim_inputs)
+
+        self.assertEqual(result.dtype, np.float32)
+        self.assertEqual(result.nbytes * 2, expected.nbytes)
+
+    def test_monte_carlo_sim_float32_bands_within_tolerance(self):
+        result = BandSummary.from_paths(self.simulator.monte_carlo_sim(dtype='float32', **self.sim_inputs))
+        expected = BandSummary.from_paths(self.simulator.monte_carlo_sim(dtype='float64', **self.sim_inputs))
+
+        self.assertEqual(result.mean.dtype, np.float64)
+        np.testing.assert_allclose(result.mean, expected.mean, rtol=FLOAT32_RTOL)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(result.percentiles[q], expected.percentiles[q], rtol=FLOAT32_RTOL)
+
+    def test_monte_carlo_sim_float32_terminal_stats_within_tolerance(self):
+        initial_price = self.sim_inputs['initial_price']
+        result = calc_terminal_stats(self.simulator.monte_carlo_sim(dtype=np.float32, **self.sim_inputs), initial_price)
+        expected = calc_terminal_stats(self.simulator.monte_carlo_sim(**self.sim_inputs), initial_price)
+
+        self.assertAlmostEqual(result['expected_price'] / expected['expected_price'], 1, delta=FLOAT32_RTOL)
+        for q in BAND_PERCENTILES:
+            self.assertAlmostEqual(result['percentiles'][q] / expected['percentiles'][q], 1, delta=FLOAT32_RTOL)
+        self.assertAlmostEqual(result['prob_loss'], expected['prob_loss'], delta=1 / self.sim_inputs['n_simulations'])
+
+    def test_monte_carlo_sim_float32_terminal_only(self):
+        result = self.simulator.monte_carlo_sim(dtype=np.float32, terminal_only=True, **self.sim_inputs)
+        expected = self.simulator.monte_carlo_sim(terminal_only=True, **self.sim_inputs)
+
+        self.assertEqual(result.dtype, np.float32)
+        np.testing.assert_allclose(result, expected, rtol=FLOAT32_RTOL)
+
+    def test_monte_carlo_sim_chunked_float32_within_tolerance(self):
+        result = self.simulator.monte_carlo_sim_chunked(chunk_size=300, dtype=np.float32, **self.sim_inputs)
+        expected = self.simulator.monte_carlo_sim_chunked(chunk_size=300, **self.sim_inputs)
+
+        np.testing.assert_allclose(result.mean, expected.mean, rtol=FLOAT32_RTOL)
+        for q in BAND_PERCENTILES:
+            np.testing.assert_allclose(result.percentiles[q], expected.percentiles[q], rtol=FLOAT32_RTOL)
+
+    def test_monte_carlo_sim_dtype_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(dtype=np.int32, **self.sim_inputs)
+
+    def test_monte_carlo_sim_dtype_not_a_type_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.monte_carlo_sim(dtype=32, **self.sim_inputs)
+
+
+if __name__ == '__main__':
+    unittest.main()
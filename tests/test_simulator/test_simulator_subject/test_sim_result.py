@@ -0,0 +1,107 @@
+import os
+import unittest
+from unittest.mock import Mock, patch
+import pandas as pd
+import numpy as np
+
+from monte_carlo_simulator.data_fetcher.market_data_fetcher import MarketDataFetcher
+from monte_carlo_simulator.model.market_index import MarketIndex
+from monte_carlo_simulator.model.risk_free_security import RiskFreeSecurity
+from monte_carlo_simulator.model.stock import Stock
+from monte_carlo_simulator.service.engine import SimulationResult, calc_data_fingerprint
+from monte_carlo_simulator.service.simulator_subj import Simulator
+
+
+class TestSimulationResultRun(unittest.TestCase):
+
+    # Read in stored data for testing
+    asset_data = pd.read_csv(
+        os.path.join('tests', 'test_simulator', 'testing_data', 'asset_data.csv'), header=[0, 1], index_col=[0])
+
+    def setUp(self):
+        self.stock = Stock()
+        self.simulator = Simulator(
+            market_data_fetcher=Mock(spec=MarketDataFetcher),
+            financial_asset=self.stock,
+            market_index=Mock(spec=MarketIndex),
+            risk_free_sec=Mock(spec=RiskFreeSecurity)
+            )
+
+        # Use the stored asset data instead of fetching it
+        patcher = patch.object(
+            self.simulator, 'populate_data', side_effect=lambda *args: setattr(self.stock, 'asset_data', self.asset_data))
+        patcher.start()
+        patch('monte_carlo_simulator.service.simulator_subj.calc_exp_returns', return_value=0.08).start()
+        self.addCleanup(patch.stopall)
+
+    def run_simulation(self, **kwargs):
+        self.simulator.run_simulation('AAPL', '1y', 'Simple Average Returns', time_horizon=3, seed=5, **kwargs)
+
+    def test_run_simulation_keeps_paths(self):
+        self.run_simulation(n_simulations=200)
+        result = self.simulator.simulation_result
+
+        self.assertIsNone(self.simulator.error_message)
+        self.assertIsInstance(result, SimulationResult)
+        self.assertTrue(result.has_paths)
+        self.assertEqual(result.paths.shape, (63, 200))
+        self.assertEqual(result.seed, 5)
+        self.assertEqual(result.parameters['n_simulations'], 200)
+        self.assertEqual(result.data_fingerprint, calc_data_fingerprint(self.asset_data))
+
+    def test_run_simulation_chunked_keeps_summary(self):
+        self.run_simulation(n_simulations=200, chunk_size=50)
+        result = self.simulator.simulation_result
+
+        self.assertFalse(result.has_paths)
+        self.assertEqual(result.n_paths, 200)
+
+    def test_run_simulation_variance_reduction_needs_every_path(self):
+        routes = (
+            {'chunk_size': 50}, {'n_workers': 2}, {'tolerance': 0.5}, {'checkpoints': [1, 3]},
+            {'path_file': 'paths.npy'}, {'analytic': True}
+            )
+        for route in routes:
+            self.simulator.error_message = None
+            self.run_simulation(n_simulations=200, variance_reduction='both', **route)
+
+            self.assertIn('"variance_reduction"', self.simulator.error_message, msg=route)
+        self.assertFalse(os.path.exists('paths.npy'))
+
+        # Paths that do not fit in the memory budget are streamed, so cannot be corrected
+        self.simulator.error_message = None
+        self.simulator.memory_budget = 10000
+        self.run_simulation(n_simulations=200, variance_reduction='both')
+        self.assertIn('"variance_reduction"', self.simulator.error_message)
+
+    def test_run_simulation_n_threads_needs_every_path(self):
+        routes = (
+            {'chunk_size': 50}, {'n_workers': 2}, {'tolerance': 0.5}, {'checkpoints': [1, 3]},
+            {'path_file': 'paths.npy'}, {'analytic': True}, {'variance_reduction': 'both'}
+            )
+        for route in routes:
+            self.simulator.error_message = None
+            self.run_simulation(n_simulations=200, n_threads=2, **route)
+
+            self.assertIn('"n_threads"', self.simulator.error_message, msg=route)
+        self.assertFalse(os.path.exists('paths.npy'))
+
+        # Paths that do not fit in the memory budget are built in chunks, not on threads
+        self.simulator.error_message = None
+        self.simulator.memory_budget = 10000
+        self.run_simulation(n_simulations=200, n_threads=2)
+        self.assertIn('"n_threads"', self.simulator.error_message)
+
+    def test_next_run_releases_previous_paths(self):
+        self.run_simulation(n_simulations=200)
+        first = self.simulator.simulation_result
+        expected_price = first.terminal_stats['expected_price']
+        self.run_simulation(n_simulations=200)
+
+        self.assertFalse(first.has_paths)
+        self.assertEqual(first.terminal_stats['expected_price'], expected_price)
+        np.testing.assert_array_equal(first.band_summary.mean, self.simulator.simulation_result.band_summary.mean)
+
+
+if __name__ == '__main__':
+    unittest.main()
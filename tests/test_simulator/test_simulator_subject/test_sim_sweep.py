@@ -0,0 +1,84 @@
+import unittest
+from unittest.mock import Mock, patch
+import pandas as pd
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import calc_volatility, calc_terminal_stats
+
+from stored_data_mixin import StoredDataMixin
+
+
+class TestParameterSweep(StoredDataMixin, unittest.TestCase):
+
+    # Expected returns of each method, used instead of calculating them
+    method_returns = {'Simple Average Returns': 0.08, 'Exponential Weighted Average Returns': 0.11}
+
+    def setUp(self):
+        super().setUp()
+        self.calc_exp_returns = patch(
+            'monte_carlo_simulator.service.simulator_subj.calc_exp_returns',
+            side_effect=lambda financial_asset, **kwargs: self.method_returns[financial_asset.exp_ret_flag]).start()
+
+    def run_sweep(self, **kwargs) -> pd.DataFrame:
+        return self.simulator.run_parameter_sweep(
+            'AAPL', '5y', list(self.method_returns), [20, 30, 60], n_simulations=500, seed=3, **kwargs)
+
+    def test_run_parameter_sweep_rows(self):
+        table = self.run_sweep(time_horizons=[3, 12])
+
+        self.assertEqual(len(table), 2 * 3 * 2)
+        self.assertEqual(self.calc_exp_returns.call_count, 2)
+
+    def test_run_parameter_sweep_inputs(self):
+        table = self.run_sweep()
+
+        for _, row in table.iterrows():
+            self.assertEqual(row['expected_returns'], self.method_returns[row['exp_ret_flag']])
+            self.assertAlmostEqual(row['his_vol'], calc_volatility(self.asset_data.copy(), int(row['standev_window'])))
+
+    def test_run_parameter_sweep_matches_monte_carlo_sim(self):
+        row = self.run_sweep().iloc[-1]
+        initial_price = self.asset_data['Close'].iloc[-1, -1]
+        prices = self.simulator.monte_carlo_sim(
+            initial_price, row['expected_returns'], row['his_vol'], 12, n_simulations=500, seed=3, terminal_only=True)
+        expected = calc_terminal_stats(prices, initial_price)
+
+        self.assertAlmostEqual(row['expected_price'], expected['expected_price'])
+        for q in BAND_PERCENTILES:
+            self.assertAlmostEqual(row[q], expected['percentiles'][q])
+        self.assertAlmostEqual(row['prob_loss'], expected['prob_loss'])
+
+    def test_run_parameter_sweep_records_seed(self):
+        self.run_sweep()
+
+        self.assertEqual(self.simulator.seed, 3)
+
+    def test_run_parameter_sweep_notifies_observers(self):
+        observer = Mock()
+        self.simulator.attach(observer)
+        self.run_sweep()
+
+        observer.update.assert_called_once_with(self.simulator)
+
+        # Observers also see the error message of a failed run
+        with self.assertRaises(ValueError):
+            self.simulator.run_parameter_sweep('AAPL', '5y', ['Gut Feeling'], [30])
+        self.assertEqual(observer.update.call_count, 2)
+
+    def test_run_parameter_sweep_method_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.run_parameter_sweep('AAPL', '5y', ['Gut Feeling'], [30])
+
+        self.assertIsNotNone(self.simulator.error_message)
+
+    def test_run_parameter_sweep_empty_type_error(self):
+        with self.assertRaises(TypeError):
+            self.simulator.run_parameter_sweep('AAPL', '5y', list(self.method_returns), [])
+
+    def test_run_parameter_sweep_time_horizon_value_error(self):
+        with self.assertRaises(ValueError):
+            self.run_sweep(time_horizons=[0])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from unittest.mock import Mock
+import pandas as pd
+import numpy as np
+
+from monte_carlo_simulator.const import BAND_PERCENTILES
+from monte_carlo_simulator.service.calculator import average_returns, calc_volatility
+from monte_carlo_simulator.service.engine import calc_num_steps
+
+from stored_data_mixin import StoredDataMixin
+
+
+class TestWalkForward(StoredDataMixin, unittest.TestCase):
+
+    def run_walk_forward(self, exp_ret_flag: str = 'Simple Average Returns', **kwargs) -> pd.DataFrame:
+        return self.simulator.run_walk_forward('AAPL', '5y', exp_ret_flag, time_horizon=3, n_simulations=500, seed=4, **kwargs)
+
+    def test_run_walk_forward_origins(self):
+        table = self.run_walk_forward(origin_step=21)
+        horizon_steps = calc_num_steps(3)
+
+        # Monthly origins, ending with the origin of run_backtest's split
+        self.assertEqual(table.index[-1], self.asset_data.index[-horizon_steps])
+        positions = self.asset_data.index.get_indexer(table.index)
+        self.assertTrue((np.diff(positions) == 21).all())
+        self.assertEqual(table.index.name, 'origin')
+
+    def test_run_walk_forward_inputs_match_run_backtest(self):
+        table = self.run_walk_forward(origin_step=63)
+        close = self.asset_data['Close'].iloc[:, 0]
+
+        # Each origin's inputs come from the data before it, as in run_backtest
+        for origin, row in table.iloc[-3:].iterrows():
+            position = self.asset_data.index.get_loc(origin)
+            train = self.asset_data.iloc[:position].copy()
+
+            self.assertEqual(row['initial_price'], close.iloc[position])
+            self.assertEqual(row['actual_price'], close.iloc[position + calc_num_steps(3) - 1])
+            self.assertAlmostEqual(row['his_vol'], calc_volatility(train, 30))
+            self.assertAlmostEqual(row['expected_returns'], average_returns(train))
+
+    def test_run_walk_forward_pit_in_unit_interval(self):
+        table = self.run_walk_forward(exp_ret_flag='Exponential Weighted Average Returns')
+
+        self.assertTrue(table['pit'].between(0, 1).all())
+
+    def test_run_walk_forward_forecast_scores(self):
+        table = self.run_walk_forward()
+        scores = self.simulator.forecast_scores
+
+        self.assertEqual(scores.n_forecasts, len(table))
+        np.testing.assert_array_equal(scores.crps, table['crps'])
+        self.assertEqual(sorted(scores.coverage_rates), [68.2675, 95.45])
+
+    def test_run_walk_forward_analytic(self):
+        table = self.run_walk_forward(analytic=True)
+
+        self.assertTrue(table['prob_loss'].between(0, 1).all())
+        self.assertFalse(table.isna().any().any())
+
+    def test_run_walk_forward_horizon_length(self):
+        month = self.simulator.run_walk_forward('AAPL', '5y', 'Simple Average Returns', time_horizon=1, analytic=True)
+        year = self.simulator.run_walk_forward('AAPL', '5y', 'Simple Average Returns', time_horizon=12, analytic=True)
+
+        # Forecasts spread with the length of the horizon the actual prices are read at
+        month_width = (month[BAND_PERCENTILES[-1]] - month[BAND_PERCENTILES[0]]) / month['initial_price']
+        year_width = (year[BAND_PERCENTILES[-1]] - year[BAND_PERCENTILES[0]]) / year['initial_price']
+        self.assertLess(month_width.mean(), year_width.mean() / 2)
+
+    def test_run_walk_forward_notifies_observers(self):
+        observer = Mock()
+        self.simulator.attach(observer)
+        self.run_walk_forward()
+
+        # Observers see the scores of the run
+        observer.update.assert_called_once_with(self.simulator)
+
+        with self.assertRaises(ValueError):
+            self.run_walk_forward(origin_step=0)
+        self.assertEqual(observer.update.call_count, 2)
+
+    def test_run_walk_forward_origin_step_value_error(self):
+        with self.assertRaises(ValueError):
+            self.run_walk_forward(origin_step=0)
+
+        self.assertIsNotNone(self.simulator.error_message)
+
+    def test_run_walk_forward_short_period_value_error(self):
+        with self.assertRaises(ValueError):
+            self.simulator.run_walk_forward('AAPL', '5y', 'Simple Average Returns', time_horizon=1200)
+
+if __name__ == '__main__':
+    unittest.main()
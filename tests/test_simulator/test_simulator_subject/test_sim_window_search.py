@@ -0,0 +1,79 @@
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+import pandas as pd
+
+from monte_carlo_simulator.service.engine import WindowSearchResult, load_best_windows
+
+from stored_data_mixin import StoredDataMixin
+
+
+class TestWindowSearch(StoredDataMixin, unittest.TestCase):
+
+    def search_windows(self, exp_ret_flag: str = 'Simple Average Returns', **kwargs) -> WindowSearchResult:
+        return self.simulator.search_windows(
+            'AAPL', '5y', exp_ret_flag, standev_windows=[20, 60], time_horizon=3, n_simulations=300, seed=4, **kwargs)
+
+    def test_search_windows_grid(self):
+        result = self.search_windows(returns_windows=[50, 150])
+
+        self.assertEqual(result.n_trials, 4)
+        self.assertIn(result.best_windows['standev_window'], (20, 60))
+        self.assertIn(result.best_windows['returns_window'], (50, 150))
+
+    def test_search_windows_reproducible(self):
+        expected = self.search_windows(search='random', n_trials=3, returns_windows=[50, 100, 150]).trials
+
+        pd.testing.assert_frame_equal(
+            self.search_windows(search='random', n_trials=3, returns_windows=[50, 100, 150], n_threads=1).trials,
+            expected)
+
+    def test_search_windows_results_path(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        path = os.path.join(directory.name, 'windows.json')
+
+        result = self.search_windows(exp_ret_flag='Exponential Weighted Average Returns', analytic=True, results_path=path)
+
+        record = load_best_windows(path, 'AAPL', 'Exponential Weighted Average Returns')
+        self.assertEqual(record['standev_window'], result.best_windows['standev_window'])
+        self.assertEqual(record['score'], result.best_score)
+
+    def test_search_windows_without_returns_window(self):
+        with patch('monte_carlo_simulator.service.simulator_subj.calc_exp_returns', return_value=0.08):
+            result = self.search_windows(exp_ret_flag='Capital Asset Pricing Model', analytic=True)
+
+        self.assertEqual(result.n_trials, 2)
+        self.assertTrue(result.trials['returns_window'].isna().all())
+        self.assertIsNone(result.best_windows['returns_window'])
+
+    def test_search_windows_notifies_observers(self):
+        observer = Mock()
+        self.simulator.attach(observer)
+        self.search_windows()
+
+        observer.update.assert_called_once_with(self.simulator)
+
+        # Observers also see the error message of a failed search
+        with self.assertRaises(ValueError):
+            self.search_windows(metric='rmse')
+        self.assertEqual(observer.update.call_count, 2)
+
+    def test_search_windows_value_errors(self):
+        with self.assertRaises(ValueError):
+            self.search_windows(metric='rmse')
+        self.assertIsNotNone(self.simulator.error_message)
+
+        with self.assertRaises(ValueError):
+            self.search_windows(returns_windows=[1])
+
+        with self.assertRaises(ValueError):
+            self.simulator.search_windows('AAPL', '5y', 'Simple Average Returns', standev_windows=[20], time_horizon=1200)
+
+    def test_search_windows_type_error(self):
+        with self.assertRaises(TypeError):
+            self.simulator.search_windows('AAPL', '5y', 'Simple Average Returns', standev_windows=30)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import numpy as np
 import pandas as pd
 
 import monte_carlo_simulator.service.util.data_visualizer as vis
+from monte_carlo_simulator.service.engine import calc_analytic_bands, calc_num_steps, calc_time_grid
 
 class TestMonteCarloSimVisualization(unittest.TestCase):
 
@@ -103,6 +104,69 @@ class TestMonteCarloSimVisualization(unittest.TestCase):
 		self.assertGreater(self.axs1_ylim[1], self.axs1_ylim[0])
 
 
+class TestStepGranularityVisualization(unittest.TestCase):
+
+	# Exact bands of a 12 month horizon in weekly steps
+	band_summary = calc_analytic_bands(182.96, 0.09, 0.1842, calc_time_grid(calc_num_steps(12, 'weekly')))
+
+	def test_x_label_weekly(self):
+		fig = vis.monte_carlo_sim_vis(self.band_summary, 12, 'weekly')
+		self.assertEqual(fig.axes[0].get_xlabel(), 'Trading Weeks')
+
+	def test_x_label_custom(self):
+		fig = vis.monte_carlo_sim_vis(self.band_summary, 12, 10)
+		self.assertEqual(fig.axes[0].get_xlabel(), 'Time Steps (10 Trading Days)')
+
+	def test_x_lim_weekly(self):
+		fig = vis.monte_carlo_sim_vis(self.band_summary, 12, 'weekly')
+		x_lim = fig.axes[0].get_xlim()
+		self.assertLess(x_lim[0], 0)
+		self.assertGreater(x_lim[1], 50)
+		self.assertLess(x_lim[1], 51)
+
+	def test_invalid_step_granularity(self):
+		with self.assertRaises(ValueError):
+			vis.monte_carlo_sim_vis(self.band_summary, 12, 'hourly')
+
+	def test_backtest_vis_coarse_paths(self):
+		test_data = pd.DataFrame(
+			{'AAPL': np.linspace(100, 110, 252)}, index=pd.bdate_range('2023-01-02', periods=252))
+		train_sim = np.full((13, 20), 105.0)
+		fig = vis.backtest_vis(train_sim, test_data)
+
+		x_data = fig.axes[0].get_lines()[0].get_xdata()
+		self.assertEqual(len(x_data), 13)
+		self.assertEqual(x_data[0], test_data.index[0])
+		self.assertEqual(x_data[-1], test_data.index[-1])
+
+
+class TestMethodComparisonVisualization(unittest.TestCase):
+
+	test_data = pd.DataFrame(
+		{'AAPL': np.linspace(100, 110, 63)}, index=pd.bdate_range('2023-01-02', periods=63))
+	time_grid = calc_time_grid(63)
+	backtest_summaries = {
+		'Simple Average Returns': calc_analytic_bands(100, 0.09, 0.18, time_grid),
+		'Capital Asset Pricing Model': calc_analytic_bands(100, 0.12, 0.18, time_grid)
+		}
+
+	def test_legend_labels(self):
+		fig = vis.method_comparison_vis(self.backtest_summaries, self.test_data)
+		labels = [text.get_text() for text in fig.axes[0].get_legend().get_texts()]
+		self.assertEqual(labels, ['Simple Average Returns', 'Capital Asset Pricing Model', 'Actual Prices'])
+
+	def test_coarse_steps_mapped_to_dates(self):
+		summaries = {'Simple Average Returns': calc_analytic_bands(100, 0.09, 0.18, calc_time_grid(13))}
+		fig = vis.method_comparison_vis(summaries, self.test_data)
+		x_data = fig.axes[0].get_lines()[0].get_xdata()
+		self.assertEqual(len(x_data), 13)
+		self.assertEqual(x_data[-1], self.test_data.index[-1])
+
+	def test_test_data_type_error(self):
+		with self.assertRaises(TypeError):
+			vis.method_comparison_vis(self.backtest_summaries, self.test_data['AAPL'])
+
+
 class TestTrainTestVisualization(unittest.TestCase):
 
     # Gather sample data for testing